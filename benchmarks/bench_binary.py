@@ -0,0 +1,57 @@
+"""Throughput benchmark for the bytes conversion path.
+
+Compares decoding every line and calling the str converter with the
+bytes-native convert_bytes on an ASCII identifier dump.
+
+Usage:
+    python benchmarks/bench_binary.py [--count N]
+"""
+import argparse
+import random
+import time
+
+import case_conversion
+
+WORDS = ["user", "order", "HTTP", "id", "name", "created", "at", "URL", "v2"]
+
+
+def make_dump(count: int, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    lines = []
+    for n in range(count):
+        words = rng.sample(WORDS, rng.randint(2, 4)) + [str(n)]
+        lines.append(words[0] + "".join(w.capitalize() for w in words[1:]))
+    return "\n".join(lines).encode()
+
+
+def decode_lines(data: bytes) -> bytes:
+    # Bypass the parse cache so every line is converted, as in a dump of
+    # distinct identifiers.
+    case_conversion.clear_cache()
+    return "\n".join(
+        case_conversion.snake(line) for line in data.decode().split("\n")
+    ).encode()
+
+
+def convert_bytes(data: bytes) -> bytearray:
+    return case_conversion.convert_bytes(data, case_conversion.snake)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    data = make_dump(args.count)
+    for label, func in (
+        ("decode + snake", decode_lines),
+        ("convert_bytes", convert_bytes),
+    ):
+        start = time.perf_counter()
+        func(data)
+        elapsed = time.perf_counter() - start
+        print(f"{label:>16}: {len(data) / elapsed / 2**20:8.2f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Memory and speed benchmark for columnar batch parsing.
+
+Compares a list of parse_case tuples with parse_columns on the same
+identifiers: retained memory, pickled size, and rendering all of them
+in a style against converting each identifier.
+
+Usage:
+    python benchmarks/bench_columnar.py [--count N]
+"""
+import argparse
+import pickle
+import random
+import time
+import tracemalloc
+
+import case_conversion
+from case_conversion.columnar import parse_columns, render_columns
+from case_conversion.parser import _parse_case
+from case_conversion.segmenter import fast_segment_string
+
+WORDS = ["user", "order", "HTTP", "id", "name", "created", "at", "URL", "v2"]
+STYLES = [case_conversion.camel, case_conversion.snake, case_conversion.const]
+
+
+def make_identifiers(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    identifiers = []
+    for _ in range(count):
+        words = rng.sample(WORDS, rng.randint(2, 4))
+        identifiers.append(rng.choice(STYLES)(" ".join(words)) + str(rng.random()))
+    return identifiers
+
+
+def measure(label: str, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    pickled = len(pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+    print(
+        f"{label:<18} {elapsed:7.2f} s  {retained / 2**20:8.1f} MiB retained"
+        f"  {pickled / 2**20:8.1f} MiB pickled"
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    identifiers = make_identifiers(args.count)
+    measure(
+        "parse_case tuples",
+        lambda: [_parse_case(i, [], False, fast_segment_string) for i in identifiers],
+    )
+    columns = measure("parse_columns", lambda: parse_columns(identifiers, []))
+
+    for converter in (case_conversion.snake, case_conversion.camel):
+        start = time.perf_counter()
+        case_conversion.clear_cache()
+        for identifier in identifiers:
+            converter(identifier, [])
+        per_string = time.perf_counter() - start
+        start = time.perf_counter()
+        render_columns(columns, converter)
+        rendered = time.perf_counter() - start
+        print(
+            f"{converter.__name__:<18} {per_string:7.2f} s per string"
+            f"  {rendered:7.2f} s rendered from columns"
+        )
+
+
+if __name__ == "__main__":
+    main()
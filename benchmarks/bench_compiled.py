@@ -0,0 +1,92 @@
+"""Compare the mypyc-compiled hot path with the pure Python modules.
+
+Build the extensions first with `CASE_CONVERSION_MYPYC=1 python build.py`.
+Each variant runs in its own interpreter, the pure one with
+CASE_CONVERSION_PURE_PYTHON=1.
+
+Usage:
+    python benchmarks/bench_compiled.py [--count N] [--repeat N]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORKLOAD = """
+import json, random, sys, time
+import case_conversion
+from case_conversion.parser import _parse_case
+from case_conversion.utils import segment_string
+
+count, repeat = int(sys.argv[1]), int(sys.argv[2])
+rng = random.Random(0)
+alphabet = "abcdefghXYZHTTP_-0123"
+strings = [
+    "".join(rng.choice(alphabet) for _ in range(rng.randint(4, 24)))
+    for _ in range(count)
+]
+acronyms = ["HTTP", "XYZ"]
+
+
+def best(func):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) / count * 1e6
+
+
+json.dump(
+    {
+        "compiled": case_conversion.COMPILED,
+        "segment_string": best(lambda: [segment_string(s) for s in strings]),
+        "_parse_case": best(
+            lambda: [_parse_case(s, acronyms, False) for s in strings]
+        ),
+        "snake (uncached)": best(
+            lambda: [
+                case_conversion.clear_cache() or case_conversion.snake(s, acronyms)
+                for s in strings
+            ]
+        ),
+    },
+    sys.stdout,
+)
+"""
+
+
+def run(pure: bool, count: int, repeat: int) -> dict:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    if pure:
+        env["CASE_CONVERSION_PURE_PYTHON"] = "1"
+    output = subprocess.check_output(
+        [sys.executable, "-c", WORKLOAD, str(count), str(repeat)], env=env
+    )
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pure = run(True, args.count, args.repeat)
+    default = run(False, args.count, args.repeat)
+    if not default.pop("compiled"):
+        print("extensions not built, comparing pure Python with itself")
+    pure.pop("compiled")
+    print(f"{'us/string':<20} {'pure':>8} {'compiled':>9} {'speedup':>8}")
+    for name, pure_time in pure.items():
+        print(
+            f"{name:<20} {pure_time:8.2f} {default[name]:9.2f} "
+            f"{pure_time / default[name]:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Throughput benchmark for the corpus case-profile analyzer.
+
+Compares a per-string parse_case loop with profile_files on a sharded
+identifier dump.
+
+Usage:
+    python benchmarks/bench_corpus.py [--count N] [--shards N] [--processes N]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+
+import case_conversion
+
+WORDS = ["user", "order", "HTTP", "id", "name", "created", "at", "URL", "v2"]
+STYLES = [case_conversion.camel, case_conversion.snake, case_conversion.const]
+
+
+def make_identifiers(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    identifiers = []
+    for _ in range(count):
+        words = rng.sample(WORDS, rng.randint(2, 4))
+        identifiers.append(rng.choice(STYLES)(" ".join(words)))
+    return identifiers
+
+
+def parse_loop(paths: list) -> Counter:
+    case_conversion.clear_cache()
+    cases: Counter = Counter()
+    for path in paths:
+        with open(path) as f:
+            for line in f:
+                cases[case_conversion.parse_case(line.rstrip("\n"))[1]] += 1
+    return cases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--shards", type=int, default=8)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    identifiers = make_identifiers(args.count)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        per_shard = -(-args.count // args.shards)
+        for n in range(args.shards):
+            path = os.path.join(tmp, f"shard{n}.txt")
+            with open(path, "w") as f:
+                f.write("\n".join(identifiers[n * per_shard : (n + 1) * per_shard]))
+            paths.append(path)
+
+        for label, func in (
+            ("parse_case loop", parse_loop),
+            (
+                "profile_files",
+                lambda p: case_conversion.profile_files(
+                    p, processes=args.processes
+                ).cases,
+            ),
+        ):
+            start = time.perf_counter()
+            cases = func(paths)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<20} {elapsed:8.2f} s  {args.count / elapsed:12,.0f} ids/s")
+        print(dict(cases))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Latency benchmark for HTTP header canonicalization.
+
+Compares the http_header fast path and canonical_header against the
+uncached parse_case pipeline on a stream of typical incoming header
+names.
+
+Usage:
+    python benchmarks/bench_headers.py [--number N]
+"""
+import argparse
+import timeit
+
+import case_conversion
+from case_conversion.headers import STANDARD_HEADERS
+from case_conversion.parser import _parse_case
+
+NAMES = [name.lower() for name in STANDARD_HEADERS[::7]] + ["x-custom-tenant-id"]
+
+
+def reference(text: str) -> str:
+    words, *_ = _parse_case(text, None, False)
+    return "-".join([w.capitalize() for w in words])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    candidates = {
+        "parse_case pipeline": reference,
+        "http_header": case_conversion.http_header,
+        "canonical_header": case_conversion.canonical_header,
+    }
+    for label, func in candidates.items():
+        seconds = timeit.timeit(
+            lambda: [func(name) for name in NAMES], number=args.number
+        )
+        per_call = seconds / (args.number * len(NAMES)) * 1e9
+        print(f"{label:>20}: {per_call:8.0f} ns/header")
+
+
+if __name__ == "__main__":
+    main()
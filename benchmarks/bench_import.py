@@ -0,0 +1,77 @@
+"""Startup benchmark with an import-time budget.
+
+Imports the package in fresh interpreter processes, reading the
+cumulative import time of `case_conversion` from `-X importtime` and
+timing the whole cold process against an empty one. Bytecode is cached
+in a temporary directory and warmed up first, as for an installed
+package. Exits with status 1 if the median import time exceeds the
+budget, so it can gate CI.
+
+The default budget is about the import time of the package before the
+speed work (under 19 ms on the reference machine, which has to hold
+for the lazy imports to stay lazy). Pass a scaled budget elsewhere.
+
+Usage:
+    python benchmarks/bench_import.py [--runs N] [--budget-ms MS]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict
+
+ENV: Dict[str, str] = {}
+
+
+def import_time_us() -> int:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import case_conversion"],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+        env=ENV,
+    )
+    for line in result.stderr.splitlines():
+        # import time: <self us> | <cumulative us> | <module>
+        _, cumulative, name = line.split("|")
+        if name.strip() == "case_conversion":
+            return int(cumulative)
+    raise RuntimeError("case_conversion missing from -X importtime output")
+
+
+def process_time_s(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True, env=ENV)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_import_") as cache:
+        ENV.update(os.environ, PYTHONPYCACHEPREFIX=cache)
+        ENV.pop("PYTHONDONTWRITEBYTECODE", None)
+        process_time_s("import case_conversion")
+
+        imports = [import_time_us() / 1000 for _ in range(args.runs)]
+        baseline = [process_time_s("pass") for _ in range(args.runs)]
+        cold = [process_time_s("import case_conversion") for _ in range(args.runs)]
+
+    median_import = statistics.median(imports)
+    overhead = (statistics.median(cold) - statistics.median(baseline)) * 1000
+    print(f"import time (median of {args.runs}): {median_import:8.2f} ms")
+    print(f"cold process overhead:           {overhead:8.2f} ms")
+    print(f"budget:                          {args.budget_ms:8.2f} ms")
+    if median_import > args.budget_ms:
+        print("FAIL: import time exceeds budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark for prefix-sharing batch parsing on sorted schema dumps.
+
+Compares parsing every identifier from scratch with parse_many, which
+reuses the work for the prefix shared with the previous identifier. The
+dump consists of flattened nested schemas, e.g.
+"order_customer_billing_address_postal_code", in snake and camel case.
+
+Usage:
+    python benchmarks/bench_incremental.py [--entities N] [--repeat N]
+"""
+import argparse
+import random
+import time
+
+import case_conversion
+from case_conversion.parser import _parse_case
+from case_conversion.segmenter import fast_segment_string
+
+ENTITIES = ["user", "order", "invoice", "payment", "shipment", "customer"]
+OBJECTS = [
+    "billing_address",
+    "shipping_address",
+    "profile",
+    "settings",
+    "line_items",
+    "metadata",
+    "audit_log",
+]
+FIELDS = [
+    "id",
+    "name",
+    "street_name",
+    "postal_code",
+    "created_at",
+    "updated_at",
+    "http_status",
+    "url",
+    "total_amount",
+    "currency_code",
+    "external_ref_id",
+    "is_enabled",
+]
+ACRONYMS = ["HTTP", "URL", "ID"]
+
+
+def make_schema(entities: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    identifiers = []
+    for _ in range(entities):
+        entity = "_".join(rng.sample(ENTITIES, 2))
+        style = rng.choice((case_conversion.snake, case_conversion.camel))
+        for obj in rng.sample(OBJECTS, 4):
+            for field in rng.sample(FIELDS, 8):
+                identifiers.append(style(f"{entity}_{obj}_{field}"))
+    return sorted(identifiers)
+
+
+def per_string(identifiers: list, acronyms: list) -> list:
+    return [_parse_case(s, acronyms, False, fast_segment_string) for s in identifiers]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+
+    identifiers = make_schema(args.entities)
+    for acronyms in ([], ACRONYMS):
+        timings: dict = {"per string": [], "parse_many": []}
+        # Interleaved runs, the best of each is reported.
+        for _ in range(args.repeat):
+            for label, func in (
+                ("per string", per_string),
+                ("parse_many", case_conversion.parse_many),
+            ):
+                start = time.perf_counter()
+                func(identifiers, acronyms)
+                timings[label].append(time.perf_counter() - start)
+        print(f"acronyms: {acronyms}")
+        for label, times in timings.items():
+            best = min(times)
+            print(
+                f"  {label:<12} {best * 1e3:8.1f} ms  "
+                f"{best / len(identifiers) * 1e6:6.2f} us/identifier"
+            )
+
+
+if __name__ == "__main__":
+    main()
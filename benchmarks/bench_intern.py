@@ -0,0 +1,57 @@
+"""Memory benchmark for interned batch conversion.
+
+Converts a large batch of low-cardinality keys, drawn from a Zipf-like
+distribution over a realistic schema vocabulary, with and without
+interning and reports the memory retained by the results.
+
+Usage:
+    python benchmarks/bench_intern.py [--count N] [--vocabulary N]
+"""
+import argparse
+import random
+import tracemalloc
+
+import case_conversion
+
+PREFIXES = ["user", "order", "account", "item", "session", "payment", "address"]
+SUFFIXES = ["id", "name", "created_at", "updated_at", "status", "type", "total"]
+
+
+def make_keys(count: int, vocabulary: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    words = [
+        f"{p}_{s}_{n}" if n else f"{p}_{s}"
+        for n in range(vocabulary // (len(PREFIXES) * len(SUFFIXES)) + 1)
+        for p in PREFIXES
+        for s in SUFFIXES
+    ][:vocabulary]
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    return rng.choices(words, weights, k=count)
+
+
+def measure(keys: list, intern: bool) -> int:
+    tracemalloc.start()
+    results = case_conversion.convert_many(keys, case_conversion.camel, intern=intern)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--vocabulary", type=int, default=500)
+    args = parser.parse_args()
+
+    keys = make_keys(args.count, args.vocabulary)
+    plain = measure(keys, intern=False)
+    interned = measure(keys, intern=True)
+    print(f"keys: {args.count}, distinct: {len(set(keys))}")
+    print(f"retained without intern: {plain / 2**20:8.2f} MiB")
+    print(f"retained with intern:    {interned / 2**20:8.2f} MiB")
+    print(f"reduction:               {plain / max(interned, 1):8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Replay a captured conversion workload and report its performance.
+
+Without a capture file, a synthetic workload is captured first.
+
+Usage:
+    python benchmarks/bench_replay.py [CAPTURE] [--repeat N] [--warm]
+"""
+import argparse
+import os
+import random
+import tempfile
+
+import case_conversion
+
+WORDS = ["user", "order", "HTTP", "id", "name", "created", "at", "URL", "v2"]
+STYLES = [case_conversion.camel, case_conversion.snake, case_conversion.const]
+
+
+def capture_synthetic(path: str, count: int = 100_000, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    with case_conversion.TrafficCapture(path, rate=0.1, seed=seed):
+        for _ in range(count):
+            text = rng.choice(STYLES)(" ".join(rng.sample(WORDS, rng.randint(2, 4))))
+            rng.choice(STYLES)(text, rng.choice([None, ["HTTP", "URL"]]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", nargs="?")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warm", action="store_true", help="keep the parse cache")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.capture
+        if path is None:
+            path = os.path.join(tmp, "synthetic.jsonl.gz")
+            capture_synthetic(path)
+        report = case_conversion.replay(path, args.repeat, cold=not args.warm)
+
+    print(f"compiled     {case_conversion.COMPILED}")
+    print(f"calls        {report.calls:,}")
+    print(f"throughput   {report.throughput:,.0f} calls/s")
+    for percentile, seconds in report.latencies.items():
+        print(f"p{percentile:<11g} {seconds * 1e6:8.2f} us")
+    print(f"peak memory  {report.peak_bytes / 1024:,.0f} KiB")
+    print(f"retained     {report.retained_bytes / 1024:,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Throughput benchmark for converters driven from a thread pool.
+
+Runs the converters from a ThreadPoolExecutor with 1 to 64 worker
+threads and reports the number of conversions per second. On
+free-threaded builds the cached path should scale with the number of
+cores.
+
+Usage:
+    python benchmarks/bench_threads.py [--count N] [--distinct N]
+"""
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import case_conversion
+
+THREADS = (1, 2, 4, 8, 16, 32, 64)
+CONVERTERS = (case_conversion.camel, case_conversion.snake, case_conversion.const)
+
+
+def make_keys(count: int, distinct: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    vocabulary = [
+        f"field_{n}_name" if n % 2 else f"fieldName{n}" for n in range(distinct)
+    ]
+    return [rng.choice(vocabulary) for _ in range(count)]
+
+
+def work(keys: list) -> int:
+    for key in keys:
+        for converter in CONVERTERS:
+            converter(key)
+    return len(keys) * len(CONVERTERS)
+
+
+def run(keys: list, threads: int) -> float:
+    chunks = [keys[i::threads] for i in range(threads)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        total = sum(pool.map(work, chunks))
+    return total / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--distinct", type=int, default=2_000)
+    args = parser.parse_args()
+
+    keys = make_keys(args.count, args.distinct)
+    case_conversion.clear_cache()
+    work(keys)  # Warm the cache.
+    print(f"{'threads':>8} {'conversions/s':>16}")
+    for threads in THREADS:
+        print(f"{threads:>8} {run(keys, threads):>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Optional mypyc build of the parsing hot path.
+
+The package itself is pure Python, `poetry build` produces a universal
+wheel. This script builds the modules listed in MYPYC_MODULES into
+binary extensions instead, if the environment variable
+CASE_CONVERSION_MYPYC is set to 1 and mypyc is installed. The .py
+modules are shipped either way and serve as the fallback.
+
+Compile in place for local development and benchmarks with:
+
+    CASE_CONVERSION_MYPYC=1 python build.py
+
+Build a platform-specific wheel with the extensions into dist/ with:
+
+    CASE_CONVERSION_MYPYC=1 python build.py bdist_wheel
+"""
+import os
+import re
+import sys
+from typing import Any, Dict
+
+# Keep in sync with case_conversion._pure.MODULES.
+MYPYC_MODULES = ["case_conversion/utils.py", "case_conversion/parser.py"]
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def build(setup_kwargs: Dict[str, Any]) -> None:
+    """Add the mypyc extensions to the setup arguments, if enabled."""
+    if os.environ.get("CASE_CONVERSION_MYPYC") != "1":
+        return
+    from mypyc.build import mypycify
+
+    setup_kwargs["ext_modules"] = mypycify(MYPYC_MODULES, opt_level="3")
+
+
+def _version() -> str:
+    with open(os.path.join(ROOT, "pyproject.toml")) as f:
+        match = re.search(r'^version = "([^"]+)"', f.read(), re.MULTILINE)
+    return match.group(1) if match else "0"
+
+
+if __name__ == "__main__":
+    from setuptools import setup
+
+    kwargs: Dict[str, Any] = {
+        "name": "case-conversion",
+        "version": _version(),
+        "packages": ["case_conversion"],
+        "python_requires": ">=3.7",
+        "script_args": sys.argv[1:] or ["build_ext", "--inplace"],
+    }
+    build(kwargs)
+    setup(**kwargs)
@@ -1,4 +1,18 @@
 # flake8: noqa
+import importlib
+import os
+from typing import Any, List
+
+from ._pure import is_compiled, load_pure_python
+
+# Optional mypyc-compiled modules are picked up automatically when
+# built, setting CASE_CONVERSION_PURE_PYTHON=1 forces the .py modules.
+if os.environ.get("CASE_CONVERSION_PURE_PYTHON") == "1":
+    load_pure_python(__name__)
+
+from . import parser as _parser
+from .acronyms import AcronymSet, get_acronyms, set_acronyms
+from .cache import clear_cache
 from .converter import (
     camel,
     pascal,
@@ -16,5 +30,61 @@ from .converter import (
     capital,
     http_header,
 )
+from .headers import canonical_header
 from .parser import parse_case
+from .segmenter import BoundaryRules
+from .styles import Style, convert, get_style, register_style
 from .types import Case, InvalidAcronymError
+
+# Whether the parsing hot path runs as compiled code.
+COMPILED = is_compiled(_parser)
+
+# Heavier, optional parts are imported on first attribute access, so
+# `import case_conversion` stays cheap for short-lived processes.
+_LAZY = {
+    "convert_keys_async": "aio",
+    "convert_many_async": "aio",
+    "convert_keys": "batch",
+    "convert_many": "batch",
+    "convert_bytes": "binary",
+    "convert_file": "binary",
+    "CanonicalKeyDict": "canonical",
+    "canonical_key": "canonical",
+    "CapturedCall": "capture",
+    "ReplayReport": "capture",
+    "TrafficCapture": "capture",
+    "load_capture": "capture",
+    "replay": "capture",
+    "ParsedColumns": "columnar",
+    "parse_columns": "columnar",
+    "render_columns": "columnar",
+    "CorpusProfile": "corpus",
+    "profile_files": "corpus",
+    "profile_identifiers": "corpus",
+    "AcronymCandidate": "discovery",
+    "AcronymReport": "discovery",
+    "discover_acronyms": "discovery",
+    "convert_sorted": "incremental",
+    "parse_many": "incremental",
+    "ASGIMiddleware": "middleware",
+    "WSGIMiddleware": "middleware",
+    "FieldConverter": "objects",
+    "field_converter": "objects",
+    "replace_identifiers": "replace",
+    "CacheScope": "scope",
+    "cache_scope": "scope",
+    "StyleView": "views",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,35 @@
+import importlib.machinery
+import os
+import sys
+from types import ModuleType
+
+# Modules optionally compiled with mypyc, see build.py.
+MODULES = ("utils", "parser")
+
+
+def is_compiled(module: ModuleType) -> bool:
+    """Return whether module was loaded from a binary extension."""
+    path = getattr(module, "__file__", None)
+    if not path:
+        return False
+    return path.endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES))
+
+
+def load_pure_python(package: str) -> None:
+    """Import the pure Python version of the compilable modules.
+
+    Compiled extensions take precedence over .py files on import, so the
+    .py files are loaded explicitly. Has to run before anything imports
+    these modules.
+    """
+    import importlib.util
+
+    directory = os.path.dirname(__file__)
+    for name in MODULES:
+        fullname = f"{package}.{name}"
+        spec = importlib.util.spec_from_file_location(
+            fullname, os.path.join(directory, f"{name}.py")
+        )
+        module = importlib.util.module_from_spec(spec)  # type: ignore
+        sys.modules[fullname] = module
+        spec.loader.exec_module(module)  # type: ignore
@@ -0,0 +1,76 @@
+from _thread import allocate_lock
+from contextvars import ContextVar
+from typing import FrozenSet, Iterable, NamedTuple, Optional, Tuple
+
+from .cache import _default_cache
+from .utils import sanitize_acronyms
+
+
+class AcronymSet(NamedTuple):
+    """Sanitized acronyms of the registry, tagged with a version.
+
+    Attributes:
+        version: Incremented on every swap, 0 for the initial empty set,
+            negative for the acronyms of a `cache_scope`
+        acronyms: Sanitized acronyms in their original order
+        lookup: Set of the sanitized acronyms
+    """
+
+    version: int
+    acronyms: Tuple[str, ...]
+    lookup: FrozenSet[str]
+
+
+_current = AcronymSet(0, (), frozenset())
+_swap_lock = allocate_lock()
+# Acronyms of the innermost cache_scope, see scope.py.
+_scoped: ContextVar[Optional[AcronymSet]] = ContextVar(
+    "case_conversion_acronyms", default=None
+)
+
+
+def get_acronyms() -> AcronymSet:
+    """Return the acronyms in effect.
+
+    Those are the acronyms of the innermost `cache_scope` setting any,
+    otherwise the acronyms of the process-wide registry. Converters honor
+    them whenever they are called without acronyms.
+    """
+    scoped = _scoped.get()
+    return _current if scoped is None else scoped
+
+
+def set_acronyms(acronyms: Iterable[str]) -> int:
+    """Replace the acronyms of the process-wide registry.
+
+    The acronyms are sanitized once and swapped in atomically, concurrent
+    conversions see either the old or the new set. Parse results are
+    cached per version, those of the old version are discarded afterwards
+    one cache stripe at a time, without pausing other threads.
+
+    Args:
+        acronyms (iterable of str): New acronyms, empty to disable
+
+    Returns:
+        int: Version of the new acronyms
+
+    Raises:
+        InvalidAcronymError: Upon encountering an invalid acronym
+
+    Examples:
+        >>> set_acronyms(["HTTP"])
+        1
+        >>> snake("HTTPServer")
+        'http_server'
+    """
+    global _current
+    sanitized = tuple(sanitize_acronyms(list(acronyms)))
+    with _swap_lock:
+        old = _current
+        new = _current = AcronymSet(old.version + 1, sanitized, frozenset(sanitized))
+    if old.acronyms:
+        # Parse cache keys are (string, acronyms tag, preserve_case, ...),
+        # the registry's tag is its version. Scoped caches are dropped
+        # with their scope.
+        _default_cache.discard(lambda key: key[1] == old.version)
+    return new.version
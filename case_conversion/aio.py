@@ -0,0 +1,205 @@
+import asyncio
+import contextvars
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Optional
+
+from .acronyms import get_acronyms
+from .batch import (
+    Converter,
+    _identity,
+    _unchanged_key_converter,
+    convert_keys,
+    convert_many,
+)
+
+# Default time the event loop is blocked before control is yielded back.
+SLICE_SECONDS = 0.005
+
+
+class _Slicer:
+    # Yields to the event loop whenever the current slice is used up.
+
+    def __init__(self, slice_seconds: float) -> None:
+        self.slice_seconds = slice_seconds
+        self.deadline = time.perf_counter() + slice_seconds
+
+    async def checkpoint(self) -> None:
+        if time.perf_counter() >= self.deadline:
+            await asyncio.sleep(0)
+            self.deadline = time.perf_counter() + self.slice_seconds
+
+
+def _offload(
+    executor: Optional[Executor], func: Callable[..., Any], *args: Any
+) -> "asyncio.Future[Any]":
+    # Threads run func in a copy of the current context, so an active
+    # cache_scope applies there too. Context variables can't be sent to
+    # other processes, func gets the scope's acronyms resolved instead.
+    loop = asyncio.get_running_loop()
+    if isinstance(executor, ProcessPoolExecutor):
+        return loop.run_in_executor(executor, func, *args)
+    return loop.run_in_executor(executor, contextvars.copy_context().run, func, *args)
+
+
+def _resolve(acronyms: Optional[List[str]], executor: Optional[Executor]) -> Any:
+    if acronyms is None and isinstance(executor, ProcessPoolExecutor):
+        return list(get_acronyms().acronyms)
+    return acronyms
+
+
+def _count_keys(obj: Any, limit: int) -> int:
+    # Stops as soon as limit is reached, the walk blocks the event loop.
+    count = 0
+    stack = [obj]
+    while stack and count < limit:
+        value = stack.pop()
+        if isinstance(value, dict):
+            count += len(value)
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return count
+
+
+async def convert_many_async(
+    texts: Iterable[str],
+    converter: Converter,
+    acronyms: Optional[List[str]] = None,
+    intern: bool = False,
+    slice_seconds: float = SLICE_SECONDS,
+    offload_threshold: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[str]:
+    """Asynchronous `convert_many` that never blocks the event loop long.
+
+    Small batches are converted on the event loop in time-bounded
+    slices, yielding to other tasks between slices. Batches of at least
+    `offload_threshold` strings are converted in an executor instead.
+
+    Args:
+        texts (iterable of str): Input strings to be converted
+        converter (callable): Case converter, e.g. `camel` or `snake`
+        acronyms (optional, list of str): List of acronyms to honor
+        intern (bool): Whether to intern the converted strings
+        slice_seconds (float): Maximum time to block the event loop
+        offload_threshold (optional, int): Batch size from which the
+            conversion runs in the executor, never if None
+        executor (optional, Executor): Executor to offload to, the
+            loop's default executor if None. Process pools require a
+            picklable converter.
+
+    Returns:
+        list of str: Case converted texts
+    """
+    texts = list(texts)
+    if offload_threshold is not None and len(texts) >= offload_threshold:
+        return await _offload(
+            executor,
+            partial(
+                convert_many, texts, converter, _resolve(acronyms, executor), intern
+            ),
+        )
+
+    finish = sys.intern if intern else _identity
+    slicer = _Slicer(slice_seconds)
+    converted = []
+    for text in texts:
+        converted.append(finish(converter(text, acronyms)))
+        await slicer.checkpoint()
+    return converted
+
+
+async def convert_keys_async(
+    obj: Any,
+    converter: Converter,
+    acronyms: Optional[List[str]] = None,
+    intern: bool = False,
+    slice_seconds: float = SLICE_SECONDS,
+    offload_threshold: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    reuse_unchanged: bool = False,
+) -> Any:
+    """Asynchronous `convert_keys` that never blocks the event loop long.
+
+    Payloads are converted on the event loop in time-bounded slices,
+    yielding to other tasks between slices. Payloads with at least
+    `offload_threshold` dict keys in total are converted in an executor
+    instead.
+
+    Args:
+        obj (any): Object to be converted, typically decoded JSON
+        converter (callable): Case converter, e.g. `camel` or `snake`
+        acronyms (optional, list of str): List of acronyms to honor
+        intern (bool): Whether to intern the converted keys
+        slice_seconds (float): Maximum time to block the event loop
+        offload_threshold (optional, int): Number of keys from which
+            the conversion runs in the executor, never if None
+        executor (optional, Executor): Executor to offload to, the
+            loop's default executor if None. Process pools require a
+            picklable converter.
+        reuse_unchanged (bool): Whether to return unchanged containers
+            instead of copies, see `convert_keys`
+
+    Returns:
+        any: Copy of obj with converted keys
+    """
+    if (
+        offload_threshold is not None
+        and _count_keys(obj, offload_threshold) >= offload_threshold
+    ):
+        return await _offload(
+            executor,
+            partial(
+                convert_keys,
+                obj,
+                converter,
+                _resolve(acronyms, executor),
+                intern,
+                reuse_unchanged,
+            ),
+        )
+
+    finish = sys.intern if intern else _identity
+    slicer = _Slicer(slice_seconds)
+    convert: Callable[[Any], Any]
+    if reuse_unchanged:
+        convert = _unchanged_key_converter(converter, acronyms, finish)
+    else:
+
+        def convert(key: Any) -> Any:
+            return finish(converter(key, acronyms)) if isinstance(key, str) else key
+
+    # Without reuse_unchanged, copies start right away. Otherwise they
+    # are only made from the first changed item on, as in convert_keys.
+    async def walk(value: Any) -> Any:
+        if isinstance(value, dict):
+            copy: Optional[dict] = None if reuse_unchanged else {}
+            for i, (k, v) in enumerate(value.items()):
+                new_key = convert(k)
+                new_value = await walk(v)
+                await slicer.checkpoint()
+                if copy is None:
+                    if new_key is k and new_value is v:
+                        continue
+                    copy = dict(islice(value.items(), i))
+                copy[new_key] = new_value
+            return value if copy is None else copy
+        if isinstance(value, (list, tuple)):
+            items: Optional[list] = None if reuse_unchanged else []
+            for i, v in enumerate(value):
+                new_value = await walk(v)
+                if items is None:
+                    if new_value is v:
+                        continue
+                    items = list(value[:i])
+                items.append(new_value)
+            if items is None:
+                return value
+            return items if isinstance(value, list) else tuple(items)
+        return value
+
+    return await walk(obj)
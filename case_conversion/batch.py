@@ -0,0 +1,174 @@
+import re
+import sys
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Optional
+
+from .types import Converter
+
+# ASCII keys matching these patterns are left unchanged by the style's
+# converter when no acronyms are honored (see tests/test_batch.py). They
+# are compiled on first use, so importing the package stays cheap.
+_CONFORMING = {
+    "snake": r"[a-z0-9]+(?:_[a-z0-9]+)*",
+    "dash": r"[a-z0-9]+(?:-[a-z0-9]+)*",
+    "dot": r"[a-z0-9]+(?:\.[a-z0-9]+)*",
+    "const": r"[A-Z0-9]+(?:_[A-Z0-9]+)*",
+    "camel": r"[a-z][a-z0-9]*(?:[A-Z][a-z0-9]*[a-z][a-z0-9]*)*",
+    "pascal": r"(?:[A-Z][a-z0-9]*[a-z][a-z0-9]*)+",
+}
+
+
+def _identity(text: str) -> str:
+    return text
+
+
+def convert_many(
+    texts: Iterable[str],
+    converter: Converter,
+    acronyms: Optional[List[str]] = None,
+    intern: bool = False,
+) -> List[str]:
+    """Convert every string of an iterable with the given converter.
+
+    Args:
+        texts (iterable of str): Input strings to be converted
+        converter (callable): Case converter, e.g. `camel` or `snake`
+        acronyms (optional, list of str): List of acronyms to honor
+        intern (bool): Whether to intern the converted strings, so
+            identical outputs share a single object
+
+    Returns:
+        list of str: Case converted texts
+
+    Examples:
+        >>> convert_many(["hello world", "foo_bar"], camel)
+        ['helloWorld', 'fooBar']
+    """
+    finish = sys.intern if intern else _identity
+    return [finish(converter(text, acronyms)) for text in texts]
+
+
+def convert_keys(
+    obj: Any,
+    converter: Converter,
+    acronyms: Optional[List[str]] = None,
+    intern: bool = False,
+    reuse_unchanged: bool = False,
+) -> Any:
+    """Recursively convert the string keys of all dicts within obj.
+
+    Lists and tuples are walked, any other value is returned as-is.
+
+    With `reuse_unchanged`, containers whose keys, including those
+    nested within, are already in the target style are returned as they
+    are instead of being copied. Only the containers along paths to a
+    changed key are rebuilt. Keys of the built-in styles are first
+    checked against a pattern of the style, so conforming keys skip the
+    converter.
+
+    Args:
+        obj (any): Object to be converted, typically decoded JSON
+        converter (callable): Case converter, e.g. `camel` or `snake`
+        acronyms (optional, list of str): List of acronyms to honor
+        intern (bool): Whether to intern the converted keys, so
+            identical keys share a single object
+        reuse_unchanged (bool): Whether to return unchanged containers
+            instead of copies
+
+    Returns:
+        any: Copy of obj with converted keys
+
+    Examples:
+        >>> convert_keys({"user_id": 1, "tags": [{"tag_name": "a"}]}, camel)
+        {'userId': 1, 'tags': [{'tagName': 'a'}]}
+    """
+    finish = sys.intern if intern else _identity
+    if reuse_unchanged:
+        return _reuse_unchanged(obj, converter, acronyms, finish)
+
+    def walk(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                (finish(converter(k, acronyms)) if isinstance(k, str) else k): walk(v)
+                for k, v in value.items()
+            }
+        if isinstance(value, list):
+            return [walk(v) for v in value]
+        if isinstance(value, tuple):
+            return tuple(walk(v) for v in value)
+        return value
+
+    return walk(obj)
+
+
+def _conformance_check(
+    converter: Converter, acronyms: Optional[List[str]]
+) -> Optional[Callable[[str], Any]]:
+    # Deferred, the styles module depends on this one.
+    from .acronyms import get_acronyms
+    from .styles import style_of
+
+    compiled = style_of(converter)
+    if compiled is None:
+        return None
+    if acronyms or (acronyms is None and get_acronyms().acronyms):
+        # Acronyms change the case of otherwise conforming words.
+        return None
+    pattern = _CONFORMING.get(compiled.style.name)
+    return None if pattern is None else re.compile(pattern).fullmatch
+
+
+def _unchanged_key_converter(
+    converter: Converter,
+    acronyms: Optional[List[str]],
+    finish: Callable[[str], str],
+) -> Callable[[Any], Any]:
+    # Converts keys, returning unchanged keys themselves.
+    conforms = _conformance_check(converter, acronyms)
+
+    def convert(key: Any) -> Any:
+        if not isinstance(key, str) or (conforms is not None and conforms(key)):
+            return key
+        converted = converter(key, acronyms)
+        return key if converted == key else finish(converted)
+
+    return convert
+
+
+def _reuse_unchanged(
+    obj: Any,
+    converter: Converter,
+    acronyms: Optional[List[str]],
+    finish: Callable[[str], str],
+) -> Any:
+    convert = _unchanged_key_converter(converter, acronyms, finish)
+
+    # Copies are only made from the first changed item on, until then
+    # the original container stands for itself.
+    def walk(value: Any) -> Any:
+        if isinstance(value, dict):
+            copy = None
+            for i, (k, v) in enumerate(value.items()):
+                new_key = convert(k)
+                new_value = walk(v)
+                if copy is None:
+                    if new_key is k and new_value is v:
+                        continue
+                    copy = dict(islice(value.items(), i))
+                copy[new_key] = new_value
+            return value if copy is None else copy
+        if isinstance(value, (list, tuple)):
+            items = None
+            for i, v in enumerate(value):
+                new_value = walk(v)
+                if items is None:
+                    if new_value is v:
+                        continue
+                    items = list(value[:i])
+                items.append(new_value)
+            if items is None:
+                return value
+            return items if isinstance(value, list) else tuple(items)
+        return value
+
+    return walk(obj)
@@ -0,0 +1,246 @@
+import re
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from . import converter as _converter
+from .acronyms import get_acronyms
+from .batch import Converter
+from .styles import Style, compile_formatter, style_of
+from .utils import (
+    advanced_acronym_detection,
+    sanitize_acronyms,
+    simple_acronym_detection,
+)
+
+# Byte-class table: every byte maps to its class as seen by segment_string.
+# u: upper-case letter, l: lower-case letter, d: decimal, s: separator.
+_CLASSES = bytes(
+    ord("u")
+    if 65 <= b <= 90
+    else ord("l")
+    if 97 <= b <= 122
+    else ord("d")
+    if 48 <= b <= 57
+    else ord("s")
+    for b in range(256)
+)
+# A word starts with any non-separator and continues until the next
+# upper-case letter or separator, separator runs collapse into one.
+_TOKEN = re.compile(rb"s+|[uld][ld]*")
+_SEP = ord("s")
+
+_CHUNK_SIZE = 1 << 20
+
+Buffer = Union[bytes, bytearray, memoryview, Any]
+
+
+def _segment(line: bytes) -> Tuple[List[Optional[bytes]], bytes, bool]:
+    # Byte-oriented equivalent of utils.segment_string for ASCII input.
+    was_upper = line.isupper()
+    if was_upper:
+        line = line.lower()
+    classes = line.translate(_CLASSES)
+    words: List[Optional[bytes]] = []
+    separator = b""
+    for match in _TOKEN.finditer(classes):
+        start, end = match.span()
+        if classes[start] == _SEP:
+            if not separator:
+                separator = line[start : start + 1]
+            words.append(None)
+        else:
+            words.append(line[start:end])
+    return words, separator, was_upper
+
+
+def _merge_runs(words: List[Optional[bytes]], acronyms: List[str]) -> None:
+    # Same letter-run detector as parse_case. The detectors work on str,
+    # runs are short, so only the run letters are decoded.
+    if acronyms:
+        check_acronym = advanced_acronym_detection
+    else:
+        check_acronym = simple_acronym_detection  # type: ignore
+    i = 0
+    s = None
+    while i < len(words):
+        word = words[i]
+        if word is not None and len(word) == 1 and word.isupper():
+            if s is None:
+                s = i
+        elif s is not None:
+            letters = [w.decode() for w in words[s:i]]  # type: ignore
+            last = check_acronym(0, len(letters), letters, acronyms)  # type: ignore
+            words[s:i] = [w.encode() for w in letters]
+            i = s + last + 1
+            s = None
+        i += 1
+
+
+def _normalize(words: List[bytes], acronyms: FrozenSet[bytes]) -> List[bytes]:
+    normalized = []
+    for word in words:
+        if word.upper() in acronyms:
+            normalized.append(word.upper())
+        elif not word.isupper():
+            normalized.append(word.capitalize())
+    return normalized
+
+
+def _parse(
+    line: bytes, acronyms: Tuple[List[str], FrozenSet[bytes]], preserve_case: bool
+) -> List[bytes]:
+    words_with_sep, _, was_upper = _segment(line)
+    _merge_runs(words_with_sep, acronyms[0])
+    words = [w for w in words_with_sep if w is not None]
+    if preserve_case:
+        return [w.upper() for w in words] if was_upper else words
+    return _normalize(words, acronyms[1])
+
+
+_binary_formatters: Dict[Style, Callable[..., bytes]] = {}
+
+
+# Converters that don't parse at all.
+_WHOLE_LINE: Dict[Converter, Callable[[bytes], bytes]] = {
+    _converter.lower: bytes.lower,
+    _converter.upper: bytes.upper,
+    _converter.title: bytes.title,
+    _converter.capital: bytes.capitalize,
+}
+
+
+def _line_converter(
+    converter: Converter, acronyms: Optional[List[str]], encoding: str
+) -> Callable[[bytes], bytes]:
+    if acronyms is None:
+        # Resolved once, so a registry swap can't affect a running conversion.
+        acronyms = list(get_acronyms().acronyms)
+
+    def fallback(line: bytes) -> bytes:
+        return converter(line.decode(encoding), acronyms).encode(encoding)
+
+    whole_line = _WHOLE_LINE.get(converter)
+    if whole_line is not None:
+        return lambda line: whole_line(line) if line.isascii() else fallback(line)
+
+    compiled = style_of(converter)
+    if compiled is None:
+        # Not a registered style, decode everything.
+        return fallback
+
+    formatter = _binary_formatters.get(compiled.style)
+    if formatter is None:
+        formatter = _binary_formatters[compiled.style] = compile_formatter(
+            compiled.style, binary=True
+        )
+    preserve_case = compiled.preserve_case
+    sanitized = sanitize_acronyms(acronyms) if acronyms else []
+    ascii_acronyms = frozenset(a.encode() for a in sanitized if a.isascii())
+    prepared = (sanitized, ascii_acronyms)
+
+    def convert(line: bytes) -> bytes:
+        if not line.isascii():
+            return fallback(line)
+        return formatter(_parse(line, prepared, preserve_case), ascii_acronyms)
+
+    return convert
+
+
+def _lines(data: Buffer) -> Iterator[Tuple[bytes, bool]]:
+    # Yield (line, newline terminated), reading the buffer chunk-wise so
+    # memory-mapped files are never copied as a whole.
+    pending = b""
+    with memoryview(data) as raw, raw.cast("B") as view:
+        for pos in range(0, len(view), _CHUNK_SIZE):
+            chunk = pending + view[pos : pos + _CHUNK_SIZE].tobytes()
+            lines = chunk.split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line, True
+    if pending:
+        yield pending, False
+
+
+def convert_bytes(
+    data: Buffer,
+    converter: Converter,
+    acronyms: Optional[List[str]] = None,
+    out: Optional[Union[bytearray, IO[bytes]]] = None,
+    encoding: str = "utf-8",
+) -> Union[bytearray, IO[bytes]]:
+    """Convert each newline separated identifier of a binary buffer.
+
+    ASCII lines are segmented and converted on bytes directly, using a
+    byte-class table, without decoding them. Lines containing non-ASCII
+    bytes are decoded and passed to the converter. The output is
+    identical to converting each decoded line with the converter.
+
+    Args:
+        data (bytes-like): bytes, bytearray, memoryview or mmap
+        converter (callable): Case converter, e.g. `camel` or `snake`
+        acronyms (optional, list of str): List of acronyms to honor
+        out (optional, bytearray or binary file): Output to write the
+            converted lines to, a new bytearray by default
+        encoding (str): Encoding of non-ASCII lines
+
+    Returns:
+        bytearray or binary file: out, with the converted lines appended
+
+    Examples:
+        >>> convert_bytes(b"fooBar\\nHELLO_WORLD\\n", snake)
+        bytearray(b'foo_bar\\nhello_world\\n')
+    """
+    if out is None:
+        out = bytearray()
+    write = out.extend if isinstance(out, bytearray) else out.write  # type: ignore
+    convert = _line_converter(converter, acronyms, encoding)
+    for line, terminated in _lines(data):
+        write(convert(line))
+        if terminated:
+            write(b"\n")
+    return out
+
+
+def convert_file(
+    src: str,
+    dst: str,
+    converter: Converter,
+    acronyms: Optional[List[str]] = None,
+    encoding: str = "utf-8",
+) -> None:
+    """Convert each line of a file of identifiers into another file.
+
+    The source file is memory-mapped, see `convert_bytes`.
+
+    Args:
+        src (str): Path of the file to read
+        dst (str): Path of the file to write
+        converter (callable): Case converter, e.g. `camel` or `snake`
+        acronyms (optional, list of str): List of acronyms to honor
+        encoding (str): Encoding of non-ASCII lines
+    """
+    import mmap
+
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        mapped: Optional[mmap.mmap]
+        try:
+            mapped = mmap.mmap(src_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped.
+            mapped = None
+        try:
+            data: Buffer = b"" if mapped is None else mapped
+            convert_bytes(data, converter, acronyms, dst_file, encoding)
+        finally:
+            if mapped is not None:
+                mapped.close()
@@ -0,0 +1,104 @@
+# The locks of threading, without the cost of importing it.
+from _thread import LockType, allocate_lock
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+
+class StripedCache:
+    """Bounded LRU cache split into independently locked stripes.
+
+    Keys are distributed over the stripes by hash, so concurrent threads
+    only contend when they hit the same stripe. This keeps the cache
+    scalable on free-threaded builds, where no global interpreter lock
+    serializes access for us.
+
+    Args:
+        maxsize (int): Maximum number of entries, 0 disables caching
+        stripes (int): Number of independently locked stripes
+    """
+
+    def __init__(self, maxsize: int = 4096, stripes: int = 16) -> None:  # noqa: D107
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        self.maxsize = maxsize
+        self._stripe_size = -(-maxsize // stripes)
+        self._stripes: List[Tuple[LockType, "OrderedDict[Hashable, Any]"]] = [
+            (allocate_lock(), OrderedDict()) for _ in range(stripes)
+        ]
+
+    def _stripe(self, key: Hashable) -> Tuple[LockType, "OrderedDict"]:
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        lock, entries = self._stripe(key)
+        with lock:
+            value = entries.get(key)
+            if value is not None:
+                entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry."""
+        if self._stripe_size <= 0:
+            return
+        lock, entries = self._stripe(key)
+        with lock:
+            entries[key] = value
+            entries.move_to_end(key)
+            if len(entries) > self._stripe_size:
+                entries.popitem(last=False)
+
+    def discard(self, predicate: Callable[[Any], bool]) -> int:
+        """Remove the entries whose key matches predicate.
+
+        Stripes are locked one at a time, so readers of other stripes are
+        never blocked.
+
+        Args:
+            predicate (callable): Called with every key, True to remove
+                its entry
+
+        Returns:
+            int: Number of removed entries
+        """
+        removed = 0
+        for lock, entries in self._stripes:
+            with lock:
+                stale = [key for key in entries if predicate(key)]
+                for key in stale:
+                    del entries[key]
+            removed += len(stale)
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for lock, entries in self._stripes:
+            with lock:
+                entries.clear()
+
+    def __len__(self) -> int:  # noqa: D105
+        return sum(len(entries) for _, entries in self._stripes)
+
+
+_default_cache = StripedCache()
+# Cache of the innermost cache_scope, see scope.py.
+_scoped_cache: ContextVar[Optional[StripedCache]] = ContextVar(
+    "case_conversion_cache", default=None
+)
+
+
+def get_cache() -> StripedCache:
+    """Return the cache used by parse_case.
+
+    That is the cache of the innermost `cache_scope`, if any, otherwise
+    the process-wide cache.
+    """
+    cache = _scoped_cache.get()
+    return _default_cache if cache is None else cache
+
+
+def clear_cache() -> None:
+    """Remove all memoized parse results of the cache in use."""
+    get_cache().clear()
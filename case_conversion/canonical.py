@@ -0,0 +1,124 @@
+from collections.abc import Mapping, MutableMapping
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from .acronyms import get_acronyms
+from .cache import StripedCache
+from .parser import parse_case
+
+_canonical_keys = StripedCache(maxsize=16384)
+
+
+def canonical_key(text: str, acronyms: Optional[List[str]] = None) -> str:
+    """Return a style-independent key for text.
+
+    The key is derived from the words found by `parse_case`, so all
+    spellings of an identifier with the same words share it. Runs of
+    upper-case letters count as one word, acronyms split such runs.
+    Keys are memoized in a bounded cache.
+
+    Args:
+        text (str): Identifier in any case style
+        acronyms (optional, list of str): List of acronyms to honor,
+            the registry's acronyms if None
+
+    Returns:
+        str: Canonical key
+
+    Examples:
+        >>> canonical_key("userId") == canonical_key("USER-ID")
+        True
+        >>> canonical_key("UserID") == canonical_key("user_id")
+        True
+    """
+    cache_key: Tuple[str, Optional[Hashable]]
+    if acronyms is None:
+        registry = get_acronyms()
+        cache_key = (text, registry.version if registry.acronyms else None)
+        acronyms = registry  # type: ignore
+    else:
+        cache_key = (text, tuple(acronyms) if acronyms else None)
+    key = _canonical_keys.get(cache_key)
+    if key is None:
+        # Preserving case keeps upper-case runs that normalization would
+        # drop, the trailing separator makes parse_case close a run at
+        # the end of text, so "UserID" matches "user_id".
+        words, *_ = parse_case(text + "_", acronyms, preserve_case=True)
+        # Words never contain separators, so "_" can't make keys collide.
+        key = "_".join([w.lower() for w in words])
+        _canonical_keys.put(cache_key, key)
+    return key
+
+
+class CanonicalKeyDict(MutableMapping):
+    """Mapping whose str keys match in any case style.
+
+    Keys are indexed by their `canonical_key`, so `userId`, `user_id`,
+    `USER-ID` and `UserID` (with acronym `ID`) all address the same
+    item. Iteration yields the keys as last set. Without acronyms, the
+    registry's acronyms are honored, and the items are reindexed when
+    they change.
+
+    Args:
+        data (optional, mapping or iterable of pairs): Initial items
+        acronyms (optional, list of str): List of acronyms to honor,
+            empty to honor none, the registry's acronyms if None
+        kwargs: Additional initial items
+
+    Examples:
+        >>> d = CanonicalKeyDict({"user_id": 1}, acronyms=["ID"])
+        >>> d["UserID"]
+        1
+    """
+
+    def __init__(  # noqa: D107
+        self, data: Any = None, acronyms: Optional[List[str]] = None, **kwargs: Any
+    ) -> None:
+        self.acronyms = list(acronyms) if acronyms is not None else None
+        self._store: Dict[str, Tuple[str, Any]] = {}
+        self._version: Optional[int] = None
+        self.update(data or {}, **kwargs)
+
+    def _key(self, key: str) -> str:
+        if self.acronyms is None:
+            version = get_acronyms().version
+            if version != self._version:
+                # Keys indexed under other acronyms may no longer match.
+                self._version = version
+                items = list(self._store.values())
+                self._store.clear()
+                for item in items:
+                    self._store[canonical_key(item[0])] = item
+        return canonical_key(key, self.acronyms)
+
+    def __setitem__(self, key: str, value: Any) -> None:  # noqa: D105
+        self._store[self._key(key)] = (key, value)
+
+    def __getitem__(self, key: str) -> Any:  # noqa: D105
+        return self._store[self._key(key)][1]
+
+    def __delitem__(self, key: str) -> None:  # noqa: D105
+        del self._store[self._key(key)]
+
+    def __contains__(self, key: object) -> bool:  # noqa: D105
+        return isinstance(key, str) and self._key(key) in self._store
+
+    def __iter__(self) -> Iterator[str]:  # noqa: D105
+        return (key for key, _ in self._store.values())
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._store)
+
+    def __eq__(self, other: object) -> bool:  # noqa: D105
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        other = CanonicalKeyDict(other, self.acronyms)
+        return {k: v for k, (_, v) in self._store.items()} == {
+            k: v for k, (_, v) in other._store.items()
+        }
+
+    def copy(self) -> "CanonicalKeyDict":
+        """Return a shallow copy."""
+        return CanonicalKeyDict(self._store.values(), self.acronyms)
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"{type(self).__name__}({dict(self.items())!r})"
@@ -0,0 +1,274 @@
+import gzip
+import json
+import random
+import threading
+import time
+import tracemalloc
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Union
+
+from . import styles
+from .acronyms import get_acronyms
+from .cache import clear_cache
+from .parser import Engine
+from .segmenter import BoundaryRules
+
+FORMAT = "case_conversion-capture"
+VERSION = 1
+
+# Latency percentiles reported by replay.
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class CapturedCall(NamedTuple):
+    """Conversion recorded by a traffic capture.
+
+    Attributes:
+        style (str): Name of the style converted to
+        text (str): Input string
+        acronyms (optional, list of str): Acronyms honored, the
+            registry's acronyms at capture time resolved; None for none
+        engine (optional, str or BoundaryRules): Segmentation engine
+        normalize (optional, str): Unicode normalization form
+    """
+
+    style: str
+    text: str
+    acronyms: Optional[List[str]] = None
+    engine: Optional[Engine] = None
+    normalize: Optional[str] = None
+
+
+class TrafficCapture:
+    """Opt-in sampler recording the conversions of the public converters.
+
+    While started, a random `rate` fraction of the calls of all
+    registered styles, including `camel`, `snake` and the other
+    converters of `converter.py` built on `parse_case`, is appended to a
+    gzip-compressed JSON lines file. `lower`, `upper`, `title` and
+    `capital` merely wrap the str methods, they are neither recorded nor
+    replayable. `acronyms=None` is recorded as the registry's acronyms
+    at the time of the call, so the workload replays identically
+    elsewhere. Only one capture can run at a time. Converters are not
+    slowed down while no capture runs, and never fail because of it:
+    calls that cannot be recorded are counted in `dropped` instead.
+
+    Args:
+        path (str): Path of the capture file, overwritten
+        rate (float): Fraction of the calls to record
+        seed (optional, int): Seed of the sampling, for reproducible
+            captures
+
+    Raises:
+        ValueError: If the rate is not within (0, 1]
+
+    Examples:
+        >>> with TrafficCapture("traffic.jsonl.gz", rate=0.01):
+        ...     serve_forever()
+        >>> report = replay("traffic.jsonl.gz")
+    """
+
+    def __init__(  # noqa: D107
+        self, path: str, rate: float = 0.01, seed: Optional[int] = None
+    ) -> None:
+        if not 0 < rate <= 1:
+            raise ValueError(f"Case Conversion: invalid capture rate {rate}.")
+        self.path = path
+        self.rate = rate
+        self.recorded = 0
+        self.dropped = 0
+        self._random = random.Random(seed).random
+        self._lock = threading.Lock()
+        self._file: Optional[Any] = None
+
+    def _observe(
+        self,
+        style: str,
+        text: str,
+        acronyms: Optional[List[str]],
+        engine: Optional[Engine],
+        normalize: Optional[str],
+    ) -> None:
+        if self._random() >= self.rate:
+            return
+        with self._lock:
+            try:
+                if acronyms is None:
+                    acronyms = list(get_acronyms().acronyms) or None
+                record: List[Any] = [style, text, acronyms]
+                if engine is not None or normalize is not None:
+                    record += [engine, normalize]
+                line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+                if self._file is not None:
+                    self._file.write(line + "\n")
+                    self.recorded += 1
+            except Exception:
+                # Sampling must never break the observed conversion.
+                self.dropped += 1
+
+    def start(self) -> "TrafficCapture":
+        """Start recording.
+
+        Returns:
+            TrafficCapture: This capture
+
+        Raises:
+            ValueError: If a capture is already running
+        """
+        if styles._observer is not None:
+            raise ValueError("Case Conversion: a traffic capture is already running.")
+        # Lone surrogates are valid in str, and written as they are.
+        self._file = gzip.open(
+            self.path, "wt", encoding="utf-8", errors="surrogatepass"
+        )
+        self._file.write(json.dumps({"format": FORMAT, "version": VERSION}) + "\n")
+        styles._observer = self._observe
+        return self
+
+    def stop(self) -> None:
+        """Stop recording and close the capture file."""
+        if styles._observer == self._observe:
+            styles._observer = None
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "TrafficCapture":  # noqa: D105
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:  # noqa: D105
+        self.stop()
+
+
+def load_capture(path: str) -> List[CapturedCall]:
+    """Read the calls recorded by a traffic capture.
+
+    Args:
+        path (str): Path of the capture file
+
+    Returns:
+        list of CapturedCall: Recorded calls, in order
+
+    Raises:
+        ValueError: If the file is not a capture of a supported version
+    """
+    with gzip.open(path, "rt", encoding="utf-8", errors="surrogatepass") as f:
+        header = json.loads(f.readline() or "null")
+        if not isinstance(header, dict) or header.get("format") != FORMAT:
+            raise ValueError(f"Case Conversion: '{path}' is not a traffic capture.")
+        if header.get("version") != VERSION:
+            raise ValueError(
+                f"Case Conversion: unsupported capture version {header.get('version')}."
+            )
+        calls = []
+        for line in f:
+            call = CapturedCall(*json.loads(line))
+            if isinstance(call.engine, list):
+                call = call._replace(engine=BoundaryRules(*call.engine))
+            calls.append(call)
+    return calls
+
+
+class ReplayReport(NamedTuple):
+    """Performance of a replayed workload.
+
+    Attributes:
+        calls (int): Number of conversions per pass
+        seconds (float): Duration of the fastest pass
+        throughput (float): Conversions per second of the fastest pass
+        latencies (dict of float to float): Seconds per conversion at
+            each percentile of `PERCENTILES`
+        peak_bytes (int): Peak memory allocated during a pass
+        retained_bytes (int): Memory still allocated after a pass,
+            mostly cache entries
+    """
+
+    calls: int
+    seconds: float
+    throughput: float
+    latencies: Dict[float, float]
+    peak_bytes: int
+    retained_bytes: int
+
+
+def _percentile(ordered: Sequence[int], percentile: float) -> int:
+    index = round(percentile / 100 * (len(ordered) - 1))
+    return ordered[index]
+
+
+def replay(
+    capture: Union[str, Iterable[CapturedCall]],
+    repeat: int = 3,
+    cold: bool = True,
+) -> ReplayReport:
+    """Rerun a captured workload against the installed build.
+
+    The calls are replayed `repeat` times each for throughput and for
+    per-call latency, then once more under `tracemalloc` for the memory
+    figures, so the measurements do not disturb each other.
+
+    Args:
+        capture (str or iterable of CapturedCall): Path of the capture
+            file, or its loaded calls
+        repeat (int): Number of passes per measurement
+        cold (bool): Whether every pass starts with an empty parse
+            cache, as in a freshly started process
+
+    Returns:
+        ReplayReport: Measured performance
+
+    Raises:
+        ValueError: If a recorded style is not registered
+    """
+    if isinstance(capture, str):
+        capture = load_capture(capture)
+    workload = [(styles._lookup(call[0])[1], tuple(call[1:])) for call in capture]
+
+    def prepare() -> None:
+        if cold:
+            clear_cache()
+
+    best = float("inf")
+    for _ in range(repeat):
+        prepare()
+        start = time.perf_counter()
+        for converter, args in workload:
+            converter(*args)
+        best = min(best, time.perf_counter() - start)
+
+    timings: List[int] = []
+    clock = time.perf_counter_ns
+    for _ in range(repeat):
+        prepare()
+        for converter, args in workload:
+            start_ns = clock()
+            converter(*args)
+            timings.append(clock() - start_ns)
+    timings.sort()
+
+    prepare()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    elif hasattr(tracemalloc, "reset_peak"):
+        # Python 3.9+, otherwise the peak of the running trace is reported.
+        tracemalloc.reset_peak()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for converter, args in workload:
+            converter(*args)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return ReplayReport(
+        calls=len(workload),
+        seconds=best,
+        throughput=len(workload) / best if best else 0.0,
+        latencies={
+            p: _percentile(timings, p) / 1e9 if timings else 0.0 for p in PERCENTILES
+        },
+        peak_bytes=peak - before,
+        retained_bytes=current - before,
+    )
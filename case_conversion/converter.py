@@ -1,14 +1,38 @@
 from typing import List, Optional
 
-from .parser import parse_case
-
-
-def camel(text: str, acronyms: Optional[List[str]] = None) -> str:
+from . import styles as _styles
+from .headers import fast_http_header
+from .parser import ENGINES, Engine
+from .styles import CompiledStyle, Style, _add
+
+_CAMEL = CompiledStyle(Style("camel", first_word="lower"))
+_PASCAL = CompiledStyle(Style("pascal"))
+_SNAKE = CompiledStyle(Style("snake", "_", "lower", "lower"))
+_DASH = CompiledStyle(Style("dash", "-", "lower", "lower"))
+_CONST = CompiledStyle(Style("const", "_", "upper", "upper"))
+_DOT = CompiledStyle(Style("dot", ".", "lower", "lower"))
+_SEPARATE_WORDS = CompiledStyle(Style("separate_words", " ", "preserve", "preserve"))
+_SLASH = CompiledStyle(Style("slash", "/", "preserve", "preserve"))
+_BACKSLASH = CompiledStyle(Style("backslash", "\\", "preserve", "preserve"))
+_ADA = CompiledStyle(Style("ada", "_", "capitalize", "capitalize"))
+_HTTP_HEADER = CompiledStyle(Style("http_header", "-", "capitalize", "capitalize"))
+
+
+def camel(
+    text: str,
+    acronyms: Optional[List[str]] = None,
+    engine: Optional[Engine] = None,
+    normalize: Optional[str] = None,
+) -> str:
     """Return text in camelCase style.
 
     Args:
         text (str): Input string to be converted
         acronyms (optional, list of str): List of acronyms to honor
+        engine (optional, str or BoundaryRules): Segmentation engine,
+            see parse_case
+        normalize (optional, str): Unicode normalization form, see
+            parse_case
 
     Returns:
         str: Case converted text
@@ -19,13 +43,15 @@ def camel(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> camel("HELLO_HTML_WORLD", ["HTML"])
         'helloHTMLWorld'
     """
-    words, *_ = parse_case(text, acronyms)
-    if words:
-        words[0] = words[0].lower()
-    return "".join(words)
+    return _CAMEL.convert(text, acronyms, engine, normalize)
 
 
-def pascal(text: str, acronyms: Optional[List[str]] = None) -> str:
+def pascal(
+    text: str,
+    acronyms: Optional[List[str]] = None,
+    engine: Optional[Engine] = None,
+    normalize: Optional[str] = None,
+) -> str:
     """Return text in PascalCase style.
 
     This case style is also known as: MixedCase
@@ -33,6 +59,10 @@ def pascal(text: str, acronyms: Optional[List[str]] = None) -> str:
     Args:
         text (str): Input string to be converted
         acronyms (optional, list of str): List of acronyms to honor
+        engine (optional, str or BoundaryRules): Segmentation engine,
+            see parse_case
+        normalize (optional, str): Unicode normalization form, see
+            parse_case
 
     Returns:
         str: Case converted text
@@ -43,16 +73,24 @@ def pascal(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> pascal("HELLO_HTML_WORLD", ["HTML"])
         'HelloHTMLWorld'
     """
-    words, *_ = parse_case(text, acronyms)
-    return "".join(words)
+    return _PASCAL.convert(text, acronyms, engine, normalize)
 
 
-def snake(text: str, acronyms: Optional[List[str]] = None) -> str:
+def snake(
+    text: str,
+    acronyms: Optional[List[str]] = None,
+    engine: Optional[Engine] = None,
+    normalize: Optional[str] = None,
+) -> str:
     """Return text in snake_case style.
 
     Args:
         text (str): Input string to be converted
-        acronyms (optional, list of str): List of acronyms to honort
+        acronyms (optional, list of str): List of acronyms to honor
+        engine (optional, str or BoundaryRules): Segmentation engine,
+            see parse_case
+        normalize (optional, str): Unicode normalization form, see
+            parse_case
 
     Returns:
         str: Case converted text
@@ -63,11 +101,15 @@ def snake(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> snake("HelloHTMLWorld", ["HTML"])
         'hello_html_world'
     """
-    words, *_ = parse_case(text, acronyms)
-    return "_".join([w.lower() for w in words])
+    return _SNAKE.convert(text, acronyms, engine, normalize)
 
 
-def dash(text: str, acronyms: Optional[List[str]] = None) -> str:
+def dash(
+    text: str,
+    acronyms: Optional[List[str]] = None,
+    engine: Optional[Engine] = None,
+    normalize: Optional[str] = None,
+) -> str:
     """Return text in dash-case style.
 
     This case style is also known as: kebab-case, spinal-case, slug-case
@@ -75,6 +117,10 @@ def dash(text: str, acronyms: Optional[List[str]] = None) -> str:
     Args:
         text (str): Input string to be converted
         acronyms (optional, list of str): List of acronyms to honor
+        engine (optional, str or BoundaryRules): Segmentation engine,
+            see parse_case
+        normalize (optional, str): Unicode normalization form, see
+            parse_case
 
     Returns:
         str: Case converted text
@@ -85,11 +131,15 @@ def dash(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> dash("HelloHTMLWorld", ["HTML"])
         'hello-html-world'
     """
-    words, *_ = parse_case(text, acronyms)
-    return "-".join([w.lower() for w in words])
+    return _DASH.convert(text, acronyms, engine, normalize)
 
 
-def const(text: str, acronyms: Optional[List[str]] = None) -> str:
+def const(
+    text: str,
+    acronyms: Optional[List[str]] = None,
+    engine: Optional[Engine] = None,
+    normalize: Optional[str] = None,
+) -> str:
     """Return text in CONST_CASE style.
 
     This case style is also known as: SCREAMING_SNAKE_CASE
@@ -97,6 +147,10 @@ def const(text: str, acronyms: Optional[List[str]] = None) -> str:
     Args:
         text (str): Input string to be converted
         acronyms (optional, list of str): List of acronyms to honor
+        engine (optional, str or BoundaryRules): Segmentation engine,
+            see parse_case
+        normalize (optional, str): Unicode normalization form, see
+            parse_case
 
     Returns:
         str: Case converted text
@@ -107,16 +161,24 @@ def const(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> const("helloHTMLWorld", ["HTML"])
         'HELLO_HTML_WORLD'
     """
-    words, *_ = parse_case(text, acronyms)
-    return "_".join([w.upper() for w in words])
+    return _CONST.convert(text, acronyms, engine, normalize)
 
 
-def dot(text: str, acronyms: Optional[List[str]] = None) -> str:
+def dot(
+    text: str,
+    acronyms: Optional[List[str]] = None,
+    engine: Optional[Engine] = None,
+    normalize: Optional[str] = None,
+) -> str:
     """Return text in dot.case style.
 
     Args:
         text (str): Input string to be converted
         acronyms (optional, list of str): List of acronyms to honor
+        engine (optional, str or BoundaryRules): Segmentation engine,
+            see parse_case
+        normalize (optional, str): Unicode normalization form, see
+            parse_case
 
     Returns:
         str: Case converted text
@@ -127,16 +189,24 @@ def dot(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> dot("helloHTMLWorld", ["HTML"])
         'hello.html.world'
     """
-    words, *_ = parse_case(text, acronyms)
-    return ".".join([w.lower() for w in words])
+    return _DOT.convert(text, acronyms, engine, normalize)
 
 
-def separate_words(text: str, acronyms: Optional[List[str]] = None) -> str:
+def separate_words(
+    text: str,
+    acronyms: Optional[List[str]] = None,
+    engine: Optional[Engine] = None,
+    normalize: Optional[str] = None,
+) -> str:
     """Return text in "seperate words" style.
 
     Args:
         text (str): Input string to be converted
         acronyms (optional, list of str): List of acronyms to honor
+        engine (optional, str or BoundaryRules): Segmentation engine,
+            see parse_case
+        normalize (optional, str): Unicode normalization form, see
+            parse_case
 
     Returns:
         str: Case converted text
@@ -147,16 +217,24 @@ def separate_words(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> separate_words("helloHTMLWorld", ["HTML"])
         'hello HTML World'
     """
-    words, *_ = parse_case(text, acronyms, preserve_case=True)
-    return " ".join(words)
+    return _SEPARATE_WORDS.convert(text, acronyms, engine, normalize)
 
 
-def slash(text: str, acronyms: Optional[List[str]] = None) -> str:
+def slash(
+    text: str,
+    acronyms: Optional[List[str]] = None,
+    engine: Optional[Engine] = None,
+    normalize: Optional[str] = None,
+) -> str:
     """Return text in slash/case style.
 
     Args:
         text (str): Input string to be converted
         acronyms (optional, list of str): List of acronyms to honor
+        engine (optional, str or BoundaryRules): Segmentation engine,
+            see parse_case
+        normalize (optional, str): Unicode normalization form, see
+            parse_case
 
     Returns:
         str: Case converted text
@@ -167,16 +245,24 @@ def slash(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> slash("helloHTMLWorld", ["HTML"])
         'hello/HTML/World'
     """
-    words, *_ = parse_case(text, acronyms, preserve_case=True)
-    return "/".join(words)
+    return _SLASH.convert(text, acronyms, engine, normalize)
 
 
-def backslash(text: str, acronyms: Optional[List[str]] = None) -> str:
+def backslash(
+    text: str,
+    acronyms: Optional[List[str]] = None,
+    engine: Optional[Engine] = None,
+    normalize: Optional[str] = None,
+) -> str:
     r"""Return text in backslash\case style.
 
     Args:
         text (str): Input string to be converted
         acronyms (optional, list of str): List of acronyms to honor
+        engine (optional, str or BoundaryRules): Segmentation engine,
+            see parse_case
+        normalize (optional, str): Unicode normalization form, see
+            parse_case
 
     Returns:
         str: Case converted text
@@ -187,11 +273,15 @@ def backslash(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> backslash("helloHTMLWorld", ["HTML"])
         r'hello\HTML\World'
     """
-    words, *_ = parse_case(text, acronyms, preserve_case=True)
-    return "\\".join(words)
+    return _BACKSLASH.convert(text, acronyms, engine, normalize)
 
 
-def ada(text: str, acronyms: Optional[List[str]] = None) -> str:
+def ada(
+    text: str,
+    acronyms: Optional[List[str]] = None,
+    engine: Optional[Engine] = None,
+    normalize: Optional[str] = None,
+) -> str:
     """Return text in Ada_Case style.
 
     This case style is also known as: Camel_Snake
@@ -199,6 +289,10 @@ def ada(text: str, acronyms: Optional[List[str]] = None) -> str:
     Args:
         text (str): Input string to be converted
         acronyms (optional, list of str): List of acronyms to honor
+        engine (optional, str or BoundaryRules): Segmentation engine,
+            see parse_case
+        normalize (optional, str): Unicode normalization form, see
+            parse_case
 
     Returns:
         str: Case converted text
@@ -209,16 +303,24 @@ def ada(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> ada("helloHTMLWorld", ["HTML"])
         Hello_HTML_World
     """
-    words, *_ = parse_case(text, acronyms)
-    return "_".join([w.capitalize() for w in words])
+    return _ADA.convert(text, acronyms, engine, normalize)
 
 
-def http_header(text: str, acronyms: Optional[List[str]] = None) -> str:
+def http_header(
+    text: str,
+    acronyms: Optional[List[str]] = None,
+    engine: Optional[Engine] = None,
+    normalize: Optional[str] = None,
+) -> str:
     """Return text in Http-Header-Case style.
 
     Args:
         text (str): Input string to be converted
         acronyms (optional, list of str): List of acronyms to honor
+        engine (optional, str or BoundaryRules): Segmentation engine,
+            see parse_case
+        normalize (optional, str): Unicode normalization form, see
+            parse_case
 
     Returns:
         str: Case converted text
@@ -229,8 +331,17 @@ def http_header(text: str, acronyms: Optional[List[str]] = None) -> str:
         >>> http_header("helloHTMLWorld", ["HTML"])
         Hello-HTML-World
     """
-    words, *_ = parse_case(text, acronyms)
-    return "-".join([w.capitalize() for w in words])
+    # The fast path stands in for the named engines only. Custom rules
+    # and unknown engines, which parse_case rejects, take the full path.
+    if normalize or (engine is not None and engine not in ENGINES):
+        converted = None
+    else:
+        converted = fast_http_header(text, acronyms)
+    if converted is not None:
+        if _styles._observer is not None:
+            _styles._observer("http_header", text, acronyms, engine, normalize)
+        return converted
+    return _HTTP_HEADER.convert(text, acronyms, engine, normalize)
 
 
 def lower(text: str, *args, **kwargs) -> str:
@@ -327,3 +438,19 @@ def capital(text: str, *args, **kwargs) -> str:
         Hello_HTML_world
     """
     return text.capitalize()
+
+
+for _compiled, _function in (
+    (_CAMEL, camel),
+    (_PASCAL, pascal),
+    (_SNAKE, snake),
+    (_DASH, dash),
+    (_CONST, const),
+    (_DOT, dot),
+    (_SEPARATE_WORDS, separate_words),
+    (_SLASH, slash),
+    (_BACKSLASH, backslash),
+    (_ADA, ada),
+    (_HTTP_HEADER, http_header),
+):
+    _add(_compiled, _function)
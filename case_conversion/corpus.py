@@ -0,0 +1,164 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from .acronyms import get_acronyms
+from .parser import _parse_case
+from .segmenter import fast_segment_string
+from .utils import sanitize_acronyms
+
+# Bytes of input per worker task, files are split on line boundaries.
+SHARD_SIZE = 1 << 24
+
+
+class CorpusProfile(NamedTuple):
+    """Case statistics of a corpus of identifiers.
+
+    Attributes:
+        identifiers (int): Number of identifiers analyzed
+        cases (Counter of Case): Identifiers per determined case
+        separators (Counter of str): Identifiers per determined
+            separator, "" for none
+        word_counts (Counter of int): Identifiers per number of words
+        acronyms (Counter of str): Occurrences of each acronym as a word
+    """
+
+    identifiers: int
+    cases: Counter
+    separators: Counter
+    word_counts: Counter
+    acronyms: Counter
+
+    def merge(self, other: "CorpusProfile") -> "CorpusProfile":
+        """Return the combined statistics of two profiles."""
+        return CorpusProfile(
+            self.identifiers + other.identifiers,
+            self.cases + other.cases,
+            self.separators + other.separators,
+            self.word_counts + other.word_counts,
+            self.acronyms + other.acronyms,
+        )
+
+
+def _empty() -> CorpusProfile:
+    return CorpusProfile(0, Counter(), Counter(), Counter(), Counter())
+
+
+def _profile_counts(counts: Counter, acronyms: List[str]) -> CorpusProfile:
+    # Corpora repeat identifiers a lot, so each distinct identifier is
+    # parsed once and weighted by its count. The parse cache is bypassed,
+    # it would only churn on tens of millions of one-off identifiers.
+    lookup = frozenset(acronyms)
+    profile = _empty()
+    for identifier, count in counts.items():
+        words, case_type, separator = _parse_case(
+            identifier, acronyms, False, fast_segment_string
+        )
+        profile.cases[case_type] += count
+        profile.separators[separator] += count
+        profile.word_counts[len(words)] += count
+        if lookup:
+            for word in words:
+                if word in lookup:
+                    profile.acronyms[word] += count
+    return profile._replace(identifiers=sum(counts.values()))
+
+
+def profile_identifiers(
+    identifiers: Iterable[str], acronyms: Optional[List[str]] = None
+) -> CorpusProfile:
+    """Collect case statistics of identifiers in this process.
+
+    Every identifier is analyzed by the same pipeline as `parse_case`.
+
+    Args:
+        identifiers (iterable of str): Identifiers to analyze
+        acronyms (optional, list of str): List of acronyms to honor and
+            count, the registry's acronyms if None
+
+    Returns:
+        CorpusProfile: Merged histograms
+
+    Examples:
+        >>> profile_identifiers(["user_id", "userId", "user_name"]).cases
+        Counter({<Case.LOWER: 3>: 2, <Case.CAMEL: 4>: 1})
+    """
+    if acronyms is None:
+        acronyms = list(get_acronyms().acronyms)
+    return _profile_counts(Counter(identifiers), sanitize_acronyms(acronyms))
+
+
+def _shards(paths: Iterable[str], shard_size: int) -> List[Tuple[str, int, int]]:
+    shards = []
+    for path in paths:
+        size = os.path.getsize(path)
+        for start in range(0, size, shard_size):
+            shards.append((path, start, min(start + shard_size, size)))
+    return shards
+
+
+def _profile_shard(
+    path: str, start: int, end: int, acronyms: List[str], encoding: str
+) -> CorpusProfile:
+    # A shard owns every line starting within [start, end).
+    counts: Counter = Counter()
+    with open(path, "rb") as f:
+        if start:
+            f.seek(start - 1)
+            f.readline()
+        pos = f.tell()
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            line = line.rstrip(b"\r\n")
+            if line:
+                counts[line] += 1
+    decoded = Counter({line.decode(encoding): n for line, n in counts.items()})
+    return _profile_counts(decoded, acronyms)
+
+
+def profile_files(
+    paths: Iterable[str],
+    acronyms: Optional[List[str]] = None,
+    processes: Optional[int] = None,
+    encoding: str = "utf-8",
+    shard_size: int = SHARD_SIZE,
+) -> CorpusProfile:
+    """Collect case statistics of files with one identifier per line.
+
+    The files are split into shards of about `shard_size` bytes on line
+    boundaries, the shards are profiled by a pool of worker processes and
+    their histograms merged. Empty lines are skipped.
+
+    Args:
+        paths (iterable of str): Paths of the input files
+        acronyms (optional, list of str): List of acronyms to honor and
+            count, the registry's acronyms if None
+        processes (optional, int): Number of worker processes, the
+            number of CPUs if None, 1 to work in this process
+        encoding (str): Encoding of the files
+        shard_size (int): Approximate number of bytes per shard
+
+    Returns:
+        CorpusProfile: Merged histograms
+    """
+    if acronyms is None:
+        acronyms = list(get_acronyms().acronyms)
+    acronyms = sanitize_acronyms(acronyms)
+    shards = _shards(paths, shard_size)
+    profile = _empty()
+    if processes == 1 or len(shards) < 2:
+        for shard in shards:
+            profile = profile.merge(_profile_shard(*shard, acronyms, encoding))
+        return profile
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [
+            pool.submit(_profile_shard, *shard, acronyms, encoding) for shard in shards
+        ]
+        for future in futures:
+            profile = profile.merge(future.result())
+    return profile
@@ -0,0 +1,124 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from .utils import is_upper, segment_string
+
+
+class AcronymCandidate(NamedTuple):
+    """Acronym suggested by `discover_acronyms`.
+
+    Attributes:
+        acronym (str): Run of upper-case letters
+        occurrences (int): Number of identifiers containing the run, a
+            lower bound of the true count
+        error (int): Upper bound on how much occurrences is too low
+    """
+
+    acronym: str
+    occurrences: int
+    error: int
+
+
+class AcronymReport(NamedTuple):
+    """Result of `discover_acronyms`.
+
+    Attributes:
+        candidates (list of AcronymCandidate): Suggested acronyms, most
+            frequent first
+        identifiers (int): Number of identifiers analyzed
+        runs (int): Number of upper-case letter runs found
+        matcher_cost (float): Estimated substring scans per identifier
+            when all candidates are passed as `acronyms`
+    """
+
+    candidates: List[AcronymCandidate]
+    identifiers: int
+    runs: int
+    matcher_cost: float
+
+    @property
+    def acronyms(self) -> List[str]:
+        """Return the suggested acronyms."""
+        return [c.acronym for c in self.candidates]
+
+
+def _runs(identifier: str) -> Set[str]:
+    # Runs of single upper-case letters, exactly as parse_case sees them.
+    words, _, _ = segment_string(identifier)
+    runs = set()
+    run: List[str] = []
+    for word in words + [None]:
+        if word is not None and is_upper(word):
+            run.append(word)
+            continue
+        if len(run) > 1:
+            runs.add("".join(run))
+        run = []
+    return runs
+
+
+def discover_acronyms(
+    identifiers: Iterable[str],
+    capacity: int = 1024,
+    min_count: int = 2,
+    limit: Optional[int] = None,
+) -> AcronymReport:
+    """Suggest an acronym list from a corpus of identifiers.
+
+    Streams once through the identifiers, counting the runs of
+    upper-case letters that `parse_case` would otherwise pass to the
+    acronym detection. Counting uses the Misra-Gries summary, so memory
+    stays bounded by `capacity` no matter how many distinct runs occur,
+    and every run occurring in more than 1/capacity of the identifiers
+    is guaranteed to be kept.
+
+    The matcher cost estimates how many substring scans
+    `advanced_acronym_detection` would do per identifier with the
+    suggested list: one scan per acronym and letter run.
+
+    Args:
+        identifiers (iterable of str): Identifiers to analyze
+        capacity (int): Maximum number of runs tracked at once
+        min_count (int): Minimum count of a suggested acronym
+        limit (optional, int): Maximum number of suggested acronyms
+
+    Returns:
+        AcronymReport: Ranked suggestions and corpus statistics
+
+    Examples:
+        >>> discover_acronyms(["parseHTTPResponse", "HTTPError"]).acronyms
+        ['HTTP']
+    """
+    counts: Dict[str, int] = {}
+    decrements = 0
+    total_identifiers = 0
+    total_runs = 0
+
+    for identifier in identifiers:
+        total_identifiers += 1
+        for run in _runs(identifier):
+            total_runs += 1
+            if run in counts:
+                counts[run] += 1
+            elif len(counts) < capacity:
+                counts[run] = 1
+            else:
+                # Amortized O(1): each decrement pays for an earlier increment.
+                decrements += 1
+                for key in list(counts):
+                    counts[key] -= 1
+                    if not counts[key]:
+                        del counts[key]
+
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    candidates = [
+        AcronymCandidate(acronym, count, decrements)
+        for acronym, count in ranked
+        if count >= min_count
+    ][:limit]
+    runs_per_identifier = total_runs / total_identifiers if total_identifiers else 0.0
+    return AcronymReport(
+        candidates,
+        total_identifiers,
+        total_runs,
+        runs_per_identifier * len(candidates),
+    )
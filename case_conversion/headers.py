@@ -0,0 +1,382 @@
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .utils import sanitized_acronym_set
+
+# Registered and widely deployed header field names in their canonical
+# spelling (IANA message headers registry and common de-facto headers).
+STANDARD_HEADERS = (
+    "A-IM",
+    "Accept",
+    "Accept-Additions",
+    "Accept-CH",
+    "Accept-Charset",
+    "Accept-Datetime",
+    "Accept-Encoding",
+    "Accept-Features",
+    "Accept-Language",
+    "Accept-Patch",
+    "Accept-Post",
+    "Accept-Ranges",
+    "Access-Control-Allow-Credentials",
+    "Access-Control-Allow-Headers",
+    "Access-Control-Allow-Methods",
+    "Access-Control-Allow-Origin",
+    "Access-Control-Expose-Headers",
+    "Access-Control-Max-Age",
+    "Access-Control-Request-Headers",
+    "Access-Control-Request-Method",
+    "Age",
+    "Allow",
+    "ALPN",
+    "Alt-Svc",
+    "Alt-Used",
+    "Alternates",
+    "Apply-To-Redirect-Ref",
+    "Authentication-Control",
+    "Authentication-Info",
+    "Authorization",
+    "C-Ext",
+    "C-Man",
+    "C-Opt",
+    "C-PEP",
+    "C-PEP-Info",
+    "Cache-Control",
+    "Cache-Status",
+    "Cal-Managed-ID",
+    "CalDAV-Timezones",
+    "Capsule-Protocol",
+    "CDN-Cache-Control",
+    "CDN-Loop",
+    "Cert-Not-After",
+    "Cert-Not-Before",
+    "Clear-Site-Data",
+    "Close",
+    "Connection",
+    "Content-Base",
+    "Content-Disposition",
+    "Content-DPR",
+    "Content-Encoding",
+    "Content-ID",
+    "Content-Language",
+    "Content-Length",
+    "Content-Location",
+    "Content-MD5",
+    "Content-Range",
+    "Content-Script-Type",
+    "Content-Security-Policy",
+    "Content-Security-Policy-Report-Only",
+    "Content-Style-Type",
+    "Content-Transfer-Encoding",
+    "Content-Type",
+    "Content-Version",
+    "Cookie",
+    "Cookie2",
+    "Cross-Origin-Embedder-Policy",
+    "Cross-Origin-Embedder-Policy-Report-Only",
+    "Cross-Origin-Opener-Policy",
+    "Cross-Origin-Opener-Policy-Report-Only",
+    "Cross-Origin-Resource-Policy",
+    "DASL",
+    "Date",
+    "DAV",
+    "Default-Style",
+    "Delta-Base",
+    "Depth",
+    "Derived-From",
+    "Destination",
+    "Device-Memory",
+    "Differential-ID",
+    "Digest",
+    "DNT",
+    "Downlink",
+    "DPR",
+    "Early-Data",
+    "ECT",
+    "EDIINT-Features",
+    "ETag",
+    "Expect",
+    "Expect-CT",
+    "Expires",
+    "Ext",
+    "Forwarded",
+    "From",
+    "GetProfile",
+    "Hobareg",
+    "Host",
+    "HTTP2-Settings",
+    "If",
+    "If-Match",
+    "If-Modified-Since",
+    "If-None-Match",
+    "If-Range",
+    "If-Schedule-Tag-Match",
+    "If-Unmodified-Since",
+    "IM",
+    "Include-Referred-Token-Binding-ID",
+    "Keep-Alive",
+    "Label",
+    "Large-Allocation",
+    "Last-Event-ID",
+    "Last-Modified",
+    "Link",
+    "Location",
+    "Lock-Token",
+    "Man",
+    "Max-Forwards",
+    "Memento-Datetime",
+    "Meter",
+    "MIME-Version",
+    "Negotiate",
+    "NEL",
+    "OData-EntityId",
+    "OData-Isolation",
+    "OData-MaxVersion",
+    "OData-Version",
+    "Opt",
+    "Optional-WWW-Authenticate",
+    "Ordering-Type",
+    "Origin",
+    "Origin-Agent-Cluster",
+    "OSCORE",
+    "OSLC-Core-Version",
+    "Overwrite",
+    "P3P",
+    "PEP",
+    "PEP-Info",
+    "Permissions-Policy",
+    "PICS-Label",
+    "Ping-From",
+    "Ping-To",
+    "Position",
+    "Pragma",
+    "Prefer",
+    "Preference-Applied",
+    "Priority",
+    "ProfileObject",
+    "Protocol",
+    "Protocol-Info",
+    "Protocol-Query",
+    "Protocol-Request",
+    "Proxy-Authenticate",
+    "Proxy-Authentication-Info",
+    "Proxy-Authorization",
+    "Proxy-Connection",
+    "Proxy-Features",
+    "Proxy-Instruction",
+    "Proxy-Status",
+    "Public",
+    "Public-Key-Pins",
+    "Public-Key-Pins-Report-Only",
+    "Range",
+    "Redirect-Ref",
+    "Referer",
+    "Referer-Root",
+    "Referrer-Policy",
+    "Refresh",
+    "Repeatability-Client-ID",
+    "Repeatability-First-Sent",
+    "Repeatability-Request-ID",
+    "Repeatability-Result",
+    "Replay-Nonce",
+    "Report-To",
+    "Retry-After",
+    "RTT",
+    "Safe",
+    "Save-Data",
+    "Schedule-Reply",
+    "Schedule-Tag",
+    "Sec-CH-UA",
+    "Sec-CH-UA-Arch",
+    "Sec-CH-UA-Bitness",
+    "Sec-CH-UA-Full-Version-List",
+    "Sec-CH-UA-Mobile",
+    "Sec-CH-UA-Model",
+    "Sec-CH-UA-Platform",
+    "Sec-CH-UA-Platform-Version",
+    "Sec-Fetch-Dest",
+    "Sec-Fetch-Mode",
+    "Sec-Fetch-Site",
+    "Sec-Fetch-User",
+    "Sec-GPC",
+    "Sec-Purpose",
+    "Sec-Token-Binding",
+    "Sec-WebSocket-Accept",
+    "Sec-WebSocket-Extensions",
+    "Sec-WebSocket-Key",
+    "Sec-WebSocket-Protocol",
+    "Sec-WebSocket-Version",
+    "Security-Scheme",
+    "Server",
+    "Server-Timing",
+    "Set-Cookie",
+    "Set-Cookie2",
+    "SetProfile",
+    "SLUG",
+    "SoapAction",
+    "SourceMap",
+    "Status-URI",
+    "Strict-Transport-Security",
+    "Sunset",
+    "Surrogate-Capability",
+    "Surrogate-Control",
+    "TCN",
+    "TE",
+    "Timeout",
+    "Timing-Allow-Origin",
+    "Topic",
+    "Traceparent",
+    "Tracestate",
+    "Trailer",
+    "Transfer-Encoding",
+    "TTL",
+    "UA-Color",
+    "UA-Media",
+    "UA-Pixels",
+    "UA-Resolution",
+    "UA-Windowpixels",
+    "Upgrade",
+    "Upgrade-Insecure-Requests",
+    "Urgency",
+    "URI",
+    "User-Agent",
+    "Variant-Vary",
+    "Vary",
+    "Version",
+    "Via",
+    "Viewport-Width",
+    "Want-Digest",
+    "Warning",
+    "Width",
+    "WWW-Authenticate",
+    "X-Amz-Date",
+    "X-Api-Key",
+    "X-B3-ParentSpanId",
+    "X-B3-Sampled",
+    "X-B3-SpanId",
+    "X-B3-TraceId",
+    "X-Cache",
+    "X-Content-Duration",
+    "X-Content-Type-Options",
+    "X-Correlation-ID",
+    "X-CSRF-Token",
+    "X-DNS-Prefetch-Control",
+    "X-Download-Options",
+    "X-Forwarded-For",
+    "X-Forwarded-Host",
+    "X-Forwarded-Port",
+    "X-Forwarded-Prefix",
+    "X-Forwarded-Proto",
+    "X-Frame-Options",
+    "X-HTTP-Method-Override",
+    "X-Permitted-Cross-Domain-Policies",
+    "X-Powered-By",
+    "X-Real-IP",
+    "X-Request-ID",
+    "X-Requested-With",
+    "X-Response-Time",
+    "X-Robots-Tag",
+    "X-Runtime",
+    "X-UA-Compatible",
+    "X-Wap-Profile",
+    "X-XSS-Protection",
+)
+
+# Canonical names, http_header results and word finders, see _tables.
+_Tables = Tuple[
+    Dict[str, str],
+    Dict[str, str],
+    Callable[[str], List[str]],
+    Callable[[str], List[str]],
+]
+_built: Optional[_Tables] = None
+
+
+def _tables() -> _Tables:
+    # Built on first use, so importing the package stays cheap.
+    global _built
+    if _built is None:
+        lower_words = re.compile(r"[a-z0-9]+").findall
+        lowered = {name.lower(): name for name in STANDARD_HEADERS}
+        http_headers = {
+            lower: "-".join([w.capitalize() for w in lower_words(lower)])
+            for lower in lowered
+        }
+        ascii_words = re.compile(r"[A-Za-z0-9]+").findall
+        _built = (lowered, http_headers, ascii_words, lower_words)
+    return _built
+
+
+def canonical_header(name: str, acronyms: Optional[List[str]] = None) -> str:
+    """Return the canonical spelling of an HTTP header field name.
+
+    Standard header names are looked up case-insensitively in a prebuilt
+    table (`STANDARD_HEADERS`), e.g. `www-authenticate` becomes
+    `WWW-Authenticate`. Other ASCII names are canonicalized in a single
+    pass: every alphanumeric run is a word, which is capitalized, or
+    upper-cased if it is a known acronym. Unlike `http_header` no
+    case-based word splitting is done, since header names are never
+    camelCased. Non-ASCII names fall back to `http_header`.
+
+    Args:
+        name (str): Header field name
+        acronyms (optional, list of str): List of acronyms to honor
+
+    Returns:
+        str: Canonical header field name
+
+    Examples:
+        >>> canonical_header("x-forwarded-for")
+        'X-Forwarded-For'
+        >>> canonical_header("WWW-AUTHENTICATE")
+        'WWW-Authenticate'
+        >>> canonical_header("x-trace-id", ["ID"])
+        'X-Trace-ID'
+    """
+    acronym_set = sanitized_acronym_set(tuple(acronyms)) if acronyms else frozenset()
+    if not name.isascii():
+        from .converter import http_header
+
+        return http_header(name, acronyms)
+
+    table, _, ascii_words, _ = _tables()
+    canonical = table.get(name.lower())
+    if canonical is not None:
+        if not acronym_set:
+            return canonical
+        return "-".join(
+            [w.upper() if w.upper() in acronym_set else w for w in canonical.split("-")]
+        )
+
+    return "-".join(
+        w.upper() if w.upper() in acronym_set else w.capitalize()
+        for w in ascii_words(name)
+    )
+
+
+def fast_http_header(text: str, acronyms: Optional[List[str]]) -> Optional[str]:
+    """Return http_header(text, acronyms) for lower-case ASCII input.
+
+    Header names usually arrive lower-cased (HTTP/2 requires it). For
+    such input the full parse_case pipeline reduces to capitalizing each
+    alphanumeric run, so it is skipped entirely.
+
+    Args:
+        text (str): Input string to be converted
+        acronyms (optional, list of str): List of acronyms to honor
+
+    Returns:
+        optional, str: Case converted text, or None if the fast path
+            does not apply and the caller has to fall back
+    """
+    if not text.isascii() or text != text.lower():
+        return None
+    if acronyms:
+        # Validate like parse_case does; http_header capitalizes every
+        # word, so known acronyms don't change the result.
+        sanitized_acronym_set(tuple(acronyms))
+    _, table, _, lower_words = _tables()
+    converted = table.get(text)
+    if converted is None:
+        converted = "-".join([w.capitalize() for w in lower_words(text)])
+    return converted
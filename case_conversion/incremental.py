@@ -0,0 +1,219 @@
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .acronyms import get_acronyms
+from .batch import Converter
+from .parser import _parse_case
+from .segmenter import _CLASSES, _TOKEN, fast_segment_string
+from .styles import style_of
+from .types import Case
+from .utils import (
+    advanced_acronym_detection,
+    determine_case,
+    normalize_words,
+    sanitize_acronyms,
+    sanitized_acronym_set,
+)
+
+
+def _detector(acronyms: List[str]) -> Callable[[List[str]], List[str]]:
+    # Result of the acronym detection for a closed run of upper-case
+    # letters, memoized per run for the whole batch.
+    detected: Dict[Tuple[str, ...], List[str]] = {}
+
+    def detect(run: List[str]) -> List[str]:
+        key = tuple(run)
+        words = detected.get(key)
+        if words is None:
+            if acronyms:
+                words = list(run)
+                advanced_acronym_detection(0, len(words), words, acronyms)
+            else:
+                words = ["".join(run)]
+            detected[key] = words
+        return words
+
+    return detect
+
+
+def _normalizer(
+    acronyms: List[str],
+) -> Tuple[Callable[[str], str], Callable[[str], Optional[str]]]:
+    # normalize_words works word by word, so its result is memoized per
+    # word for the whole batch. Dropped words normalize to "" and are
+    # left out.
+    normalized: Dict[str, str] = {}
+
+    def normalize(word: str) -> str:
+        result = normalized.get(word)
+        if result is None:
+            result = normalized[word] = "".join(normalize_words([word], acronyms))
+        return result
+
+    # The memo's get is handed out too, hits are resolved without a call
+    # to normalize.
+    return normalize, normalized.get
+
+
+def _common_prefix(a: str, b: str) -> int:
+    # Binary search, every comparison runs in C.
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def parse_many(
+    strings: Iterable[str],
+    acronyms: Optional[List[str]] = None,
+    preserve_case: bool = False,
+) -> List[Tuple[List[str], Case, str]]:
+    """Parse a batch of strings, sharing work between neighbours.
+
+    Each string is segmented incrementally: the words, letter-run results
+    and normalized words covering the longest common prefix with the
+    previous string are reused, only the differing suffix is scanned.
+    The saving is largest on sorted or grouped input, such as schema
+    dumps. Results are identical to `parse_case`, which is not consulted
+    or filled.
+
+    Args:
+        strings (iterable of str): Input strings to be parsed
+        acronyms (optional, list of str): List of acronyms to honor,
+            the registry's acronyms if None
+        preserve_case (bool): Whether to preserve case of acronym
+
+    Returns:
+        list of tuple: The `parse_case` result of every string
+
+    Examples:
+        >>> [words for words, _, _ in parse_many(["user_id", "user_name"])]
+        [['User', 'Id'], ['User', 'Name']]
+    """
+    if acronyms is None:
+        acronyms = list(get_acronyms().acronyms)
+    acronyms = sanitize_acronyms(acronyms)
+    detect = _detector(acronyms)
+    normalize, normalize_get = _normalizer(acronyms)
+
+    # State of the previous string. Per token: its end offset, and the
+    # number of words, normalized words and pending run letters after it.
+    previous = ""
+    ends: List[int] = []
+    states: List[Tuple[int, int, int]] = []
+    words: List[str] = []
+    normalized: List[str] = []
+    first_sep = -1
+
+    results = []
+    for string in strings:
+        if string.isupper():
+            # All upper-case strings are lowered before segmentation, they
+            # share nothing with their neighbours.
+            results.append(
+                _parse_case(string, acronyms, preserve_case, fast_segment_string)
+            )
+            previous = ""
+            continue
+
+        # A token is unchanged if the character after it, which decided
+        # its end, is still within the common prefix.
+        k = bisect_left(ends, _common_prefix(previous, string))
+        del ends[k:], states[k:]
+        if k:
+            word_count, normalized_count, run_count = states[-1]
+            del words[word_count:], normalized[normalized_count:]
+            # Run letters are single characters ending their tokens.
+            run = [string[end - 1] for end in ends[k - run_count :]]
+            start = ends[-1]
+        else:
+            words.clear()
+            normalized.clear()
+            run = []
+            start = 0
+        if first_sep >= k:
+            first_sep = -1
+
+        # Same letter-run detector as parse_case, fed one token at a time.
+        # A lone upper-case letter, class "u", is a run letter.
+        for token in _TOKEN.findall(string[start:].translate(_CLASSES)):
+            end = start + len(token)
+            if token == "u":
+                run.append(string[start])
+                ends.append(end)
+                states.append((len(words), len(normalized), len(run)))
+                start = end
+                continue
+            if run:
+                detected = detect(run)
+                words.extend(detected)
+                if not preserve_case:
+                    normalized.extend([n for n in map(normalize, detected) if n])
+                run = []
+            if token[0] == "s":
+                if first_sep < 0:
+                    first_sep = len(ends)
+            else:
+                word = string[start:end]
+                words.append(word)
+                if not preserve_case:
+                    normal = normalize_get(word)
+                    if normal is None:
+                        normal = normalize(word)
+                    if normal:
+                        normalized.append(normal)
+            ends.append(end)
+            states.append((len(words), len(normalized), 0))
+            start = end
+        previous = string
+
+        if first_sep < 0:
+            separator = ""
+        else:
+            separator = string[ends[first_sep - 1] if first_sep else 0]
+        # Runs closing the string are never merged.
+        parsed = words + run
+        case_type = determine_case(False, parsed, string)
+        if not preserve_case:
+            parsed = normalized + [n for n in map(normalize, run) if n]
+        results.append((parsed, case_type, separator))
+    return results
+
+
+def convert_sorted(
+    texts: Iterable[str], converter: Converter, acronyms: Optional[List[str]] = None
+) -> List[str]:
+    """Convert a sorted or grouped batch of strings.
+
+    Equivalent to `convert_many`, but parses with `parse_many`, so
+    strings sharing prefixes with their predecessor are cheaper to
+    convert. Converters of unregistered styles are called as usual.
+
+    Args:
+        texts (iterable of str): Input strings to be converted
+        converter (callable): Case converter, e.g. `camel` or `snake`
+        acronyms (optional, list of str): List of acronyms to honor,
+            the registry's acronyms if None
+
+    Returns:
+        list of str: Case converted texts
+
+    Examples:
+        >>> convert_sorted(["user_created_at", "user_id"], camel)
+        ['userCreatedAt', 'userId']
+    """
+    compiled = style_of(converter)
+    if compiled is None:
+        return [converter(text, acronyms) for text in texts]
+    if acronyms is None:
+        acronyms = list(get_acronyms().acronyms)
+    parsed = parse_many(texts, acronyms, compiled.preserve_case)
+    format = compiled.format
+    if compiled.uses_acronyms and acronyms:
+        lookup = sanitized_acronym_set(tuple(acronyms))
+        return [format(words, lookup) for words, _, _ in parsed]
+    return [format(words) for words, _, _ in parsed]
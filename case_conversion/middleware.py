@@ -0,0 +1,452 @@
+import asyncio
+import contextvars
+import io
+import itertools
+import json
+import threading
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .acronyms import get_acronyms
+from .batch import Converter, convert_keys
+from .cache import StripedCache
+
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[MutableMapping[str, Any], Receive, Send], Awaitable[None]]
+WSGIApp = Callable[[Dict[str, Any], Callable[..., Any]], Iterable[bytes]]
+
+JSON_CONTENT_TYPES = ("application/json",)
+
+
+class KeyCache:
+    """Memoizing key converter shared by all middleware using it.
+
+    Keys seen in earlier requests are converted with a single lookup.
+    Without explicit acronyms the acronyms in effect are used, those of
+    the registry or of a `cache_scope`, and keys are cached per version
+    of them, so requests in different scopes never see each other's
+    conversions.
+
+    Args:
+        converter (callable): Case converter, e.g. `camel` or `snake`
+        acronyms (optional, list of str): List of acronyms to honor
+        maxsize (int): Maximum number of cached keys
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        converter: Converter,
+        acronyms: Optional[List[str]] = None,
+        maxsize: int = 65536,
+    ) -> None:
+        self.converter = converter
+        self.acronyms = acronyms
+        self._cache = StripedCache(maxsize)
+
+    def __call__(self, key: str, acronyms: Optional[List[str]] = None) -> str:
+        """Return key converted, the acronyms argument is ignored."""
+        if self.acronyms is None:
+            registry = get_acronyms()
+            cache_key: Hashable = (key, registry.version)
+            converted = self._cache.get(cache_key)
+            if converted is None:
+                # Convert with the version the entry is cached under.
+                converted = self.converter(key, list(registry.acronyms))
+                self._cache.put(cache_key, converted)
+            return converted
+        converted = self._cache.get(key)
+        if converted is None:
+            converted = self.converter(key, self.acronyms)
+            self._cache.put(key, converted)
+        return converted
+
+    def convert_body(self, body: bytes) -> Optional[bytes]:
+        """Return a JSON body with converted keys, None if it isn't JSON.
+
+        Bodies nested too deeply to convert are treated like non-JSON.
+        """
+        try:
+            return json.dumps(
+                convert_keys(json.loads(body), self),
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+        except (ValueError, RecursionError):
+            return None
+
+
+_shared: Dict[Tuple[Converter, Optional[Tuple[str, ...]]], KeyCache] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_key_cache(
+    converter: Converter, acronyms: Optional[List[str]] = None
+) -> KeyCache:
+    """Return the process-wide KeyCache of a converter and acronyms."""
+    key = (converter, tuple(acronyms) if acronyms is not None else None)
+    with _shared_lock:
+        cache = _shared.get(key)
+        if cache is None:
+            cache = _shared[key] = KeyCache(converter, acronyms)
+        return cache
+
+
+class _Middleware:
+    def __init__(
+        self,
+        request_converter: Optional[Converter],
+        response_converter: Optional[Converter],
+        acronyms: Optional[List[str]],
+        content_types: Sequence[str],
+        max_body_size: Optional[int],
+    ) -> None:
+        self.request_keys = (
+            shared_key_cache(request_converter, acronyms) if request_converter else None
+        )
+        self.response_keys = (
+            shared_key_cache(response_converter, acronyms)
+            if response_converter
+            else None
+        )
+        self.content_types = frozenset(t.lower() for t in content_types)
+        self.max_body_size = max_body_size
+
+    def _matches(self, content_type: Optional[str]) -> bool:
+        if not content_type:
+            return False
+        return content_type.split(";", 1)[0].strip().lower() in self.content_types
+
+    def _fits(self, size: int) -> bool:
+        return self.max_body_size is None or size <= self.max_body_size
+
+    def _declared_fit(self, content_length: Optional[str]) -> bool:
+        # Bodies declared too large are passed through without reading.
+        try:
+            return self._fits(int(content_length or 0))
+        except ValueError:
+            return True
+
+
+def _set_header(
+    headers: List[Tuple[bytes, bytes]], name: bytes, value: bytes
+) -> List[Tuple[bytes, bytes]]:
+    return [(k, v) for k, v in headers if k.lower() != name] + [(name, value)]
+
+
+class ASGIMiddleware(_Middleware):
+    """ASGI middleware converting the keys of JSON bodies.
+
+    Request bodies are converted with `request_converter` before they
+    reach the app, response bodies with `response_converter` before they
+    are sent, e.g. snake_case for the app and camelCase for clients.
+    Only bodies whose content type is in `content_types` are converted.
+    Bodies larger than `max_body_size` are passed through unchanged,
+    bodies of at least `offload_threshold` bytes are converted in
+    `executor`, so the event loop isn't blocked. Converted keys are
+    memoized in a cache shared by all middleware of the process.
+
+    Args:
+        app (callable): ASGI application
+        request_converter (optional, callable): Converter of request
+            keys, e.g. `snake`, None to leave requests as they are
+        response_converter (optional, callable): Converter of response
+            keys, e.g. `camel`, None to leave responses as they are
+        acronyms (optional, list of str): List of acronyms to honor
+        content_types (sequence of str): Media types to convert
+        max_body_size (optional, int): Largest body in bytes to convert
+        offload_threshold (optional, int): Body size in bytes from which
+            conversion runs in the executor, never if None
+        executor (optional, Executor): Executor to offload to, the
+            loop's default executor if None
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        app: ASGIApp,
+        request_converter: Optional[Converter] = None,
+        response_converter: Optional[Converter] = None,
+        acronyms: Optional[List[str]] = None,
+        content_types: Sequence[str] = JSON_CONTENT_TYPES,
+        max_body_size: Optional[int] = None,
+        offload_threshold: Optional[int] = 1 << 16,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        super().__init__(
+            request_converter,
+            response_converter,
+            acronyms,
+            content_types,
+            max_body_size,
+        )
+        self.app = app
+        self.offload_threshold = offload_threshold
+        self.executor = executor
+
+    async def _convert(self, keys: KeyCache, body: bytes) -> Optional[bytes]:
+        if self.offload_threshold is not None and len(body) >= self.offload_threshold:
+            # Copying the context keeps an active cache_scope in effect.
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, contextvars.copy_context().run, keys.convert_body, body
+            )
+        return keys.convert_body(body)
+
+    async def __call__(  # noqa: D102
+        self, scope: MutableMapping[str, Any], receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if self.request_keys is not None and self._matches(
+            _header(scope["headers"], b"content-type")
+        ):
+            scope, receive = await self._convert_request(
+                scope, receive, self.request_keys
+            )
+        if self.response_keys is not None:
+            send = self._response_sender(send, self.response_keys)
+        await self.app(scope, receive, send)
+
+    async def _convert_request(
+        self, scope: MutableMapping[str, Any], receive: Receive, keys: KeyCache
+    ) -> Tuple[MutableMapping[str, Any], Receive]:
+        if not self._declared_fit(_header(scope["headers"], b"content-length")):
+            return scope, receive
+        messages = []
+        size = 0
+        while True:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                # Disconnected, let the app see it.
+                return scope, _replay(messages, receive)
+            size += len(message.get("body", b""))
+            if not self._fits(size):
+                # Too large to convert, stop buffering.
+                return scope, _replay(messages, receive)
+            if not message.get("more_body", False):
+                break
+        body = b"".join(m.get("body", b"") for m in messages)
+        converted = await self._convert(keys, body)
+        if converted is not None:
+            body = converted
+            scope = dict(scope)
+            scope["headers"] = _set_header(
+                list(scope["headers"]), b"content-length", str(len(body)).encode()
+            )
+        message = {"type": "http.request", "body": body, "more_body": False}
+        return scope, _replay([message], receive)
+
+    def _response_sender(self, send: Send, keys: KeyCache) -> Send:
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        size = 0
+
+        async def sender(message: Message) -> None:
+            nonlocal start, size
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                if self._matches(
+                    _header(headers, b"content-type")
+                ) and self._declared_fit(_header(headers, b"content-length")):
+                    start = message
+                    return
+            elif message["type"] == "http.response.body" and start is not None:
+                chunks.append(message.get("body", b""))
+                size += len(chunks[-1])
+                if message.get("more_body", False):
+                    if self._fits(size):
+                        return
+                    # Too large to convert, stream the rest unchanged.
+                    await send(start)
+                    start = None
+                    body = b"".join(chunks)
+                    chunks.clear()
+                    await send(dict(message, body=body))
+                    return
+                body = b"".join(chunks)
+                converted = None
+                if self._fits(len(body)):
+                    converted = await self._convert(keys, body)
+                headers = list(start.get("headers", []))
+                if converted is not None:
+                    body = converted
+                    headers = _set_header(
+                        headers, b"content-length", str(len(body)).encode()
+                    )
+                await send(dict(start, headers=headers))
+                start = None
+                await send({"type": "http.response.body", "body": body})
+                return
+            await send(message)
+
+        return sender
+
+
+def _header(headers: Iterable[Tuple[bytes, bytes]], name: bytes) -> Optional[str]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _replay(messages: List[Message], receive: Receive) -> Receive:
+    pending = list(messages)
+
+    async def replay() -> Message:
+        if pending:
+            return pending.pop(0)
+        return await receive()
+
+    return replay
+
+
+class WSGIMiddleware(_Middleware):
+    """WSGI middleware converting the keys of JSON bodies.
+
+    Works like `ASGIMiddleware`: request bodies are converted with
+    `request_converter`, response bodies with `response_converter`,
+    restricted to `content_types` and bodies of at most `max_body_size`
+    bytes. Responses of other content types are streamed unchanged.
+
+    Args:
+        app (callable): WSGI application
+        request_converter (optional, callable): Converter of request
+            keys, e.g. `snake`, None to leave requests as they are
+        response_converter (optional, callable): Converter of response
+            keys, e.g. `camel`, None to leave responses as they are
+        acronyms (optional, list of str): List of acronyms to honor
+        content_types (sequence of str): Media types to convert
+        max_body_size (optional, int): Largest body in bytes to convert
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        app: WSGIApp,
+        request_converter: Optional[Converter] = None,
+        response_converter: Optional[Converter] = None,
+        acronyms: Optional[List[str]] = None,
+        content_types: Sequence[str] = JSON_CONTENT_TYPES,
+        max_body_size: Optional[int] = None,
+    ) -> None:
+        super().__init__(
+            request_converter,
+            response_converter,
+            acronyms,
+            content_types,
+            max_body_size,
+        )
+        self.app = app
+
+    def __call__(  # noqa: D102
+        self, environ: Dict[str, Any], start_response: Callable[..., Any]
+    ) -> Iterable[bytes]:
+        if self.request_keys is not None and self._matches(environ.get("CONTENT_TYPE")):
+            self._convert_request(environ)
+        if self.response_keys is None:
+            return self.app(environ, start_response)
+        return self._convert_response(environ, start_response)
+
+    def _convert_request(self, environ: Dict[str, Any]) -> None:
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            return
+        if not length or not self._fits(length):
+            return
+        body = environ["wsgi.input"].read(length)
+        converted = self.request_keys.convert_body(body)  # type: ignore
+        if converted is not None:
+            body = converted
+        environ["wsgi.input"] = io.BytesIO(body)
+        environ["CONTENT_LENGTH"] = str(len(body))
+
+    def _convert_response(
+        self, environ: Dict[str, Any], start_response: Callable[..., Any]
+    ) -> Iterable[bytes]:
+        started: List[Any] = []
+        buffered: List[bytes] = []
+
+        def capture(
+            status: str, headers: List[Tuple[str, str]], exc_info: Any = None
+        ) -> Callable[[bytes], Any]:
+            content_type = next(
+                (v for k, v in headers if k.lower() == "content-type"), None
+            )
+            content_length = next(
+                (v for k, v in headers if k.lower() == "content-length"), None
+            )
+            if (
+                exc_info is not None
+                or not self._matches(content_type)
+                or not self._declared_fit(content_length)
+            ):
+                started.append(None)
+                return start_response(status, headers, exc_info)
+            started.append((status, headers))
+            return buffered.append
+
+        result = self.app(environ, capture)
+        iterator = iter(result)
+        # Generator apps only call start_response on first iteration.
+        first = [] if started else list(itertools.islice(iterator, 1))
+        if not started or started[-1] is None:
+            return _Chained(first, iterator, result)
+
+        status, headers = started[-1]
+        buffered.extend(first)
+        size = sum(map(len, buffered))
+        try:
+            for chunk in iterator:
+                buffered.append(chunk)
+                size += len(chunk)
+                if not self._fits(size):
+                    # Too large to convert, stream the rest unchanged.
+                    start_response(status, headers)
+                    return _Chained(buffered, iterator, result)
+        except BaseException:
+            _close(result)
+            raise
+        _close(result)
+        body = b"".join(buffered)
+        converted = self.response_keys.convert_body(body)  # type: ignore
+        if converted is not None:
+            body = converted
+            headers = [(k, v) for k, v in headers if k.lower() != "content-length"]
+            headers.append(("Content-Length", str(len(body))))
+        start_response(status, headers)
+        return [body]
+
+
+class _Chained:
+    # Passes the app's response through, keeping its close() method.
+
+    def __init__(self, first: List[bytes], rest: Iterable[bytes], result: Any) -> None:
+        self._iterator = itertools.chain(first, rest)
+        self._result = result
+
+    def __iter__(self) -> Any:
+        return self._iterator
+
+    def close(self) -> None:
+        _close(self._result)
+
+
+def _close(result: Any) -> None:
+    close = getattr(result, "close", None)
+    if close is not None:
+        close()
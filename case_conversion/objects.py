@@ -0,0 +1,148 @@
+import dataclasses
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .acronyms import get_acronyms
+from .batch import Converter
+
+
+class FieldConverter(NamedTuple):
+    """Specialized field renaming functions for one class and style.
+
+    Attributes:
+        names (dict of str to str): Attribute name, mangled for private
+            slots, to converted key
+        to_dict (callable): Return a dict with converted keys for an
+            instance of the class
+        from_dict (callable): Return a new instance of the class from a
+            dict with converted keys
+    """
+
+    names: Dict[str, str]
+    to_dict: Callable[[Any], Dict[str, Any]]
+    from_dict: Callable[[Dict[str, Any]], Any]
+
+
+_CacheKey = Tuple[type, Converter, Optional[Tuple[str, ...]]]
+_converters: Dict[_CacheKey, FieldConverter] = {}
+
+_MISSING = object()
+
+
+def _mangle(cls: type, name: str) -> str:
+    # Private names in __slots__ are stored mangled, like in the class body.
+    owner = cls.__name__.lstrip("_")
+    if name.startswith("__") and not name.endswith("__") and owner:
+        return f"_{owner}{name}"
+    return name
+
+
+def _fields(cls: type) -> List[Tuple[str, str, bool, bool]]:
+    # (field name, attribute name, passed to __init__, has a default) for
+    # every field.
+    if dataclasses.is_dataclass(cls):
+        return [
+            (
+                f.name,
+                f.name,
+                f.init,
+                f.default is not dataclasses.MISSING
+                or f.default_factory is not dataclasses.MISSING,  # type: ignore
+            )
+            for f in dataclasses.fields(cls)
+        ]
+    fields: Dict[str, str] = {}
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__"):
+                fields.setdefault(_mangle(klass, name), name)
+    if not fields:
+        raise TypeError(f"{cls.__name__} is neither a dataclass nor uses __slots__")
+    return [(name, attribute, False, True) for attribute, name in fields.items()]
+
+
+def _compile(cls: type, names: Dict[str, str]) -> FieldConverter:
+    fields = _fields(cls)
+    lines = ["def to_dict(obj):"]
+    if dataclasses.is_dataclass(cls):
+        lines.append("    return {")
+        lines += [f"        {names[a]!r}: obj.{a}," for _, a, _, _ in fields]
+        lines.append("    }")
+    else:
+        # Slots may be unset, those are left out.
+        lines.append("    data = {}")
+        for _, attribute, _, _ in fields:
+            lines.append(f"    value = getattr(obj, {attribute!r}, MISSING)")
+            lines.append("    if value is not MISSING:")
+            lines.append(f"        data[{names[attribute]!r}] = value")
+        lines.append("    return data")
+    lines += ["", "def from_dict(data):"]
+    if dataclasses.is_dataclass(cls):
+        lines.append("    kwargs = {}")
+        for name, _, init, has_default in fields:
+            if not init:
+                continue
+            key = names[name]
+            if has_default:
+                lines.append(f"    if {key!r} in data:")
+                lines.append(f"        kwargs[{name!r}] = data[{key!r}]")
+            else:
+                lines.append(f"    kwargs[{name!r}] = data[{key!r}]")
+        lines.append("    return cls(**kwargs)")
+    else:
+        lines.append("    obj = cls.__new__(cls)")
+        for _, attribute, _, _ in fields:
+            key = names[attribute]
+            lines.append(f"    if {key!r} in data:")
+            lines.append(f"        obj.{attribute} = data[{key!r}]")
+        lines.append("    return obj")
+
+    namespace: Dict[str, Any] = {"cls": cls, "MISSING": _MISSING}
+    exec("\n".join(lines), namespace)
+    return FieldConverter(names, namespace["to_dict"], namespace["from_dict"])
+
+
+def field_converter(
+    cls: type, converter: Converter, acronyms: Optional[List[str]] = None
+) -> FieldConverter:
+    """Return field renaming functions for a dataclass or __slots__ class.
+
+    The field names are converted once per class, style and acronyms.
+    The returned `to_dict`/`from_dict` functions are generated for the
+    class with the converted keys inlined, so no converter is called per
+    instance. Field values are copied as-is, nested objects are not
+    converted. Unset slots are left out of `to_dict`.
+
+    Args:
+        cls (type): Dataclass or class defining __slots__
+        converter (callable): Case converter, e.g. `camel` or `snake`
+        acronyms (optional, list of str): List of acronyms to honor,
+            the registry's acronyms if None
+
+    Returns:
+        FieldConverter: Converted names and the generated functions
+
+    Raises:
+        TypeError: If cls is neither a dataclass nor uses __slots__
+        ValueError: If two fields convert to the same key
+
+    Examples:
+        >>> @dataclass
+        ... class User:
+        ...     user_id: int
+        >>> field_converter(User, camel).to_dict(User(1))
+        {'userId': 1}
+    """
+    if acronyms is None:
+        acronyms = list(get_acronyms().acronyms)
+    key = (cls, converter, tuple(acronyms) if acronyms else None)
+    compiled = _converters.get(key)
+    if compiled is None:
+        names = {
+            attribute: converter(name, acronyms)
+            for name, attribute, _, _ in _fields(cls)
+        }
+        if len(set(names.values())) != len(names):
+            raise ValueError(f"{cls.__name__} has fields converting to the same key")
+        compiled = _converters[key] = _compile(cls, names)
+    return compiled
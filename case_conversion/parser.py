@@ -1,10 +1,14 @@
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
 
+from .acronyms import AcronymSet, get_acronyms
+from .cache import get_cache
+from .segmenter import BoundaryRules, compile_segmenter, fast_segment_string
 from .types import Case
 from .utils import (
     advanced_acronym_detection,
     determine_case,
     is_upper,
+    normalize_unicode,
     normalize_words,
     sanitize_acronyms,
     segment_string,
@@ -12,15 +16,68 @@ from .utils import (
 )
 
 
+Segmenter = Callable[[str], Tuple[List[Optional[str]], str, bool]]
+
+# Interchangeable segmentation engines. "reference" is the original
+# per-character implementation, every other engine has to produce
+# identical results (see tests/test_engines.py).
+ENGINES: Dict[str, Segmenter] = {
+    "reference": segment_string,
+    "fast": fast_segment_string,
+}
+DEFAULT_ENGINE = "fast"
+
+# Name of an engine, or custom word boundary rules.
+Engine = Union[str, BoundaryRules]
+
+
+def get_segmenter(engine: Optional[Engine] = None) -> Segmenter:
+    """Return the segmentation function of an engine.
+
+    Args:
+        engine (optional, str or BoundaryRules): Name of the engine,
+            DEFAULT_ENGINE if None, or custom word boundary rules
+
+    Returns:
+        callable: Segmentation function with the signature of
+            `segment_string`
+
+    Raises:
+        ValueError: If the engine is unknown
+    """
+    if isinstance(engine, BoundaryRules):
+        return compile_segmenter(engine)
+    try:
+        return ENGINES[engine or DEFAULT_ENGINE]
+    except KeyError:
+        raise ValueError(f"Case Conversion: unknown engine '{engine}'.") from None
+
+
 def parse_case(
-    string: str, acronyms: Optional[List[str]] = None, preserve_case: bool = False,
+    string: str,
+    acronyms: Optional[Union[Sequence[str], AcronymSet]] = None,
+    preserve_case: bool = False,
+    engine: Optional[Engine] = None,
+    normalize: Optional[str] = None,
 ) -> Tuple[List[str], Case, str]:
     """Split a string into words, determine its case and seperator.
 
+    Results are memoized in a bounded, thread-safe cache, see
+    `case_conversion.cache`. Results are cached per engine, so a cached
+    result never stands in for another engine's, e.g. when checking an
+    engine against "reference". Normalized strings are cached under their
+    normalized form.
+
     Args:
         string (str): Input string to be converted
-        acronyms (optional, list of str): List of acronyms to honor
+        acronyms (optional, list of str or AcronymSet): List of acronyms
+            to honor, the registry's acronyms if None
         preserve_case (bool): Whether to preserve case of acronym
+        engine (optional, str or BoundaryRules): Segmentation engine,
+            "reference" or "fast", DEFAULT_ENGINE if None, or custom
+            word boundary rules
+        normalize (optional, str): Unicode normalization form to apply
+            first, "NFC" or "NFKC"
 
     Returns:
         list of str: Segmented input string
@@ -35,7 +92,39 @@ def parse_case(
         >>> parse_case("helloHtmlWorld", ["HTML"], True)
         ["Hello", "Html", World"], Case.CAMEL, None
     """
-    words_with_sep, separator, was_upper = segment_string(string)
+    segment = get_segmenter(engine)
+    if normalize:
+        string = normalize_unicode(string, normalize)
+    cache = get_cache()
+    if acronyms is None:
+        acronyms = get_acronyms()
+    tag: Optional[Hashable]
+    if isinstance(acronyms, AcronymSet):
+        # Registry results are tagged with its version, so a swap never
+        # serves stale results and the old entries can be told apart.
+        tag = acronyms.version if acronyms.acronyms else None
+        acronyms = list(acronyms.acronyms) if tag else None
+    else:
+        tag = tuple(acronyms) if acronyms else None
+    key = (string, tag, preserve_case, engine or DEFAULT_ENGINE)
+    cached = cache.get(key)
+    if cached is None:
+        words, case_type, separator = _parse_case(
+            string, acronyms, preserve_case, segment
+        )
+        cache.put(key, (tuple(words), case_type, separator))
+        return words, case_type, separator
+    # Hand out a fresh list, callers are free to mutate it.
+    return list(cached[0]), cached[1], cached[2]
+
+
+def _parse_case(
+    string: str,
+    acronyms: Optional[Sequence[str]],
+    preserve_case: bool,
+    segment: Segmenter = segment_string,
+) -> Tuple[List[str], Case, str]:
+    words_with_sep, separator, was_upper = segment(string)
 
     if acronyms:
         # Use advanced acronym detection with list
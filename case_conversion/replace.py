@@ -0,0 +1,121 @@
+import re
+from typing import (
+    IO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Pattern,
+    Union,
+)
+
+from .batch import Converter
+from .styles import _lookup
+
+# Letters, digits and underscores, not starting with a digit. Compiled
+# on first use, so importing the package stays cheap.
+IDENTIFIER = r"[^\W\d]\w*"
+
+_CHUNK_SIZE = 1 << 16
+
+
+def _converter(style: Union[str, Converter]) -> Converter:
+    return _lookup(style)[1] if isinstance(style, str) else style
+
+
+def _replacer(
+    converter: Converter, acronyms: Optional[List[str]]
+) -> Callable[[Match[str]], str]:
+    # Every distinct identifier is converted once per call.
+    converted: Dict[str, str] = {}
+
+    def replace(match: Match[str]) -> str:
+        identifier = match.group()
+        result = converted.get(identifier)
+        if result is None:
+            result = converted[identifier] = converter(identifier, acronyms)
+        return result
+
+    return replace
+
+
+def _chunks(stream: Union[Iterable[str], IO[str]]) -> Iterator[str]:
+    read = getattr(stream, "read", None)
+    if read is None:
+        yield from stream  # type: ignore
+        return
+    while True:
+        chunk = read(_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _stream(
+    chunks: Iterator[str], regex: Pattern[str], replace: Callable[[Match[str]], str]
+) -> Iterator[str]:
+    carry = ""
+    for chunk in chunks:
+        buffer = carry + chunk
+        pieces = []
+        pos = 0
+        hold = len(buffer)
+        for match in regex.finditer(buffer):
+            start, end = match.span()
+            if end == len(buffer):
+                # The identifier may continue in the next chunk, so it is
+                # held back until more text arrives.
+                hold = start
+                break
+            pieces.append(buffer[pos:start])
+            pieces.append(replace(match))
+            pos = end
+        pieces.append(buffer[pos:hold])
+        yield "".join(pieces)
+        carry = buffer[hold:]
+    if carry:
+        yield regex.sub(replace, carry)
+
+
+def replace_identifiers(
+    text_or_stream: Union[str, Iterable[str], IO[str]],
+    style: Union[str, Converter],
+    pattern: Optional[Union[str, Pattern[str]]] = None,
+    acronyms: Optional[List[str]] = None,
+) -> Union[str, Iterator[str]]:
+    """Convert every identifier embedded in text to another case style.
+
+    Identifiers are found with a single compiled regex scan and each
+    distinct identifier is converted only once.
+
+    A str is converted as a whole and returned as str. Any other input,
+    a text file or an iterable of str chunks, is converted lazily and an
+    iterator of converted chunks is returned. Identifiers crossing chunk
+    boundaries are held back until complete, which assumes that a match
+    can't start before the last match of a chunk touching its end.
+
+    Args:
+        text_or_stream (str, text file or iterable of str): Input text
+        style (str or callable): Name of a registered style or a
+            converter, e.g. "snake" or `snake`
+        pattern (optional, str or compiled regex): Pattern matching the
+            identifiers, `IDENTIFIER` by default
+        acronyms (optional, list of str): List of acronyms to honor
+
+    Returns:
+        str or iterator of str: Converted text or chunks
+
+    Examples:
+        >>> replace_identifiers("SELECT userId FROM orderItems", "snake")
+        'select user_id from order_items'
+        >>> replace_identifiers("{{ userName }}", "snake", r"[a-z]\\w*")
+        '{{ user_name }}'
+    """
+    regex = re.compile(IDENTIFIER if pattern is None else pattern)
+    replace = _replacer(_converter(style), acronyms)
+    if isinstance(text_or_stream, str):
+        return regex.sub(replace, text_or_stream)
+    return _stream(_chunks(text_or_stream), regex, replace)
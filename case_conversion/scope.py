@@ -0,0 +1,78 @@
+import itertools
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from . import acronyms as _acronyms
+from . import cache as _cache
+from .acronyms import AcronymSet
+from .cache import StripedCache
+from .utils import sanitize_acronyms
+
+# Scoped acronym sets count down from -1, so their versions never clash
+# with the registry's or each other's in version-tagged caches.
+_versions = itertools.count(-1, -1)
+_versions_lock = threading.Lock()
+
+
+class CacheScope(NamedTuple):
+    """State of a `cache_scope`.
+
+    Attributes:
+        cache (StripedCache): Parse cache of the scope
+        acronyms (optional, AcronymSet): Acronyms of the scope, None if
+            those of the enclosing scope or the registry are honored
+    """
+
+    cache: StripedCache
+    acronyms: Optional[AcronymSet]
+
+
+@contextmanager
+def cache_scope(
+    maxsize: int = 4096, acronyms: Optional[Iterable[str]] = None
+) -> Iterator[CacheScope]:
+    """Give the current context its own parse cache and acronyms.
+
+    Within the scope, every converter and `parse_case` memoize into a
+    cache of the scope instead of the process-wide one, and honor the
+    acronyms of the scope instead of the registry's when called without
+    acronyms. The state is held in context variables, so concurrent
+    asyncio tasks and threads each see their own scope, and tasks started
+    within a scope inherit it. Scopes nest, the innermost one counts. On
+    exit the cache is cleared and the enclosing state restored.
+
+    Args:
+        maxsize (int): Maximum number of cached parse results, 0
+            disables caching
+        acronyms (optional, iterable of str): Acronyms of the scope,
+            empty to honor none; if None, those of the enclosing scope
+            or the registry
+
+    Yields:
+        CacheScope: Cache and acronyms of the scope
+
+    Raises:
+        InvalidAcronymError: Upon encountering an invalid acronym
+
+    Examples:
+        >>> with cache_scope(maxsize=1024, acronyms=["HTTP"]):
+        ...     snake("HTTPServer")
+        'http_server'
+    """
+    acronym_set = None
+    if acronyms is not None:
+        sanitized = tuple(sanitize_acronyms(list(acronyms)))
+        with _versions_lock:
+            version = next(_versions)
+        acronym_set = AcronymSet(version, sanitized, frozenset(sanitized))
+    scope = CacheScope(StripedCache(maxsize), acronym_set)
+
+    cache_token = _cache._scoped_cache.set(scope.cache)
+    acronyms_token = _acronyms._scoped.set(acronym_set or _acronyms._scoped.get())
+    try:
+        yield scope
+    finally:
+        _acronyms._scoped.reset(acronyms_token)
+        _cache._scoped_cache.reset(cache_token)
+        scope.cache.clear()
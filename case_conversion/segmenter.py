@@ -0,0 +1,152 @@
+import re
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, NamedTuple, Optional, Pattern, Tuple
+
+from .utils import char_is_decimal, char_is_lower, char_is_upper
+
+
+class _ClassTable(Dict[int, str]):
+    # Code point -> character class, filled in on first sight of a code
+    # point so str.translate() classifies a whole string in one C loop.
+    # u: upper-case letter, l: lower-case letter, d: decimal, s: separator.
+
+    def __missing__(self, code: int) -> str:
+        char = chr(code)
+        if char_is_upper(char):
+            cls = "u"
+        elif char_is_lower(char):
+            cls = "l"
+        elif char_is_decimal(char):
+            cls = "d"
+        else:
+            cls = "s"
+        self[code] = cls
+        return cls
+
+
+_CLASSES = _ClassTable()
+# A word starts with any non-separator and continues until the next
+# upper-case letter or separator, separator runs collapse into one.
+_TOKEN = re.compile(r"s+|[uld][ld]*")
+# Same, but runs of digits form words of their own. Compiled on first
+# use by compile_segmenter.
+_DIGIT_TOKEN = r"s+|d+|[ul]l*"
+
+
+def fast_segment_string(
+    string: str,
+    table: Dict[int, str] = _CLASSES,
+    pattern: Pattern[str] = _TOKEN,
+    upper_table: Optional[Dict[int, str]] = None,
+) -> Tuple[List[Optional[str]], str, bool]:
+    """Segment string on separator into list of words.
+
+    Table-driven equivalent of `segment_string`: the string is mapped to
+    a string of character classes with str.translate, and the words are
+    found with a regex over the classes instead of a per-character loop.
+
+    Arguments:
+        string (str): The string to process
+        table (dict): Code point to character class table
+        pattern (compiled regex): Pattern of words and separators over the
+            character classes
+        upper_table (optional, dict): Table of all upper-case strings,
+            which are lower-cased first, `table` if None
+
+    Returns:
+        optional, list of str: List of words the string got minced to
+        separator: The separator char intersecting words
+        bool: Whether the string was upper-case
+    """
+    was_upper = string.isupper()
+    if was_upper:
+        string = string.lower()
+        if upper_table is not None:
+            table = upper_table
+    words: List[Optional[str]] = []
+    separator = ""
+    start = 0
+    for token in pattern.findall(string.translate(table)):
+        end = start + len(token)
+        if token[0] == "s":
+            if not separator:
+                separator = string[start]
+            words.append(None)
+        else:
+            words.append(string[start:end])
+        start = end
+    return words, separator, was_upper
+
+
+class BoundaryRules(NamedTuple):
+    """Word boundary rules of a segmenter.
+
+    By default an upper-case letter starts a word and every character
+    that is neither a letter nor a decimal separates words.
+
+    Attributes:
+        digit_boundaries: Whether runs of decimals are words of their own
+        separators: Additional characters that separate words
+        keep: Characters that never split words, e.g. "'"
+    """
+
+    digit_boundaries: bool = False
+    separators: str = ""
+    keep: str = ""
+
+
+def _rule_classes(rules: BoundaryRules, upper: bool) -> _ClassTable:
+    classes = {c: "s" for c in rules.separators}
+    # Kept characters act like lower-case letters, which never start a
+    # word, but are copied from the input as they are.
+    classes.update({c: "l" for c in rules.keep})
+    if upper:
+        # All upper-case strings are lower-cased before they are
+        # classified, their lower-case letters stem from upper-case ones.
+        # Rules of lower-case letters don't apply to them.
+        classes = {
+            c.lower(): cls
+            for c, cls in classes.items()
+            if c.isupper() or c.lower() == c.upper()
+        }
+    return _ClassTable({ord(c): cls for c, cls in classes.items() if len(c) == 1})
+
+
+# Rules may come from user input, so the compiled segmenters are bounded.
+@lru_cache(maxsize=256)
+def compile_segmenter(
+    rules: BoundaryRules,
+) -> Callable[[str], Tuple[List[Optional[str]], str, bool]]:
+    """Return a segmentation function implementing rules.
+
+    The rules are compiled into a character class table and a word
+    pattern, so segmenting runs the same code as `fast_segment_string`.
+
+    Args:
+        rules (BoundaryRules): Word boundary rules
+
+    Returns:
+        callable: Segmentation function with the signature of
+            `segment_string`
+
+    Raises:
+        ValueError: If a character is both a separator and kept
+
+    Examples:
+        >>> segment = compile_segmenter(BoundaryRules(digit_boundaries=True))
+        >>> segment("utf8Decoder")
+        (['utf', '8', 'Decoder'], '', False)
+    """
+    overlap = set(rules.separators) & set(rules.keep)
+    if overlap:
+        raise ValueError(
+            f"Case Conversion: '{''.join(sorted(overlap))}' can't be "
+            "separators and kept at once."
+        )
+    pattern = re.compile(_DIGIT_TOKEN) if rules.digit_boundaries else _TOKEN
+    return partial(
+        fast_segment_string,
+        table=_rule_classes(rules, False),
+        pattern=pattern,
+        upper_table=_rule_classes(rules, True),
+    )
@@ -0,0 +1,271 @@
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .acronyms import get_acronyms
+from .parser import Engine, parse_case
+from .types import Converter
+from .utils import sanitized_acronym_set
+
+# Word rule -> expression template applied to a single word.
+WORD_RULES = {
+    "keep": "{0}",
+    "preserve": "{0}",
+    "lower": "{0}.lower()",
+    "upper": "{0}.upper()",
+    "capitalize": "{0}.capitalize()",
+}
+
+# Called with the style name and arguments of every conversion while a
+# traffic capture is running, see capture.py.
+_observer: Optional[Callable[..., None]] = None
+
+
+class Style(NamedTuple):
+    """Declarative description of a case style.
+
+    Word rules are one of:
+        keep: Keep the word as normalized by parse_case, i.e.
+         capitalized, or upper-case if it is a known acronym.
+        preserve: Keep the word in its original case. Using it for
+         either first_word or other_words parses the text with
+         `preserve_case`.
+        lower, upper, capitalize: Apply the str method of that name.
+
+    Attributes:
+        name (str): Name of the style
+        separator (str): String joining the words
+        first_word (str): Word rule for the first word
+        other_words (str): Word rule for all other words
+        acronym_words (optional, str): Word rule for known acronyms,
+            overriding first_word and other_words
+        prefix (str): String prepended to non-empty results
+        suffix (str): String appended to non-empty results
+    """
+
+    name: str
+    separator: str = ""
+    first_word: str = "keep"
+    other_words: str = "keep"
+    acronym_words: Optional[str] = None
+    prefix: str = ""
+    suffix: str = ""
+
+
+def _word(rule: str, acronym_rule: Optional[str], var: str) -> str:
+    expr = WORD_RULES[rule].format(var)
+    if acronym_rule is None:
+        return expr
+    acronym_expr = WORD_RULES[acronym_rule].format(var)
+    return f"({acronym_expr} if {var}.upper() in acronyms else {expr})"
+
+
+def _check_rules(style: Style) -> None:
+    for rule in (style.first_word, style.other_words, style.acronym_words):
+        if rule is not None and rule not in WORD_RULES:
+            raise ValueError(f"Case Conversion: unknown word rule '{rule}'.")
+
+
+def compile_formatter(style: Style, binary: bool = False) -> Callable[..., Any]:
+    """Compile a style into a function formatting a list of parsed words.
+
+    The function is generated for the style, with its rules inlined, so
+    formatting a declared style costs the same as a hand-written one.
+
+    Args:
+        style (Style): Style to compile
+        binary (bool): Whether to format bytes instead of str words
+
+    Returns:
+        callable: `format(words, acronyms=frozenset())` returning the
+            formatted string, acronyms being the sanitized acronym set
+
+    Raises:
+        ValueError: If the style uses an unknown word rule
+    """
+    _check_rules(style)
+    first = _word(style.first_word, style.acronym_words, "words[0]")
+    other = _word(style.other_words, style.acronym_words, "w")
+    if other == "w":
+        every, rest = "SEP.join(words)", "SEP.join(words[1:])"
+    else:
+        every = f"SEP.join([{other} for w in words])"
+        rest = f"SEP.join([{other} for w in words[1:]])"
+    if style.first_word == style.other_words:
+        joined = every
+    else:
+        joined = f"{first} + SEP + {rest} if len(words) > 1 else {first}"
+    if style.prefix or style.suffix:
+        joined = f"PREFIX + ({joined}) + SUFFIX"
+
+    source = "\n".join(
+        [
+            "def format(words, acronyms=NO_ACRONYMS):",
+            "    if not words:",
+            "        return EMPTY",
+            f"    return {joined}",
+        ]
+    )
+    encode = (lambda s: s.encode()) if binary else (lambda s: s)
+    namespace: Dict[str, Any] = {
+        "SEP": encode(style.separator),
+        "PREFIX": encode(style.prefix),
+        "SUFFIX": encode(style.suffix),
+        "EMPTY": encode(""),
+        "NO_ACRONYMS": frozenset(),
+    }
+    exec(source, namespace)
+    return namespace["format"]
+
+
+class CompiledStyle:
+    """Style compiled into a specialized formatter.
+
+    Args:
+        style (Style): Style to compile
+    """
+
+    __slots__ = ("style", "preserve_case", "format", "uses_acronyms")
+
+    def __init__(self, style: Style) -> None:  # noqa: D107
+        _check_rules(style)
+        self.style = style
+        self.preserve_case = "preserve" in (style.first_word, style.other_words)
+        self.uses_acronyms = style.acronym_words is not None
+        # Compiled on first use, so declaring styles at import time is cheap.
+        self.format: Callable[..., str] = self._compile_and_format
+
+    def _compile_and_format(self, *args: Any) -> str:
+        self.format = compile_formatter(self.style)
+        return self.format(*args)
+
+    def convert(
+        self,
+        text: str,
+        acronyms: Optional[List[str]] = None,
+        engine: Optional[Engine] = None,
+        normalize: Optional[str] = None,
+    ) -> str:
+        """Return text converted to the style.
+
+        Args:
+            text (str): Input string to be converted
+            acronyms (optional, list of str): List of acronyms to honor,
+                the registry's acronyms if None
+            engine (optional, str or BoundaryRules): Segmentation engine,
+                see parse_case
+            normalize (optional, str): Unicode normalization form, see
+                parse_case
+
+        Returns:
+            str: Case converted text
+        """
+        if _observer is not None:
+            _observer(self.style.name, text, acronyms, engine, normalize)
+        if acronyms is None:
+            # Read the registry once, so parsing and formatting agree
+            # even if it is swapped meanwhile.
+            registry = get_acronyms()
+            words, *_ = parse_case(
+                text, registry, self.preserve_case, engine, normalize
+            )
+            if self.uses_acronyms and registry.acronyms:
+                return self.format(words, registry.lookup)
+            return self.format(words)
+        words, *_ = parse_case(text, acronyms, self.preserve_case, engine, normalize)
+        if self.uses_acronyms and acronyms:
+            return self.format(words, sanitized_acronym_set(tuple(acronyms)))
+        return self.format(words)
+
+
+_registry: Dict[str, Tuple[CompiledStyle, Converter]] = {}
+_by_converter: Dict[Converter, CompiledStyle] = {}
+
+
+def _add(compiled: CompiledStyle, converter: Converter) -> Converter:
+    name = compiled.style.name
+    if name in _registry:
+        raise ValueError(f"Case Conversion: style '{name}' is already registered.")
+    _registry[name] = (compiled, converter)
+    _by_converter[converter] = compiled
+    return converter
+
+
+def register_style(style: Style) -> Converter:
+    """Register a custom case style.
+
+    Args:
+        style (Style): Style to register
+
+    Returns:
+        callable: Converter with the common
+            `(text, acronyms=None, engine=None, normalize=None)` signature
+
+    Raises:
+        ValueError: If the name is taken or a word rule is unknown
+
+    Examples:
+        >>> dunder = register_style(Style("dunder", "_", "lower", "lower",
+        ...                               prefix="__", suffix="__"))
+        >>> dunder("fooBar")
+        '__foo_bar__'
+    """
+    compiled = CompiledStyle(style)
+    converter = compiled.convert
+    return _add(compiled, converter)
+
+
+def get_style(name: str) -> Style:
+    """Return the registered style of that name.
+
+    Args:
+        name (str): Name of the style
+
+    Returns:
+        Style: Style declaration
+
+    Raises:
+        ValueError: If no style of that name is registered
+    """
+    return _lookup(name)[0].style
+
+
+def style_of(converter: Converter) -> Optional[CompiledStyle]:
+    """Return the compiled style behind a converter, if there is one."""
+    return _by_converter.get(converter)
+
+
+def _lookup(name: str) -> Tuple[CompiledStyle, Converter]:
+    try:
+        return _registry[name]
+    except KeyError:
+        raise ValueError(f"Case Conversion: unknown style '{name}'.") from None
+
+
+def convert(
+    text: str,
+    style: str,
+    acronyms: Optional[List[str]] = None,
+    engine: Optional[Engine] = None,
+    normalize: Optional[str] = None,
+) -> str:
+    """Return text converted to a registered style.
+
+    Args:
+        text (str): Input string to be converted
+        style (str): Name of a built-in or registered style
+        acronyms (optional, list of str): List of acronyms to honor
+        engine (optional, str or BoundaryRules): Segmentation engine,
+            see parse_case
+        normalize (optional, str): Unicode normalization form, see
+            parse_case
+
+    Returns:
+        str: Case converted text
+
+    Raises:
+        ValueError: If no style of that name is registered
+
+    Examples:
+        >>> convert("hello world", "snake")
+        'hello_world'
+    """
+    return _lookup(style)[1](text, acronyms, engine, normalize)
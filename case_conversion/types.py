@@ -1,4 +1,8 @@
 from enum import Enum, auto
+from typing import Callable
+
+# Case converter, e.g. `camel` or `snake`.
+Converter = Callable[..., str]
 
 
 class InvalidAcronymError(Exception):
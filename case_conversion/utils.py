@@ -1,9 +1,54 @@
 import unicodedata
-from typing import Iterator, List, Optional, Tuple
+from functools import lru_cache
+from typing import (
+    Collection,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from .types import Case, InvalidAcronymError
 
 
+NORMALIZATION_FORMS = ("NFC", "NFKC")
+
+
+def normalize_unicode(string: str, form: str) -> str:
+    """Return string in the given Unicode normalization form.
+
+    Composed forms keep combining marks attached to their base letter,
+    instead of having them classified as separators. Strings that are
+    already normalized, the common case, are returned after a cheap
+    quick-check.
+
+    Arguments:
+        string (str): The string to normalize
+        form (str): "NFC" or "NFKC"
+
+    Returns:
+        str: Normalized string
+
+    Raises:
+        ValueError: Upon an unsupported normalization form
+    """
+    if form not in NORMALIZATION_FORMS:
+        raise ValueError(f"Case Conversion: unsupported normalization '{form}'.")
+    if string.isascii() or _is_normalized(form, string):
+        return string
+    return unicodedata.normalize(form, string)  # type: ignore
+
+
+def _is_normalized(form: str, string: str) -> bool:
+    # unicodedata.is_normalized is new in Python 3.8.
+    if hasattr(unicodedata, "is_normalized"):
+        return unicodedata.is_normalized(form, string)  # type: ignore
+    return unicodedata.normalize(form, string) == string  # type: ignore
+
+
 def get_rubstring_ranges(a_str: str, sub: str) -> Iterator[Tuple[int, int]]:  # noqa
     start = 0
     sub_len = len(sub)
@@ -87,7 +132,7 @@ def determine_case(was_all_upper: bool, words: List[str], string: str) -> Case:
 
 
 def advanced_acronym_detection(
-    s: int, i: int, words: List[str], acronyms: List[str]
+    s: int, i: int, words: List[str], acronyms: Sequence[str]
 ) -> int:
     """Detect acronyms by checking against a list of acronyms.
 
@@ -166,7 +211,7 @@ def simple_acronym_detection(s: int, i: int, words: List[str], *args) -> int:
     return s
 
 
-def sanitize_acronyms(unsafe_acronyms: List[str]) -> List[str]:
+def sanitize_acronyms(unsafe_acronyms: Iterable[str]) -> List[str]:
     """Normalize valid acronyms to upper-case.
 
     Arguments:
@@ -187,7 +232,23 @@ def sanitize_acronyms(unsafe_acronyms: List[str]) -> List[str]:
     return acronyms
 
 
-def normalize_words(words: List[str], acronyms: List[str]) -> List[str]:
+@lru_cache(maxsize=64)
+def sanitized_acronym_set(acronyms: Tuple[str, ...]) -> FrozenSet[str]:
+    """Return the sanitized acronyms as a set, memoized per acronym tuple.
+
+    Arguments:
+        acronyms (tuple of str): Acronyms to be sanitized
+
+    Returns:
+        frozenset of str: Sanitized acronyms
+
+    Raises:
+        InvalidAcronymError: Upon encountering an invalid acronym
+    """
+    return frozenset(sanitize_acronyms(list(acronyms)))
+
+
+def normalize_words(words: List[str], acronyms: Collection[str]) -> List[str]:
     """Normalize case of each word to PascalCase.
 
     Arguments:
@@ -236,7 +297,9 @@ def segment_string(string: str) -> Tuple[List[Optional[str]], str, bool]:
     # letters to be counted as boundaries
     was_upper = False
     if string.isupper():
-        string = string.lower()
+        # Not string.lower(): mypyc compiles the method call to a
+        # per-character primitive that ignores the final sigma rule.
+        string = str.lower(string)
         was_upper = True
 
     # Iterate over each character, checking for boundaries, or places
@@ -0,0 +1,151 @@
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Hashable, Iterator, List, Optional
+
+from .batch import Converter
+
+_MISSING = object()
+
+
+def _wrap(value: Any, view: "StyleView") -> Any:
+    if isinstance(value, dict):
+        return StyleView(value, view._converter, view._acronyms, view._source)
+    if isinstance(value, (list, tuple)):
+        return _SequenceView(value, view)
+    return value
+
+
+class _SequenceView(Sequence):
+    # Read-only list or tuple whose dicts are wrapped on access.
+
+    def __init__(self, items: Sequence, view: "StyleView") -> None:
+        self._items = items
+        self._view = view
+        self._wrapped: Dict[int, Any] = {}
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self._items))[index]]
+        # Normalizes negative indices and raises IndexError if out of range.
+        index = range(len(self._items))[index]
+        value = self._wrapped.get(index, _MISSING)
+        if value is _MISSING:
+            value = self._wrapped[index] = _wrap(self._items[index], self._view)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._items!r})"
+
+    def _materialize(self) -> Sequence:
+        return list(self) if isinstance(self._items, list) else tuple(self)
+
+    def __eq__(self, other: object) -> bool:
+        # Equal to the list or tuple presented, like views to their dicts.
+        if isinstance(other, _SequenceView):
+            other = other._materialize()
+        if not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return self._materialize() == other
+
+
+class StyleView(Mapping):
+    """Read-only view presenting the str keys of a dict in another style.
+
+    Keys are converted on demand and memoized per view. Lookups go
+    through a reverse index of the converted keys, so `view["userId"]`
+    finds `user_id` without converting the whole dict: the key is first
+    converted back with `source`, if given, and checked; otherwise keys
+    are converted until one matches. Nested dicts, also within lists and
+    tuples, are presented as views when accessed. Views compare equal to
+    the converted dicts, lists and tuples they present.
+
+    The underlying dict must not change while the view is in use.
+
+    Args:
+        data (dict): Underlying dict
+        converter (callable): Case converter of the presented keys,
+            e.g. `camel`
+        acronyms (optional, list of str): List of acronyms to honor
+        source (optional, callable): Case converter of the underlying
+            keys, e.g. `snake`, to resolve lookups without a scan
+
+    Raises:
+        ValueError: If two keys convert to the same key
+
+    Examples:
+        >>> view = StyleView({"user_id": 1, "tags": [{"tag_name": "a"}]}, camel)
+        >>> view["userId"]
+        1
+        >>> view["tags"][0]["tagName"]
+        'a'
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        data: Dict[Any, Any],
+        converter: Converter,
+        acronyms: Optional[List[str]] = None,
+        source: Optional[Converter] = None,
+    ) -> None:
+        self._data = data
+        self._converter = converter
+        self._acronyms = acronyms
+        self._source = source
+        self._converted: Dict[Hashable, Hashable] = {}
+        # Reverse index, converted key -> underlying key.
+        self._originals: Dict[Hashable, Hashable] = {}
+        self._complete = False
+        self._wrapped: Dict[Hashable, Any] = {}
+
+    def _convert(self, key: Hashable) -> Hashable:
+        converted = self._converted.get(key, _MISSING)
+        if converted is _MISSING:
+            if isinstance(key, str):
+                converted = self._converter(key, self._acronyms)
+            else:
+                converted = key
+            original = self._originals.setdefault(converted, key)
+            if original != key:
+                raise ValueError(
+                    f"Case Conversion: '{original}' and '{key}' both convert "
+                    f"to '{converted}'."
+                )
+            self._converted[key] = converted
+        return converted
+
+    def _original(self, key: Hashable) -> Hashable:
+        original = self._originals.get(key, _MISSING)
+        if original is not _MISSING or self._complete:
+            return original
+        if self._source is not None and isinstance(key, str):
+            candidate = self._source(key, self._acronyms)
+            if candidate in self._data and self._convert(candidate) == key:
+                return candidate
+        for candidate in self._data:
+            if candidate not in self._converted and self._convert(candidate) == key:
+                return candidate
+        self._complete = True
+        return _MISSING
+
+    def __getitem__(self, key: Hashable) -> Any:  # noqa: D105
+        original = self._original(key)
+        if original is _MISSING:
+            raise KeyError(key)
+        value = self._wrapped.get(original, _MISSING)
+        if value is _MISSING:
+            value = self._wrapped[original] = _wrap(self._data[original], self)
+        return value
+
+    def __contains__(self, key: object) -> bool:  # noqa: D105
+        return self._original(key) is not _MISSING  # type: ignore
+
+    def __iter__(self) -> Iterator[Hashable]:  # noqa: D105
+        return (self._convert(key) for key in self._data)
+
+    def __len__(self) -> int:  # noqa: D105
+        return len(self._data)
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"{type(self).__name__}({self._data!r})"
@@ -0,0 +1,110 @@
+import threading
+from dataclasses import dataclass
+
+import pytest
+
+import case_conversion
+from case_conversion import (
+    InvalidAcronymError,
+    canonical_key,
+    convert_bytes,
+    field_converter,
+    get_acronyms,
+    pascal,
+    set_acronyms,
+    snake,
+)
+from case_conversion.cache import get_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    set_acronyms([])
+    yield
+    set_acronyms([])
+
+
+def test_set_acronyms_bumps_version():
+    version = get_acronyms().version
+    assert set_acronyms(["http", "ID"]) == version + 1
+    registry = get_acronyms()
+    assert registry.acronyms == ("HTTP", "ID")
+    assert registry.lookup == {"HTTP", "ID"}
+
+
+def test_set_acronyms_validates():
+    before = get_acronyms()
+    with pytest.raises(InvalidAcronymError):
+        set_acronyms(["HT TP"])
+    assert get_acronyms() is before
+
+
+@pytest.mark.parametrize(
+    "converter,text,expected",
+    (
+        (snake, "HTTPServer", "http_server"),
+        (pascal, "http_server", "HTTPServer"),
+        (case_conversion.camel, "user_id", "userID"),
+    ),
+)
+def test_converters_honor_registry(converter, text, expected):
+    set_acronyms(["HTTP", "ID"])
+    assert converter(text) == expected
+    assert converter(text) == converter(text, ["HTTP", "ID"])
+
+
+def test_explicit_acronyms_override_registry():
+    set_acronyms(["HTTP"])
+    assert pascal("http_server", []) == "HttpServer"
+
+
+def test_swap_serves_no_stale_results():
+    assert pascal("http_server") == "HttpServer"
+    set_acronyms(["HTTP"])
+    assert pascal("http_server") == "HTTPServer"
+    set_acronyms([])
+    assert pascal("http_server") == "HttpServer"
+
+
+def test_swap_discards_only_old_version():
+    set_acronyms(["HTTP"])
+    old = get_acronyms().version
+    pascal("http_server")
+    pascal("ftp_server", ["FTP"])
+    set_acronyms(["FTP"])
+    keys = [key for _, entries in get_cache()._stripes for key in entries]
+    assert not [key for key in keys if key[1] == old]
+    assert ("ftp_server", ("FTP",), False, "fast") in keys
+
+
+def test_other_entry_points_honor_registry():
+    @dataclass
+    class Request:
+        http_method: str
+
+    set_acronyms(["HTTP"])
+    assert canonical_key("HTTPServer") == canonical_key("http_server")
+    assert field_converter(Request, pascal).names == {"http_method": "HTTPMethod"}
+    assert convert_bytes(b"http_server\n", pascal) == b"HTTPServer\n"
+
+
+def test_concurrent_swaps():
+    outputs = {"HttpServer", "HTTPServer"}
+    errors = []
+    stop = threading.Event()
+
+    def convert():
+        while not stop.is_set():
+            result = pascal("http_server")
+            if result not in outputs:
+                errors.append(result)
+
+    threads = [threading.Thread(target=convert) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for i in range(200):
+        set_acronyms(["HTTP"] if i % 2 else [])
+    stop.set()
+    for thread in threads:
+        thread.join()
+    assert errors == []
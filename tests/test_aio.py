@@ -0,0 +1,130 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from case_conversion import cache_scope, camel, convert_keys, convert_many, snake
+from case_conversion.aio import _count_keys, convert_keys_async, convert_many_async
+
+TEXTS = ["foo_bar", "FOO_BAR", "fooHTTPBar", "user id"] * 50
+PAYLOAD = {
+    "user_id": 1,
+    "order_items": [{"item_name": "a", "unit_price": (1, {"x_y": 2})}],
+}
+
+
+@pytest.mark.parametrize("offload_threshold", (None, 1, 10**6))
+@pytest.mark.parametrize("acronyms", (None, ["HTTP"]))
+def test_convert_many_async_matches_sync(offload_threshold, acronyms):
+    result = asyncio.run(
+        convert_many_async(TEXTS, snake, acronyms, offload_threshold=offload_threshold)
+    )
+    assert result == convert_many(TEXTS, snake, acronyms)
+
+
+@pytest.mark.parametrize("offload_threshold", (None, 1, 10**6))
+def test_convert_keys_async_matches_sync(offload_threshold):
+    result = asyncio.run(
+        convert_keys_async(PAYLOAD, camel, offload_threshold=offload_threshold)
+    )
+    assert result == convert_keys(PAYLOAD, camel)
+    assert isinstance(result["orderItems"][0]["unitPrice"], tuple)
+
+
+def test_count_keys_stops_at_limit():
+    obj = [{f"k{i}": {"x": 1} for i in range(1000)}]
+    assert _count_keys(obj, 10) == 1000
+    assert _count_keys(obj, 10**6) == 2000
+
+
+@pytest.mark.parametrize("offload_threshold", (None, 1))
+def test_convert_keys_async_reuse_unchanged(offload_threshold):
+    obj = {"user_id": 1, "tags": [{"tag_name": "a"}], "Meta": {"x_y": (1,)}}
+    result = asyncio.run(
+        convert_keys_async(
+            obj, snake, offload_threshold=offload_threshold, reuse_unchanged=True
+        )
+    )
+    assert result == convert_keys(obj, snake)
+    assert result["tags"] is obj["tags"]
+    assert result["meta"] is obj["Meta"]
+    assert asyncio.run(
+        convert_keys_async(obj["tags"], snake, reuse_unchanged=True)
+    ) is (obj["tags"])
+
+
+@pytest.mark.parametrize("executor_type", (ThreadPoolExecutor, ProcessPoolExecutor))
+def test_offload_to_executor(executor_type):
+    async def run(executor):
+        return await asyncio.gather(
+            convert_many_async(TEXTS, snake, offload_threshold=1, executor=executor),
+            convert_keys_async(PAYLOAD, snake, offload_threshold=1, executor=executor),
+        )
+
+    with executor_type(max_workers=1) as executor:
+        many, keys = asyncio.run(run(executor))
+    assert many == convert_many(TEXTS, snake)
+    assert keys == convert_keys(PAYLOAD, snake)
+
+
+@pytest.mark.parametrize("executor_type", (None, ThreadPoolExecutor))
+def test_offload_honors_cache_scope(executor_type):
+    async def run(executor):
+        return await asyncio.gather(
+            convert_many_async(
+                ["user_id"], camel, offload_threshold=1, executor=executor
+            ),
+            convert_keys_async(
+                {"user_id": 1}, camel, offload_threshold=1, executor=executor
+            ),
+        )
+
+    with cache_scope(acronyms=["ID"]) as scope:
+        if executor_type is None:
+            many, keys = asyncio.run(run(None))
+        else:
+            with executor_type(max_workers=1) as executor:
+                many, keys = asyncio.run(run(executor))
+        assert len(scope.cache) == 1
+    assert many == ["userID"]
+    assert keys == {"userID": 1}
+
+
+def test_offload_to_processes_honors_cache_scope():
+    async def run(executor):
+        return await convert_keys_async(
+            {"user_id": 1}, camel, offload_threshold=1, executor=executor
+        )
+
+    with cache_scope(acronyms=["ID"]):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert asyncio.run(run(executor)) == {"userID": 1}
+
+
+def test_intern_shares_outputs():
+    async def run():
+        return await convert_keys_async(
+            [{"user_id": i} for i in range(5)], camel, intern=True
+        )
+
+    keys = [next(iter(d)) for d in asyncio.run(run())]
+    assert len({id(k) for k in keys}) == 1
+
+
+def test_slices_yield_to_the_event_loop():
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def run():
+        task = asyncio.ensure_future(ticker())
+        await asyncio.sleep(0)
+        before = len(ticks)
+        await convert_many_async(TEXTS, snake, slice_seconds=0)
+        task.cancel()
+        return len(ticks) - before
+
+    assert asyncio.run(run()) >= len(TEXTS) - 1
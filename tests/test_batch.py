@@ -0,0 +1,124 @@
+import pytest
+
+import case_conversion
+from case_conversion import camel, convert_keys, convert_many, snake
+
+
+@pytest.mark.parametrize(
+    "texts,converter,acronyms,expected",
+    (
+        ([], camel, None, []),
+        (["foo_bar", "FOO_BAR"], camel, None, ["fooBar", "fooBar"]),
+        (["fooHTTPBar"], snake, ["HTTP"], ["foo_http_bar"]),
+    ),
+)
+def test_convert_many(texts, converter, acronyms, expected):
+    assert convert_many(texts, converter, acronyms) == expected
+
+
+def test_convert_many_intern_shares_outputs():
+    texts = ["user_id", "userId", "USER_ID"] * 3
+    results = convert_many(texts, case_conversion.snake, intern=True)
+    assert results == ["user_id"] * 9
+    assert len({id(r) for r in results}) == 1
+
+
+@pytest.mark.parametrize(
+    "obj,expected",
+    (
+        ({"user_id": 1}, {"userId": 1}),
+        ({"a_b": {"c_d": [{"e_f": None}]}}, {"aB": {"cD": [{"eF": None}]}}),
+        ([{"a_b": 1}, ("x_y", {"c_d": 2})], [{"aB": 1}, ("x_y", {"cD": 2})]),
+        ({1: "foo_bar"}, {1: "foo_bar"}),
+        ("foo_bar", "foo_bar"),
+    ),
+)
+def test_convert_keys(obj, expected):
+    assert convert_keys(obj, camel) == expected
+
+
+def test_convert_keys_intern_shares_keys():
+    payload = [{"user_id": i} for i in range(5)]
+    results = convert_keys(payload, camel, intern=True)
+    keys = [next(iter(d)) for d in results]
+    assert keys == ["userId"] * 5
+    assert len({id(k) for k in keys}) == 1
+
+
+@pytest.mark.parametrize(
+    "obj",
+    (
+        {"user_id": 1, "tags": [{"tag_name": "a"}], "Meta": {"x_y": (1, 2)}},
+        [{"a_b": 1}, {"cD": {"e_f": [None, {"gH": 2}]}}],
+        ({"HTTPServer": "x"}, "y"),
+        {1: {"a_b": 2}, "plain": 3},
+    ),
+)
+def test_convert_keys_reuse_unchanged_matches_copy(obj):
+    for converter in (camel, snake, case_conversion.pascal, case_conversion.const):
+        expected = convert_keys(obj, converter)
+        assert convert_keys(obj, converter, reuse_unchanged=True) == expected
+        assert convert_keys(obj, converter, ["HTTP"], reuse_unchanged=True) == (
+            convert_keys(obj, converter, ["HTTP"])
+        )
+
+
+def test_convert_keys_reuse_unchanged_keeps_identity():
+    obj = {"user_id": 1, "tags": [{"tag_name": "a"}], "Meta": {"x_y": [1]}}
+    result = convert_keys(obj, snake, reuse_unchanged=True)
+    assert result == {"user_id": 1, "tags": [{"tag_name": "a"}], "meta": {"x_y": [1]}}
+    assert result is not obj
+    assert result["tags"] is obj["tags"]
+    assert result["meta"] is obj["Meta"]
+    assert list(result) == ["user_id", "tags", "meta"]
+
+    nested = {"a": [{"b_c": 1}, {"dE": 2}], "f": [3]}
+    result = convert_keys(nested, snake, reuse_unchanged=True)
+    assert result["a"] is not nested["a"]
+    assert result["a"][0] is nested["a"][0]
+    assert result["f"] is nested["f"]
+
+    conforming = {"a_b": [{"c": (1, {"d_e": 2})}]}
+    assert convert_keys(conforming, snake, reuse_unchanged=True) is conforming
+
+
+def test_convert_keys_reuse_unchanged_skips_conforming_keys(monkeypatch):
+    calls = []
+
+    def counting(text, acronyms=None):
+        calls.append(text)
+        return snake(text, acronyms)
+
+    obj = {"user_id": 1, "userName": 2}
+    expected = {"user_id": 1, "user_name": 2}
+    # Unregistered converters are called for every key.
+    assert convert_keys(obj, counting, reuse_unchanged=True) == expected
+    assert calls == ["user_id", "userName"]
+
+    calls.clear()
+    styles = case_conversion.styles
+    monkeypatch.setitem(styles._by_converter, counting, styles.style_of(snake))
+    assert convert_keys(obj, counting, reuse_unchanged=True) == expected
+    assert calls == ["userName"]
+
+    # Acronyms may change conforming keys.
+    calls.clear()
+    assert convert_keys(obj, counting, ["ID"], reuse_unchanged=True) == expected
+    assert calls == ["user_id", "userName"]
+
+
+@pytest.mark.parametrize("name", ("snake", "dash", "dot", "const", "camel", "pascal"))
+def test_conforming_patterns_are_sound(name):
+    import random
+    import re
+
+    from case_conversion.batch import _CONFORMING
+
+    converter = getattr(case_conversion, name)
+    conforms = re.compile(_CONFORMING[name]).fullmatch
+    rng = random.Random(name)
+    alphabet = "aZb9_-.Yc"
+    for _ in range(3000):
+        key = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 8)))
+        if conforms(key):
+            assert converter(key, []) == key, key
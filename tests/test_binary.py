@@ -0,0 +1,99 @@
+import mmap
+
+import pytest
+
+import case_conversion
+from case_conversion import convert_bytes, convert_file
+
+CONVERTERS = [
+    "camel",
+    "pascal",
+    "snake",
+    "dash",
+    "const",
+    "dot",
+    "separate_words",
+    "slash",
+    "backslash",
+    "ada",
+    "http_header",
+    "lower",
+    "upper",
+    "title",
+    "capital",
+]
+
+LINES = [
+    "",
+    "fooBarString",
+    "FOO_BAR_STRING",
+    "foo-bar_string",
+    "__foo__",
+    "fooHTTPBarString",
+    "HTTPError",
+    "aBC",
+    "XMLHttpRequest",
+    "utf8Decoder",
+    "v2API",
+    "fóo_bar",
+    "fooBarHÉÉPString",
+]
+
+
+@pytest.mark.parametrize("case", CONVERTERS)
+@pytest.mark.parametrize("acronyms", (None, ["HTTP", "XML"], ["HÉÉP"]))
+def test_convert_bytes_matches_str_converters(case, acronyms):
+    converter = getattr(case_conversion, case)
+    data = "\n".join(LINES).encode()
+    expected = "\n".join(converter(line, acronyms) for line in LINES)
+    assert convert_bytes(data, converter, acronyms).decode() == expected
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        b"fooBar\nbarBaz\n",
+        bytearray(b"fooBar\nbarBaz\n"),
+        memoryview(b"fooBar\nbarBaz\n"),
+    ),
+)
+def test_convert_bytes_accepts_buffers(data):
+    assert convert_bytes(data, case_conversion.snake) == b"foo_bar\nbar_baz\n"
+
+
+def test_convert_bytes_appends_to_output():
+    out = bytearray(b"header\n")
+    assert convert_bytes(b"fooBar", case_conversion.dash, out=out) is out
+    assert out == b"header\nfoo-bar"
+
+
+def test_convert_bytes_across_chunks(monkeypatch):
+    from case_conversion import binary
+
+    monkeypatch.setattr(binary, "_CHUNK_SIZE", 4)
+    data = b"fooBarString\nhelloWorld\nx"
+    assert convert_bytes(data, case_conversion.snake) == (
+        b"foo_bar_string\nhello_world\nx"
+    )
+
+
+def test_convert_bytes_unknown_converter_decodes():
+    assert convert_bytes(b"ab\n", lambda text, acronyms: text[::-1]) == b"ba\n"
+
+
+def test_convert_bytes_mmap(tmp_path):
+    path = tmp_path / "ids.txt"
+    path.write_bytes(b"fooBar\nHELLO_WORLD\n")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        assert convert_bytes(m, case_conversion.camel) == b"fooBar\nhelloWorld\n"
+
+
+@pytest.mark.parametrize("content", (b"", "fooBar\nfóoBar\n".encode()))
+def test_convert_file(tmp_path, content):
+    src, dst = tmp_path / "src.txt", tmp_path / "dst.txt"
+    src.write_bytes(content)
+    convert_file(str(src), str(dst), case_conversion.const)
+    expected = "\n".join(
+        case_conversion.const(line) for line in content.decode().split("\n")
+    )
+    assert dst.read_bytes() == expected.encode()
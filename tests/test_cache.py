@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+
+from case_conversion import clear_cache, parse_case
+from case_conversion.cache import StripedCache, get_cache
+from case_conversion.parser import ENGINES
+from case_conversion.utils import segment_string
+
+
+def test_striped_cache_evicts_least_recently_used():
+    cache = StripedCache(maxsize=2, stripes=1)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_striped_cache_disabled():
+    cache = StripedCache(maxsize=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+
+
+def test_striped_cache_rejects_invalid_stripes():
+    with pytest.raises(ValueError):
+        StripedCache(stripes=0)
+
+
+def test_parse_case_returns_fresh_lists():
+    clear_cache()
+    first, *_ = parse_case("fooBarBaz")
+    first.append("Mutated")
+    second, *_ = parse_case("fooBarBaz")
+    assert second == ["Foo", "Bar", "Baz"]
+    assert len(get_cache()) == 1
+
+
+def test_parse_case_cache_keyed_on_options():
+    clear_cache()
+    assert parse_case("fooBarBaz", ["BAR"])[0] == ["Foo", "BAR", "Baz"]
+    assert parse_case("fooBarBaz")[0] == ["Foo", "Bar", "Baz"]
+    assert parse_case("fooBarBaz", None, True)[0] == ["foo", "Bar", "Baz"]
+
+
+def test_parse_case_cache_keyed_on_engine(monkeypatch):
+    clear_cache()
+    calls = []
+
+    def reference(string):
+        calls.append(string)
+        return segment_string(string)
+
+    monkeypatch.setitem(ENGINES, "reference", reference)
+    parse_case("fooBarBaz")
+    parse_case("fooBarBaz", engine="fast")
+    assert len(get_cache()) == 1
+    parse_case("fooBarBaz", engine="reference")
+    parse_case("fooBarBaz", engine="reference")
+    assert calls == ["fooBarBaz"]
+    assert len(get_cache()) == 2
+
+
+def test_parse_case_concurrent():
+    clear_cache()
+    strings = [f"key{i}_value" for i in range(200)]
+    expected = [parse_case(s) for s in strings]
+    errors = []
+
+    def work():
+        for _ in range(5):
+            if [parse_case(s) for s in strings] != expected:
+                errors.append(True)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+
+
+def test_parse_case_normalized_strings_share_cache():
+    clear_cache()
+    parse_case("fo\u0301oBar", normalize="NFC")
+    parse_case("f\xf3oBar")
+    assert len(get_cache()) == 1
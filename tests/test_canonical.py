@@ -0,0 +1,78 @@
+import pytest
+
+from case_conversion import CanonicalKeyDict, canonical_key, set_acronyms
+
+
+@pytest.mark.parametrize(
+    "text,acronyms,expected",
+    (
+        ("userId", None, "user_id"),
+        ("user_id", None, "user_id"),
+        ("USER-ID", None, "user_id"),
+        ("UserID", None, "user_id"),
+        ("UserID", ["ID"], "user_id"),
+        ("HTTPSServer", ["HTTPS"], "https_server"),
+        ("user id", ["ID"], "user_id"),
+        ("", None, ""),
+    ),
+)
+def test_canonical_key(text, acronyms, expected):
+    assert canonical_key(text, acronyms) == expected
+
+
+def test_canonical_key_dict_lookup_in_any_style():
+    d = CanonicalKeyDict({"user_id": 1}, acronyms=["ID"])
+    for key in ("userId", "user_id", "USER-ID", "UserID"):
+        assert d[key] == 1
+        assert key in d
+    assert 1 not in d
+    assert "user_name" not in d
+
+
+def test_canonical_key_dict_keeps_last_key():
+    d = CanonicalKeyDict(user_id=1)
+    d["userId"] = 2
+    assert list(d) == ["userId"]
+    assert d["USER_ID"] == 2
+    assert len(d) == 1
+    del d["user-id"]
+    assert not d
+
+
+def test_canonical_key_dict_equality_and_copy():
+    d = CanonicalKeyDict({"userId": 1, "userName": "x"})
+    assert d == {"user_id": 1, "USER_NAME": "x"}
+    assert d != {"user_id": 2}
+    copy = d.copy()
+    copy["user_id"] = 3
+    assert d["userId"] == 1
+    assert repr(d) == "CanonicalKeyDict({'userId': 1, 'userName': 'x'})"
+
+
+def test_canonical_key_dict_missing_key():
+    with pytest.raises(KeyError):
+        CanonicalKeyDict()["userId"]
+
+
+def test_canonical_key_dict_follows_registry():
+    set_acronyms(["HTTPS"])
+    try:
+        d = CanonicalKeyDict({"UserIDName": 1})
+        assert "user_id_name" not in d
+        set_acronyms(["ID"])
+        assert d["user_id_name"] == 1
+        assert list(d) == ["UserIDName"]
+    finally:
+        set_acronyms([])
+
+
+def test_canonical_key_dict_empty_acronyms_ignore_registry():
+    set_acronyms(["AB", "CD"])
+    try:
+        d = CanonicalKeyDict({"fooABCD": 1}, acronyms=[])
+        assert canonical_key("fooABCD", []) == "foo_abcd"
+        assert d["foo_abcd"] == 1
+        assert "foo_ab_cd" not in d
+        assert d.copy() == {"fooABCD": 1}
+    finally:
+        set_acronyms([])
@@ -0,0 +1,112 @@
+import gzip
+
+import pytest
+
+import case_conversion
+from case_conversion import styles
+from case_conversion.capture import (
+    PERCENTILES,
+    CapturedCall,
+    TrafficCapture,
+    load_capture,
+    replay,
+)
+from case_conversion.segmenter import BoundaryRules
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "traffic.jsonl.gz")
+
+
+def test_capture_records_all_calls(path):
+    rules = BoundaryRules(digit_boundaries=True)
+    with TrafficCapture(path, rate=1) as capture:
+        assert case_conversion.snake("fooBar") == "foo_bar"
+        case_conversion.camel("foo_http", ["HTTP"])
+        case_conversion.http_header("content_type")
+        case_conversion.const("v2_api", engine=rules, normalize="NFC")
+        case_conversion.lower("NOT_RECORDED")
+    assert capture.recorded == 4
+    assert styles._observer is None
+    case_conversion.snake("not_recorded")
+
+    assert load_capture(path) == [
+        CapturedCall("snake", "fooBar"),
+        CapturedCall("camel", "foo_http", ["HTTP"]),
+        CapturedCall("http_header", "content_type"),
+        CapturedCall("const", "v2_api", None, rules, "NFC"),
+    ]
+
+
+def test_capture_records_lone_surrogates(path):
+    text = "foo_\ud800bar"
+    expected = case_conversion.camel(text)
+    with TrafficCapture(path, rate=1) as capture:
+        assert case_conversion.camel(text) == expected
+    assert (capture.recorded, capture.dropped) == (1, 0)
+    assert load_capture(path) == [CapturedCall("camel", text)]
+
+
+def test_capture_never_breaks_conversions(path):
+    with TrafficCapture(path, rate=1) as capture:
+        capture._file.write = None
+        assert case_conversion.snake("fooBar") == "foo_bar"
+    assert (capture.recorded, capture.dropped) == (0, 1)
+
+
+def test_capture_resolves_registry(path):
+    case_conversion.set_acronyms(["HTTP"])
+    try:
+        with TrafficCapture(path, rate=1):
+            case_conversion.snake("HTTPServer")
+    finally:
+        case_conversion.set_acronyms([])
+    assert load_capture(path) == [CapturedCall("snake", "HTTPServer", ["HTTP"])]
+
+
+def test_capture_samples(path):
+    with TrafficCapture(path, rate=0.25, seed=1) as capture:
+        for i in range(2000):
+            case_conversion.snake(f"key{i}")
+    assert 400 < capture.recorded < 600
+    assert len(load_capture(path)) == capture.recorded
+
+
+@pytest.mark.parametrize("rate", (0, -0.5, 1.5))
+def test_capture_invalid_rate(path, rate):
+    with pytest.raises(ValueError):
+        TrafficCapture(path, rate=rate)
+
+
+def test_capture_single(path, tmp_path):
+    with TrafficCapture(path):
+        with pytest.raises(ValueError):
+            TrafficCapture(str(tmp_path / "other.jsonl.gz")).start()
+    assert styles._observer is None
+
+
+def test_load_capture_rejects_other_files(path):
+    with gzip.open(path, "wt") as f:
+        f.write('{"format": "other"}\n')
+    with pytest.raises(ValueError):
+        load_capture(path)
+
+
+def test_replay(path):
+    with TrafficCapture(path, rate=1):
+        for text in ("fooBar", "foo_bar", "HTTPServer") * 10:
+            case_conversion.snake(text)
+            case_conversion.camel(text, ["HTTP"])
+    report = replay(path, repeat=2)
+    assert report.calls == 60
+    assert report.throughput > 0
+    assert set(report.latencies) == set(PERCENTILES)
+    assert 0 < report.latencies[50.0] <= report.latencies[99.9]
+    assert report.peak_bytes >= report.retained_bytes >= 0
+    assert replay(load_capture(path), repeat=1).calls == 60
+
+
+def test_replay_unknown_style():
+    with pytest.raises(ValueError):
+        replay([CapturedCall("no_such_style", "foo")])
@@ -0,0 +1,117 @@
+import pickle
+import random
+
+import pytest
+
+import case_conversion
+from case_conversion import Case, Style
+from case_conversion.columnar import (
+    RECORD_SEPARATOR,
+    WORD_SEPARATOR,
+    parse_columns,
+    render_columns,
+)
+from case_conversion.styles import _registry
+
+STRINGS = [
+    "user_id",
+    "HTTPServer",
+    "",
+    "___",
+    "fooBar-baz",
+    "ΣΑΣ_ΣΑΣ",
+    "foo ΣΑΣ",
+    "straße",
+    "ǆemal_ǆ",
+    "v2Api",
+    "a\x1fb\x1ec",
+]
+
+
+def random_strings(count, seed=0):
+    rng = random.Random(seed)
+    alphabet = "aBcXYZ_-. 9Σσςßé\x1f\x1e"
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("acronyms", ([], ["HTTP", "XYZ"]))
+@pytest.mark.parametrize("preserve_case", (False, True))
+def test_rows_match_parse_case(acronyms, preserve_case):
+    strings = STRINGS + random_strings(500)
+    columns = parse_columns(strings, acronyms, preserve_case)
+    expected = [case_conversion.parse_case(s, acronyms, preserve_case) for s in strings]
+    assert list(columns.rows()) == expected
+    assert [columns.row(i) for i in range(len(strings))] == expected
+    assert list(columns.word_counts) == [len(words) for words, _, _ in expected]
+
+
+@pytest.mark.parametrize("acronyms", ([], ["HTTP", "XYZ"]))
+@pytest.mark.parametrize("name", sorted(_registry))
+def test_render_matches_converter(name, acronyms):
+    compiled, converter = _registry[name]
+    strings = STRINGS + random_strings(500, seed=1)
+    columns = parse_columns(strings, acronyms, compiled.preserve_case)
+    assert render_columns(columns, converter) == [
+        converter(s, acronyms) for s in strings
+    ]
+
+
+def test_render_custom_style():
+    compiled = case_conversion.styles.CompiledStyle(
+        Style("tagged", "~", "upper", "upper", prefix="<", suffix=">")
+    )
+    converter = compiled.convert
+    case_conversion.styles._by_converter[converter] = compiled
+    try:
+        columns = parse_columns(["fooBar", "", "baz"])
+        assert render_columns(columns, converter) == ["<FOO~BAR>", "", "<BAZ>"]
+    finally:
+        del case_conversion.styles._by_converter[converter]
+
+
+def test_columns_layout():
+    columns = parse_columns(["fooBar", "", "x-y"], [])
+    assert columns.words == (
+        f"Foo{WORD_SEPARATOR}Bar{RECORD_SEPARATOR}{RECORD_SEPARATOR}"
+        f"X{WORD_SEPARATOR}Y"
+    )
+    assert list(columns.offsets) == [0, 8, 9, 13]
+    assert columns.word_counts == bytearray([2, 0, 2])
+    assert list(columns.cases) == [
+        c.value for c in (Case.CAMEL, Case.UNKOWN, Case.LOWER)
+    ]
+    assert [columns.separator_table[i] for i in columns.separators] == ["", "", "-"]
+    assert pickle.loads(pickle.dumps(columns)) == columns
+
+
+def test_empty():
+    columns = parse_columns([])
+    assert list(columns.rows()) == []
+    assert render_columns(columns, case_conversion.snake) == []
+    assert render_columns(columns, case_conversion.camel) == []
+
+
+def test_registry_acronyms():
+    case_conversion.set_acronyms(["HTTP"])
+    try:
+        columns = parse_columns(["HTTPServer"])
+    finally:
+        case_conversion.set_acronyms([])
+    assert columns.acronyms == ("HTTP",)
+    assert render_columns(columns, case_conversion.pascal) == ["HTTPServer"]
+
+
+def test_too_many_words():
+    with pytest.raises(ValueError):
+        parse_columns(["a_" * 256])
+
+
+def test_render_errors():
+    columns = parse_columns(["fooBar"])
+    with pytest.raises(ValueError):
+        render_columns(columns, lambda text, acronyms=None: text)
+    with pytest.raises(ValueError):
+        render_columns(columns, case_conversion.separate_words)
@@ -0,0 +1,91 @@
+"""Parity tests of the optionally mypyc-compiled modules.
+
+The pure Python modules are run in a subprocess and compared with the
+modules this process picked, compiled ones if they were built.
+"""
+import importlib.machinery
+import json
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+import case_conversion
+from case_conversion import _pure
+from case_conversion.parser import _parse_case
+from case_conversion.utils import segment_string
+
+from .test_engines import ACRONYM_SETS, ALPHABETS, STYLES, _inputs
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = """
+import json, sys
+import case_conversion
+from case_conversion import _pure, parser, utils
+
+assert not case_conversion.COMPILED
+assert not any(_pure.is_compiled(m) for m in (parser, utils))
+cases = json.load(sys.stdin)
+json.dump(
+    [
+        [
+            utils.segment_string(string),
+            parser._parse_case(string, acronyms, preserve_case),
+            [getattr(case_conversion, style)(string, acronyms) for style in styles],
+        ]
+        for string, acronyms, preserve_case, styles in cases
+    ],
+    sys.stdout,
+    default=lambda case: case.value,
+)
+"""
+
+
+def _run_pure(cases):
+    env = dict(os.environ, CASE_CONVERSION_PURE_PYTHON="1", PYTHONPATH=ROOT)
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        input=json.dumps(cases),
+        stdout=subprocess.PIPE,
+        env=env,
+        universal_newlines=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def _jsonable(value):
+    return json.loads(json.dumps(value, default=lambda case: case.value))
+
+
+def test_compiled_flag():
+    suffixes = tuple(importlib.machinery.EXTENSION_SUFFIXES)
+    assert case_conversion.COMPILED is case_conversion.parser.__file__.endswith(
+        suffixes
+    )
+    assert not _pure.is_compiled(types.ModuleType("no_file"))
+    assert not _pure.is_compiled(json)
+
+
+@pytest.mark.parametrize("alphabet", sorted(ALPHABETS))
+def test_pure_python_parity(alphabet):
+    cases = [
+        [string, acronyms, preserve_case, STYLES]
+        for string in _inputs(ALPHABETS[alphabet], count=100, seed=2)
+        for acronyms in ACRONYM_SETS
+        for preserve_case in (False, True)
+    ]
+    expected = [
+        [
+            segment_string(string),
+            _parse_case(string, acronyms, preserve_case),
+            [getattr(case_conversion, style)(string, acronyms) for style in styles],
+        ]
+        for string, acronyms, preserve_case, styles in cases
+    ]
+    pure = _run_pure(cases)
+    for case, got, want in zip(cases, pure, _jsonable(expected)):
+        assert got == want, case
@@ -0,0 +1,55 @@
+from collections import Counter
+
+import pytest
+
+from case_conversion import Case, parse_case, profile_files, profile_identifiers
+
+IDENTIFIERS = [
+    "user_id",
+    "userId",
+    "UserId",
+    "USER_ID",
+    "user-name",
+    "parseHTTPResponse",
+    "http_response_code",
+    "user_id",
+    "x",
+]
+
+
+def _expected(identifiers, acronyms=None):
+    cases, separators, word_counts = Counter(), Counter(), Counter()
+    for identifier in identifiers:
+        words, case_type, separator = parse_case(identifier, acronyms or [])
+        cases[case_type] += 1
+        separators[separator] += 1
+        word_counts[len(words)] += 1
+    return cases, separators, word_counts
+
+
+def test_profile_identifiers_matches_parse_case():
+    profile = profile_identifiers(IDENTIFIERS, ["HTTP"])
+    assert profile.identifiers == len(IDENTIFIERS)
+    assert (profile.cases, profile.separators, profile.word_counts) == _expected(
+        IDENTIFIERS, ["HTTP"]
+    )
+    assert profile.cases[Case.LOWER] == 5
+    assert profile.acronyms == Counter({"HTTP": 2})
+
+
+def test_profile_merge():
+    first = profile_identifiers(IDENTIFIERS[:4])
+    second = profile_identifiers(IDENTIFIERS[4:])
+    assert first.merge(second) == profile_identifiers(IDENTIFIERS)
+
+
+@pytest.mark.parametrize("processes", (1, 2))
+@pytest.mark.parametrize("shard_size", (7, 1 << 20))
+def test_profile_files(tmp_path, processes, shard_size):
+    paths = []
+    for n, chunk in enumerate((IDENTIFIERS[:5], IDENTIFIERS[5:], [])):
+        path = tmp_path / f"shard{n}.txt"
+        path.write_text("\r\n".join(chunk) + "\n\n")
+        paths.append(str(path))
+    profile = profile_files(paths, ["HTTP"], processes, shard_size=shard_size)
+    assert profile == profile_identifiers(IDENTIFIERS, ["HTTP"])
@@ -0,0 +1,40 @@
+import pytest
+
+from case_conversion import discover_acronyms, snake
+from case_conversion.discovery import AcronymCandidate
+
+
+@pytest.mark.parametrize(
+    "identifiers,expected",
+    (
+        ([], []),
+        (["parseHTTPResponse", "HTTPError", "fooBar"], ["HTTP"]),
+        (["get_HTTP_url", "getHTTPUrl", "NASAData", "toNASA"], ["HTTP", "NASA"]),
+        (["FOO_BAR", "FOO_BAR"], []),
+        (["aBC", "aBC", "xYZ"], ["BC"]),
+    ),
+)
+def test_discover_acronyms(identifiers, expected):
+    assert discover_acronyms(identifiers).acronyms == expected
+
+
+def test_discover_acronyms_counts_each_identifier_once():
+    report = discover_acronyms(["HTTPToHTTP", "HTTPError"], min_count=1)
+    assert report.candidates == [AcronymCandidate("HTTP", 2, 0)]
+    assert report.identifiers == 2
+    assert report.runs == 2
+    assert report.matcher_cost == 1.0
+
+
+def test_discover_acronyms_bounded_memory_keeps_heavy_hitters():
+    letters = [chr(c) for c in range(ord("A"), ord("Z") + 1)]
+    noisy = [f"get{a}{b}Item" for a in letters for b in letters]
+    noisy += ["toJSONValue"] * 300
+    report = discover_acronyms(noisy, capacity=8, limit=1)
+    assert report.acronyms == ["JSON"]
+    assert report.candidates[0].occurrences + report.candidates[0].error >= 300
+
+
+def test_discover_acronyms_result_is_usable():
+    report = discover_acronyms(["parseHTTPResponse", "HTTPError"])
+    assert snake("parseHTTPResponse", report.acronyms) == "parse_http_response"
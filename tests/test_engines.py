@@ -0,0 +1,110 @@
+"""Differential tests of the parsing engines against the reference engine."""
+import random
+
+import pytest
+
+import case_conversion
+from case_conversion import parse_case
+from case_conversion.cache import StripedCache
+from case_conversion.parser import ENGINES, _parse_case, get_segmenter
+from case_conversion.utils import segment_string
+
+STYLES = [
+    "camel",
+    "pascal",
+    "snake",
+    "dash",
+    "const",
+    "dot",
+    "separate_words",
+    "slash",
+    "backslash",
+    "ada",
+    "http_header",
+]
+
+ALPHABETS = {
+    "ascii": "abcxyzABCXYZ_-. /\\",
+    "unicode": "aéßﬀÉİǅΣσςжЖ_-́ ",
+    "digits": "ab0123456789AB_",
+    "acronyms": "HTTPXMLIDaeiou_",
+}
+ACRONYM_SETS = [None, ["HTTP"], ["HTTP", "XML", "ID"], ["HÉÉP", "TP"]]
+
+
+def _inputs(alphabet, count=300, seed=0):
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+        for _ in range(count)
+    ]
+
+
+@pytest.fixture
+def no_cache(monkeypatch):
+    monkeypatch.setattr(case_conversion.cache, "_default_cache", StripedCache(0))
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+@pytest.mark.parametrize("alphabet", sorted(ALPHABETS))
+def test_segmenters_match_reference(engine, alphabet):
+    segment = get_segmenter(engine)
+    for string in _inputs(ALPHABETS[alphabet]):
+        assert segment(string) == segment_string(string), string
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+@pytest.mark.parametrize("alphabet", sorted(ALPHABETS))
+def test_parse_case_matches_reference(engine, alphabet):
+    segment = get_segmenter(engine)
+    for string in _inputs(ALPHABETS[alphabet], seed=1):
+        for acronyms in ACRONYM_SETS:
+            for preserve_case in (False, True):
+                expected = _parse_case(string, acronyms, preserve_case)
+                result = _parse_case(string, acronyms, preserve_case, segment)
+                assert result == expected, (string, acronyms, preserve_case)
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+@pytest.mark.parametrize("alphabet", sorted(ALPHABETS))
+def test_styles_match_reference(no_cache, engine, alphabet):
+    for string in _inputs(ALPHABETS[alphabet], count=100, seed=2):
+        for acronyms in ACRONYM_SETS:
+            for style in STYLES:
+                converter = getattr(case_conversion, style)
+                expected = converter(string, acronyms, engine="reference")
+                assert converter(string, acronyms, engine=engine) == expected
+
+
+@pytest.mark.parametrize("alphabet", ("ascii", "digits", "acronyms"))
+def test_convert_bytes_matches_reference(no_cache, alphabet):
+    strings = _inputs(ALPHABETS[alphabet], seed=3)
+    data = "\n".join(strings).encode()
+    for acronyms in ACRONYM_SETS:
+        for style in STYLES:
+            converter = getattr(case_conversion, style)
+            expected = "\n".join(
+                converter(s, acronyms, engine="reference") for s in strings
+            )
+            result = case_conversion.convert_bytes(data, converter, acronyms)
+            assert result.decode() == expected
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    (
+        # Known quirks of the reference implementation every engine keeps.
+        ("", ([], case_conversion.Case.UNKOWN, "")),
+        ("__", ([], case_conversion.Case.UNKOWN, "_")),
+        ("X-Forwarded-For", (["Forwarded", "For"], case_conversion.Case.PASCAL, "-")),
+        ("aBC", (["A"], case_conversion.Case.CAMEL, "")),
+    ),
+)
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_reference_quirks(no_cache, engine, string, expected):
+    assert parse_case(string, engine=engine) == expected
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        parse_case("fooBar", engine="no_such_engine")
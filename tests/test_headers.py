@@ -0,0 +1,65 @@
+import pytest
+
+from case_conversion import InvalidAcronymError, canonical_header, http_header
+from case_conversion.headers import STANDARD_HEADERS, fast_http_header
+
+
+@pytest.mark.parametrize(
+    "name,acronyms,expected",
+    (
+        ("content-type", None, "Content-Type"),
+        ("CONTENT-TYPE", None, "Content-Type"),
+        ("www-authenticate", None, "WWW-Authenticate"),
+        ("x-forwarded-for", None, "X-Forwarded-For"),
+        ("x-request-id", None, "X-Request-ID"),
+        ("x-custom_thing", None, "X-Custom-Thing"),
+        ("x-trace-id", ["id"], "X-Trace-ID"),
+        ("x-forwarded-for", ["FOR"], "X-Forwarded-FOR"),
+        ("fóo-bar", None, "Fóo-Bar"),
+        ("", None, ""),
+    ),
+)
+def test_canonical_header(name, acronyms, expected):
+    assert canonical_header(name, acronyms) == expected
+
+
+@pytest.mark.parametrize("name", STANDARD_HEADERS)
+def test_canonical_header_table_roundtrip(name):
+    assert canonical_header(name.lower()) == name
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    (
+        ("x-forwarded-for", "X-Forwarded-For"),
+        ("x_b3_traceid", "X-B3-Traceid"),
+        ("--accept", "Accept"),
+        ("", ""),
+        ("Content-Type", None),
+        ("fóo-bar", None),
+    ),
+)
+def test_fast_http_header(text, expected):
+    assert fast_http_header(text, None) == expected
+
+
+@pytest.mark.parametrize(
+    "text", ("x-forwarded-for", "a-b_c", "1-2", "x--y;z", "http-version")
+)
+def test_http_header_fast_path_matches_parser(text):
+    from case_conversion.parser import parse_case
+
+    for acronyms in (None, ["HTTP"]):
+        words, *_ = parse_case(text, acronyms)
+        assert http_header(text, acronyms) == "-".join(w.capitalize() for w in words)
+
+
+def test_http_header_fast_path_validates_acronyms():
+    with pytest.raises(InvalidAcronymError):
+        http_header("x-forwarded-for", ["HT-TP"])
+
+
+def test_http_header_fast_path_validates_engine():
+    with pytest.raises(ValueError):
+        http_header("content-type", engine="bogus")
+    assert http_header("content-type", engine="reference") == "Content-Type"
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+import case_conversion
+from case_conversion import convert_sorted, parse_many
+from case_conversion.parser import _parse_case
+
+from .test_engines import ACRONYM_SETS, ALPHABETS, STYLES
+
+SCHEMA = [
+    "user_id",
+    "user_name",
+    "user_created_at",
+    "userCreatedAt",
+    "userHTTPRequest",
+    "userHTTPRequestID",
+    "userHTTPResponse",
+    "USER_ID",
+    "user_id",
+    "user__id",
+    "user",
+    "",
+    "u",
+    "HTTPServer",
+    "HTTPS",
+    "HTTPSServer",
+]
+
+
+def _inputs(alphabet, seed):
+    rng = random.Random(seed)
+    strings = [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        for _ in range(200)
+    ]
+    # Grow shared prefixes by deriving strings from their predecessors.
+    for i in range(1, len(strings)):
+        if rng.random() < 0.7:
+            cut = rng.randint(0, len(strings[i - 1]))
+            strings[i] = strings[i - 1][:cut] + strings[i][: rng.randint(0, 4)]
+    return strings
+
+
+@pytest.mark.parametrize("preserve_case", (False, True))
+@pytest.mark.parametrize("acronyms", ACRONYM_SETS)
+@pytest.mark.parametrize("alphabet", sorted(ALPHABETS) + ["schema"])
+def test_parse_many_matches_parse_case(alphabet, acronyms, preserve_case):
+    if alphabet == "schema":
+        inputs = [SCHEMA, sorted(SCHEMA)]
+    else:
+        inputs = [_inputs(ALPHABETS[alphabet], seed) for seed in range(3)]
+    for strings in inputs:
+        expected = [_parse_case(s, acronyms, preserve_case) for s in strings]
+        assert parse_many(strings, acronyms, preserve_case) == expected
+
+
+@pytest.mark.parametrize("style", STYLES + ["lower"])
+@pytest.mark.parametrize("acronyms", (None, ["HTTP", "ID"]))
+def test_convert_sorted_matches_converter(style, acronyms):
+    converter = getattr(case_conversion, style)
+    strings = sorted(SCHEMA)
+    expected = [converter(s, acronyms) for s in strings]
+    assert convert_sorted(strings, converter, acronyms) == expected
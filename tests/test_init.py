@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+import pytest
+
+import case_conversion
+
+LAZY_MODULES = tuple(
+    sorted({f"case_conversion.{m}" for m in case_conversion._LAZY.values()})
+)
+
+
+def test_import_does_not_load_lazy_modules():
+    code = (
+        "import sys, case_conversion; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
+
+
+@pytest.mark.parametrize("name", sorted(case_conversion._LAZY))
+def test_lazy_attributes(name):
+    assert name in dir(case_conversion)
+    assert getattr(case_conversion, name) is not None
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        case_conversion.no_such_attribute
@@ -0,0 +1,319 @@
+import asyncio
+import io
+import json
+import threading
+from wsgiref.util import setup_testing_defaults
+
+import pytest
+
+from case_conversion import cache_scope, camel, set_acronyms, snake
+from case_conversion.middleware import (
+    ASGIMiddleware,
+    KeyCache,
+    WSGIMiddleware,
+    shared_key_cache,
+)
+
+PAYLOAD = {"userId": 1, "orderItems": [{"itemName": "a"}]}
+SNAKE_PAYLOAD = {"user_id": 1, "order_items": [{"item_name": "a"}]}
+
+
+def _echo_asgi(content_type=b"application/json", chunks=None):
+    seen = {}
+
+    async def app(scope, receive, send):
+        message = await receive()
+        seen["body"] = message["body"]
+        seen["headers"] = dict(scope["headers"])
+        body = json.dumps(json.loads(message["body"])).encode()
+        parts = chunks(body) if chunks else [body]
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", content_type),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        for i, part in enumerate(parts):
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": part,
+                    "more_body": i < len(parts) - 1,
+                }
+            )
+
+    return app, seen
+
+
+def _call_asgi(app, body, content_type=b"application/json", split=False):
+    sent = []
+    parts = [body[:5], body[5:]] if split else [body]
+    messages = [
+        {"type": "http.request", "body": part, "more_body": i < len(parts) - 1}
+        for i, part in enumerate(parts)
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "headers": [
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    }
+    asyncio.run(app(scope, receive, send))
+    start = sent[0]
+    body = b"".join(m.get("body", b"") for m in sent[1:])
+    return start, body
+
+
+@pytest.mark.parametrize("offload_threshold", (None, 1))
+@pytest.mark.parametrize("split", (False, True))
+def test_asgi_converts_request_and_response(offload_threshold, split):
+    app, seen = _echo_asgi(chunks=lambda b: [b[:3], b[3:]])
+    middleware = ASGIMiddleware(app, snake, camel, offload_threshold=offload_threshold)
+    body = json.dumps(PAYLOAD).encode()
+    start, response = _call_asgi(middleware, body, split=split)
+    assert json.loads(seen["body"]) == SNAKE_PAYLOAD
+    assert seen["headers"][b"content-length"] == str(len(seen["body"])).encode()
+    assert json.loads(response) == PAYLOAD
+    assert dict(start["headers"])[b"content-length"] == str(len(response)).encode()
+
+
+@pytest.mark.parametrize("offload_threshold", (None, 1))
+def test_asgi_honors_cache_scope(offload_threshold):
+    app, seen = _echo_asgi()
+    middleware = ASGIMiddleware(app, None, camel, offload_threshold=offload_threshold)
+    with cache_scope(acronyms=["ID"]):
+        _, response = _call_asgi(middleware, b'{"user_id": 1}')
+    assert response == b'{"userID":1}'
+
+
+def test_asgi_skips_other_content_types():
+    app, seen = _echo_asgi(content_type=b"text/plain")
+    middleware = ASGIMiddleware(app, snake, camel, content_types=["application/json"])
+    body = json.dumps(PAYLOAD).encode()
+    _, response = _call_asgi(middleware, body, content_type=b"text/plain")
+    assert seen["body"] == body
+    assert response == body
+
+
+def test_asgi_passes_large_bodies_through():
+    app, seen = _echo_asgi(chunks=lambda b: [b[:3], b[3:]])
+    middleware = ASGIMiddleware(app, snake, camel, max_body_size=10)
+    body = json.dumps(SNAKE_PAYLOAD).encode()
+    _, response = _call_asgi(middleware, body)
+    assert seen["body"] == body
+    assert json.loads(response) == SNAKE_PAYLOAD
+
+
+def test_asgi_media_type_parameters():
+    app, seen = _echo_asgi(content_type=b"application/json; charset=utf-8")
+    middleware = ASGIMiddleware(app, snake, camel)
+    body = json.dumps(PAYLOAD).encode()
+    _, response = _call_asgi(middleware, body, b"Application/JSON; charset=utf-8")
+    assert json.loads(seen["body"]) == SNAKE_PAYLOAD
+    assert json.loads(response) == PAYLOAD
+
+
+def _wsgi_app(content_type="application/json", generator=False, use_write=False):
+    seen = {}
+
+    def app(environ, start_response):
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        seen["body"] = environ["wsgi.input"].read(length)
+        body = json.dumps(json.loads(seen["body"])).encode()
+        headers = [("Content-Type", content_type), ("Content-Length", str(len(body)))]
+        if generator:
+
+            def chunks():
+                start_response("200 OK", headers)
+                yield body[:3]
+                yield body[3:]
+
+            return chunks()
+        write = start_response("200 OK", headers)
+        if use_write:
+            write(body[:3])
+            return [body[3:]]
+        return [body[:3], body[3:]]
+
+    return app, seen
+
+
+def _call_wsgi(app, body, content_type="application/json"):
+    environ = {}
+    setup_testing_defaults(environ)
+    environ.update(
+        CONTENT_TYPE=content_type,
+        CONTENT_LENGTH=str(len(body)),
+        REQUEST_METHOD="POST",
+    )
+    environ["wsgi.input"] = io.BytesIO(body)
+    started = []
+    result = app(
+        environ, lambda status, headers, exc_info=None: started.append(headers)
+    )
+    response = b"".join(result)
+    getattr(result, "close", lambda: None)()
+    return dict(started[0]), response
+
+
+@pytest.mark.parametrize(
+    "generator,use_write", ((False, False), (True, False), (False, True))
+)
+def test_wsgi_converts_request_and_response(generator, use_write):
+    app, seen = _wsgi_app(generator=generator, use_write=use_write)
+    middleware = WSGIMiddleware(app, snake, camel)
+    headers, response = _call_wsgi(middleware, json.dumps(PAYLOAD).encode())
+    assert json.loads(seen["body"]) == SNAKE_PAYLOAD
+    assert json.loads(response) == PAYLOAD
+    assert headers["Content-Length"] == str(len(response))
+
+
+@pytest.mark.parametrize("generator", (False, True))
+def test_wsgi_streams_other_content_types(generator):
+    app, seen = _wsgi_app(content_type="text/plain", generator=generator)
+    middleware = WSGIMiddleware(app, snake, camel)
+    body = json.dumps(PAYLOAD).encode()
+    _, response = _call_wsgi(middleware, body, content_type="text/plain")
+    assert seen["body"] == body
+    assert response == body
+
+
+def test_wsgi_invalid_json_unchanged():
+    def app(environ, start_response):
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [b"{not json"]
+
+    _, response = _call_wsgi(WSGIMiddleware(app, None, camel), b"")
+    assert response == b"{not json"
+
+
+def test_shared_key_cache():
+    assert shared_key_cache(camel) is shared_key_cache(camel)
+    assert shared_key_cache(camel, ["ID"]) is not shared_key_cache(camel)
+
+
+def test_key_cache_follows_registry():
+    keys = KeyCache(camel)
+    try:
+        assert keys.convert_body(b'{"user_id": 1}') == b'{"userId":1}'
+        set_acronyms(["ID"])
+        assert keys.convert_body(b'{"user_id": 1}') == b'{"userID":1}'
+    finally:
+        set_acronyms([])
+
+
+def test_key_cache_separates_interleaved_scopes():
+    keys = KeyCache(camel)
+    barrier = threading.Barrier(2)
+    results = {}
+
+    def tenant(name, acronyms):
+        seen = []
+        with cache_scope(acronyms=acronyms):
+            for _ in range(20):
+                barrier.wait()
+                seen.append(keys.convert_body(b'{"user_id": 1}'))
+        results[name] = set(seen)
+
+    threads = [
+        threading.Thread(target=tenant, args=("id", ["ID"])),
+        threading.Thread(target=tenant, args=("none", [])),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {"id": {b'{"userID":1}'}, "none": {b'{"userId":1}'}}
+    assert keys.convert_body(b'{"user_id": 1}') == b'{"userId":1}'
+
+
+def _streaming_receive(parts, log):
+    messages = [
+        {"type": "http.request", "body": part, "more_body": i < len(parts) - 1}
+        for i, part in enumerate(parts)
+    ]
+
+    async def receive():
+        log.append("receive")
+        return messages.pop(0)
+
+    return receive
+
+
+@pytest.mark.parametrize("declared", (False, True))
+def test_asgi_stops_reading_large_requests(declared):
+    parts = [b'{"user_id":', b' "0123456789"', b"}"]
+    body = b"".join(parts)
+    log = []
+
+    async def app(scope, receive, send):
+        log.append("app")
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message["body"])
+            if not message["more_body"]:
+                break
+        log.append(b"".join(chunks))
+
+    headers = [(b"content-type", b"application/json")]
+    if declared:
+        headers.append((b"content-length", str(len(body)).encode()))
+    middleware = ASGIMiddleware(app, snake, None, max_body_size=15)
+    scope = {"type": "http", "headers": headers}
+    asyncio.run(middleware(scope, _streaming_receive(parts, log), None))
+    reads_before_app = log.index("app")
+    assert reads_before_app == (0 if declared else 2)
+    assert log[-1] == body
+
+
+def test_asgi_passes_declared_large_responses_through():
+    app, _ = _echo_asgi(chunks=lambda b: [b[:3], b[3:]])
+    middleware = ASGIMiddleware(app, None, camel, max_body_size=10)
+    body = json.dumps(SNAKE_PAYLOAD).encode()
+    start, response = _call_asgi(middleware, body)
+    assert response == json.dumps(SNAKE_PAYLOAD).encode()
+
+
+def test_wsgi_streams_large_responses():
+    produced = []
+
+    def app(environ, start_response):
+        start_response("200 OK", [("Content-Type", "application/json")])
+        for chunk in (b'{"user_id":', b' "0123456789"', b"}"):
+            produced.append(chunk)
+            yield chunk
+
+    middleware = WSGIMiddleware(app, None, camel, max_body_size=15)
+    environ = {}
+    setup_testing_defaults(environ)
+    result = middleware(environ, lambda status, headers, exc_info=None: None)
+    assert len(produced) == 2
+    assert b"".join(result) == b'{"user_id": "0123456789"}'
+    result.close()
+
+
+def test_deeply_nested_bodies_pass_through():
+    body = b'{"user_id":' * 100000 + b"1" + b"}" * 100000
+    assert KeyCache(camel).convert_body(body) is None
+    seen = {}
+
+    def app(environ, start_response):
+        seen["body"] = environ["wsgi.input"].read()
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [b""]
+
+    _call_wsgi(WSGIMiddleware(app, snake, None), body)
+    assert seen["body"] == body
@@ -0,0 +1,107 @@
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+
+from case_conversion import camel, field_converter, snake
+
+
+@dataclass
+class User:
+    user_id: int
+    display_name: str
+    profile_html: str = ""
+    tag_list: List[str] = field(default_factory=list)
+    internal_state: int = field(default=0, init=False)
+
+
+class Point:
+    __slots__ = ("x_pos",)
+
+
+class Point3D(Point):
+    __slots__ = ("y_pos", "z_pos")
+
+
+def test_dataclass_roundtrip():
+    converter = field_converter(User, camel, ["HTML"])
+    assert converter.names["profile_html"] == "profileHTML"
+    user = User(1, "Jo", "http://x", ["a"])
+    data = converter.to_dict(user)
+    assert data == {
+        "userId": 1,
+        "displayName": "Jo",
+        "profileHTML": "http://x",
+        "tagList": ["a"],
+        "internalState": 0,
+    }
+    assert converter.from_dict(data) == user
+
+
+def test_dataclass_from_dict_uses_defaults():
+    user = field_converter(User, camel).from_dict({"userId": 2, "displayName": "x"})
+    assert user == User(2, "x")
+
+
+def test_dataclass_from_dict_requires_fields():
+    with pytest.raises(KeyError):
+        field_converter(User, camel).from_dict({"userId": 2})
+
+
+def test_slots_roundtrip():
+    converter = field_converter(Point3D, camel)
+    point = Point3D()
+    point.x_pos, point.y_pos, point.z_pos = 1, 2, 3
+    data = converter.to_dict(point)
+    assert data == {"xPos": 1, "yPos": 2, "zPos": 3}
+    restored = converter.from_dict(data)
+    assert (restored.x_pos, restored.y_pos, restored.z_pos) == (1, 2, 3)
+
+
+def test_slots_private_names():
+    class Secret(Point):
+        __slots__ = ("__token", "user_id")
+
+    class Child(Secret):
+        __slots__ = ("__pin",)
+
+    converter = field_converter(Child, camel)
+    assert converter.names == {
+        "x_pos": "xPos",
+        "_Secret__token": "token",
+        "user_id": "userId",
+        "_Child__pin": "pin",
+    }
+    child = Child()
+    child.x_pos, child._Secret__token, child.user_id, child._Child__pin = 1, 2, 3, 4
+    data = converter.to_dict(child)
+    assert data == {"xPos": 1, "token": 2, "userId": 3, "pin": 4}
+    assert converter.from_dict(data)._Secret__token == 2
+
+
+def test_slots_to_dict_skips_unset_slots():
+    converter = field_converter(Point3D, camel)
+    point = Point3D()
+    point.y_pos = 2
+    assert converter.to_dict(point) == {"yPos": 2}
+    assert not hasattr(converter.from_dict({"yPos": 2}), "x_pos")
+
+
+def test_field_converter_is_cached_per_style():
+    assert field_converter(User, camel) is field_converter(User, camel)
+    assert field_converter(User, camel) is not field_converter(User, snake)
+
+
+def test_field_converter_rejects_plain_classes():
+    with pytest.raises(TypeError):
+        field_converter(object, camel)
+
+
+def test_field_converter_rejects_colliding_names():
+    @dataclass
+    class Clash:
+        user_id: int
+        userId: int
+
+    with pytest.raises(ValueError):
+        field_converter(Clash, camel)
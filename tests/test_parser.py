@@ -1,6 +1,6 @@
 import pytest
 
-from case_conversion import Case, parse_case
+from case_conversion import Case, http_header, parse_case, snake
 
 
 @pytest.mark.parametrize(
@@ -14,3 +14,24 @@ from case_conversion import Case, parse_case
 )
 def test_parse_case(string, acronyms, preserve_case, expected):
     assert parse_case(string, acronyms, preserve_case) == expected
+
+
+@pytest.mark.parametrize(
+    "string,normalize,expected",
+    (
+        # Decomposed combining marks are separators unless normalized.
+        ("fo\u0301oBar", None, (["Fo", "O", "Bar"], Case.MIXED, "\u0301")),
+        ("fo\u0301oBar", "NFC", (["Fóo", "Bar"], Case.CAMEL, "")),
+        ("fóoBar", "NFC", (["Fóo", "Bar"], Case.CAMEL, "")),
+        ("\ufb01leName", "NFKC", (["File", "Name"], Case.CAMEL, "")),
+    ),
+)
+def test_parse_case_normalize(string, normalize, expected):
+    assert parse_case(string, normalize=normalize) == expected
+
+
+def test_converters_normalize():
+    assert snake("fo\u0301oBar", normalize="NFC") == "fóo_bar"
+    assert http_header("fo\u0301o-bar", normalize="NFC") == "Fóo-Bar"
+    with pytest.raises(ValueError):
+        http_header("foo-bar", normalize="NFD")
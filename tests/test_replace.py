@@ -0,0 +1,60 @@
+import io
+
+import pytest
+
+from case_conversion import replace_identifiers, snake
+
+SQL = "SELECT userId, orderItems.itemName FROM orderItems WHERE userId = 1"
+SQL_SNAKE = "select user_id, order_items.item_name from order_items where user_id = 1"
+
+
+@pytest.mark.parametrize(
+    "text,style,pattern,acronyms,expected",
+    (
+        ("", "snake", None, None, ""),
+        (SQL, "snake", None, None, SQL_SNAKE),
+        (SQL, snake, None, None, SQL_SNAKE),
+        (
+            "{{ userName }} {{ x }}",
+            "const",
+            r"[a-z]\w*",
+            None,
+            "{{ USER_NAME }} {{ X }}",
+        ),
+        ("fooHTTPBar + 2", "dash", None, ["HTTP"], "foo-http-bar + 2"),
+        ("user_id: 1", "camel", None, None, "userId: 1"),
+    ),
+)
+def test_replace_identifiers(text, style, pattern, acronyms, expected):
+    assert replace_identifiers(text, style, pattern, acronyms) == expected
+
+
+def test_replace_identifiers_converts_each_identifier_once():
+    calls = []
+
+    def converter(text, acronyms=None):
+        calls.append(text)
+        return text.upper()
+
+    assert replace_identifiers("a b a b a", converter) == "A B A B A"
+    assert calls == ["a", "b"]
+
+
+@pytest.mark.parametrize("chunk_size", (1, 2, 3, 5, 7, 64))
+def test_replace_identifiers_stream_across_chunks(chunk_size):
+    chunks = [SQL[i : i + chunk_size] for i in range(0, len(SQL), chunk_size)]
+    assert "".join(replace_identifiers(iter(chunks), "snake")) == SQL_SNAKE
+
+
+def test_replace_identifiers_file(monkeypatch):
+    from case_conversion import replace
+
+    monkeypatch.setattr(replace, "_CHUNK_SIZE", 4)
+    result = replace_identifiers(io.StringIO(SQL), "snake")
+    assert not isinstance(result, str)
+    assert "".join(result) == SQL_SNAKE
+
+
+def test_replace_identifiers_unknown_style():
+    with pytest.raises(ValueError):
+        replace_identifiers("foo", "no_such_style")
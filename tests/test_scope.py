@@ -0,0 +1,138 @@
+import asyncio
+import threading
+
+import pytest
+
+from case_conversion import (
+    InvalidAcronymError,
+    cache_scope,
+    canonical_key,
+    clear_cache,
+    get_acronyms,
+    pascal,
+    set_acronyms,
+    snake,
+)
+from case_conversion.cache import _default_cache, get_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_registry():
+    set_acronyms([])
+    clear_cache()
+    yield
+    set_acronyms([])
+
+
+def test_scope_cache_and_acronyms():
+    with cache_scope(maxsize=64, acronyms=["http"]) as scope:
+        assert get_cache() is scope.cache
+        assert get_acronyms() is scope.acronyms
+        assert scope.acronyms.acronyms == ("HTTP",)
+        assert scope.acronyms.version < 0
+        assert pascal("http_server") == "HTTPServer"
+        assert pascal("http_server", []) == "HttpServer"
+        assert len(scope.cache) == 2
+    assert len(_default_cache) == 0
+    assert len(scope.cache) == 0
+    assert get_cache() is _default_cache
+    assert pascal("http_server") == "HttpServer"
+
+
+def test_scope_inherits_registry():
+    set_acronyms(["HTTP"])
+    with cache_scope() as scope:
+        assert scope.acronyms is None
+        assert pascal("http_server") == "HTTPServer"
+        assert len(scope.cache) == 1
+    assert len(_default_cache) == 0
+
+
+def test_scope_overrides_registry_changes():
+    with cache_scope(acronyms=["ID"]):
+        set_acronyms(["HTTP"])
+        assert pascal("http_id") == "HttpID"
+    assert pascal("http_id") == "HTTPId"
+
+
+def test_nested_scopes():
+    with cache_scope(acronyms=["HTTP"]) as outer:
+        with cache_scope(maxsize=8) as inner:
+            assert get_cache() is inner.cache
+            assert pascal("http_server") == "HTTPServer"
+            with cache_scope(acronyms=[]):
+                assert pascal("http_server") == "HttpServer"
+            assert get_acronyms() is outer.acronyms
+        assert get_cache() is outer.cache
+
+
+def test_scoped_versions_are_distinct():
+    with cache_scope(acronyms=["AB", "CD"]) as first:
+        assert canonical_key("fooABCD") == "foo_ab_cd"
+    with cache_scope(acronyms=[]) as second:
+        assert canonical_key("fooABCD") == "foo_abcd"
+    assert first.acronyms.version != second.acronyms.version
+
+
+def test_scope_disabled_cache():
+    with cache_scope(maxsize=0) as scope:
+        assert snake("fooBar") == "foo_bar"
+        assert len(scope.cache) == 0
+
+
+def test_scope_invalid_acronyms():
+    with pytest.raises(InvalidAcronymError):
+        with cache_scope(acronyms=["HT TP"]):
+            pass
+    assert get_cache() is _default_cache
+
+
+def test_scope_restored_on_error():
+    with pytest.raises(RuntimeError):
+        with cache_scope(acronyms=["HTTP"]):
+            raise RuntimeError
+    assert get_cache() is _default_cache
+    assert get_acronyms().version >= 0
+
+
+def test_scopes_isolate_tasks():
+    async def tenant(acronyms, ready):
+        with cache_scope(maxsize=16, acronyms=acronyms) as scope:
+            await ready.wait()
+            return pascal("http_id"), len(scope.cache), get_cache() is scope.cache
+
+    async def main():
+        ready = asyncio.Event()
+        tasks = [
+            asyncio.ensure_future(tenant(acronyms, ready))
+            for acronyms in (["HTTP"], ["ID"], [])
+        ]
+        await asyncio.sleep(0)
+        ready.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(main()) == [
+        ("HTTPId", 1, True),
+        ("HttpID", 1, True),
+        ("HttpId", 1, True),
+    ]
+    assert len(_default_cache) == 0
+
+
+def test_scopes_isolate_threads():
+    barrier = threading.Barrier(2)
+    results = {}
+
+    def tenant(acronyms):
+        with cache_scope(acronyms=acronyms):
+            barrier.wait()
+            results[acronyms[0]] = pascal("http_id")
+            barrier.wait()
+
+    threads = [threading.Thread(target=tenant, args=(a,)) for a in (["HTTP"], ["ID"])]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {"HTTP": "HTTPId", "ID": "HttpID"}
+    assert len(_default_cache) == 0
@@ -0,0 +1,78 @@
+import pytest
+
+from case_conversion import BoundaryRules, http_header, parse_case, snake
+from case_conversion.segmenter import compile_segmenter, fast_segment_string
+
+DIGITS = BoundaryRules(digit_boundaries=True)
+
+
+@pytest.mark.parametrize(
+    "rules,string,expected",
+    (
+        (DIGITS, "utf8Decoder", (["utf", "8", "Decoder"], "", False)),
+        (DIGITS, "v2API", (["v", "2", "A", "P", "I"], "", False)),
+        (DIGITS, "UTF8_X", (["utf", "8", None, "x"], "_", True)),
+        (DIGITS, "a12b", (["a", "12", "b"], "", False)),
+        (BoundaryRules(separators="X"), "aXb", (["a", None, "b"], "X", False)),
+        (BoundaryRules(separators="X"), "AXB", (["a", None, "b"], "x", True)),
+        (BoundaryRules(separators="X"), "axb", (["axb"], "", False)),
+        (BoundaryRules(separators="x"), "AXB", (["axb"], "", True)),
+        (BoundaryRules(separators="x"), "fooxbar", (["foo", None, "bar"], "x", False)),
+        (BoundaryRules(separators="É"), "CAFÉS", (["caf", None, "s"], "é", True)),
+        (BoundaryRules(keep="'"), "DON'T_STOP", (["don't", None, "stop"], "_", True)),
+        (
+            BoundaryRules(separators="x", keep="X"),
+            "FOOXBAR",
+            (["fooxbar"], "", True),
+        ),
+        (BoundaryRules(keep="'"), "don't_stop", (["don't", None, "stop"], "_", False)),
+        (
+            BoundaryRules(keep="_"),
+            "foo_bar-baz",
+            (["foo_bar", None, "baz"], "-", False),
+        ),
+    ),
+)
+def test_compile_segmenter(rules, string, expected):
+    assert compile_segmenter(rules)(string) == expected
+
+
+@pytest.mark.parametrize(
+    "string", ("", "helloHTTPWorld", "hello_world-2", "UTF8", "ÉtéΣσ")
+)
+def test_default_rules_match_fast_segmenter(string):
+    assert compile_segmenter(BoundaryRules())(string) == fast_segment_string(string)
+
+
+def test_compile_segmenter_is_memoized():
+    assert compile_segmenter(BoundaryRules(True)) is compile_segmenter(DIGITS)
+    assert compile_segmenter.cache_info().maxsize is not None
+
+
+def test_compile_segmenter_rejects_overlap():
+    with pytest.raises(ValueError):
+        compile_segmenter(BoundaryRules(separators="'", keep="'"))
+
+
+def test_parse_case_caches_rules_apart():
+    assert parse_case("utf8Decoder")[0] == ["Utf8", "Decoder"]
+    assert parse_case("utf8Decoder", engine=DIGITS)[0] == ["Utf", "8", "Decoder"]
+    assert parse_case("utf8Decoder")[0] == ["Utf8", "Decoder"]
+
+
+@pytest.mark.parametrize(
+    "text,acronyms,rules,expected",
+    (
+        ("utf8Decoder", None, DIGITS, "utf_8_decoder"),
+        ("v2APIClient", ["API"], DIGITS, "v_2_api_client"),
+        ("don't-stop", None, BoundaryRules(keep="'"), "don't_stop"),
+        ("fooXbar", None, BoundaryRules(separators="X"), "foo_bar"),
+        ("FOOXBAR", None, BoundaryRules(separators="X"), "foo_bar"),
+    ),
+)
+def test_converters_accept_rules(text, acronyms, rules, expected):
+    assert snake(text, acronyms, engine=rules) == expected
+
+
+def test_http_header_skips_fast_path_with_rules():
+    assert http_header("x-utf8", engine=DIGITS) == "X-Utf-8"
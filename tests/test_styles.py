@@ -0,0 +1,106 @@
+import pytest
+
+import case_conversion
+from case_conversion import Style, convert, get_style, register_style, styles
+from case_conversion.styles import compile_formatter, style_of
+
+
+@pytest.fixture
+def unregister():
+    names = set(styles._registry)
+    yield
+    for name in set(styles._registry) - names:
+        _, converter = styles._registry.pop(name)
+        del styles._by_converter[converter]
+
+
+BUILTINS = [
+    "camel",
+    "pascal",
+    "snake",
+    "dash",
+    "const",
+    "dot",
+    "separate_words",
+    "slash",
+    "backslash",
+    "ada",
+    "http_header",
+]
+
+
+@pytest.mark.parametrize("name", BUILTINS)
+def test_builtin_styles_registered(name):
+    converter = getattr(case_conversion, name)
+    assert get_style(name).name == name
+    assert style_of(converter).style == get_style(name)
+    assert convert("fooHTTPBarString", name, ["HTTP"]) == converter(
+        "fooHTTPBarString", ["HTTP"]
+    )
+
+
+@pytest.mark.parametrize(
+    "style,words,acronyms,expected",
+    (
+        (Style("a"), [], frozenset(), ""),
+        (Style("b", "-", "lower", "upper"), ["Foo", "Bar"], frozenset(), "foo-BAR"),
+        (Style("c", "-", "lower", "upper"), ["Foo"], frozenset(), "foo"),
+        (Style("d", "_", prefix="__", suffix="__"), ["Foo"], frozenset(), "__Foo__"),
+        (Style("e", "_", prefix="__", suffix="__"), [], frozenset(), ""),
+        (
+            Style("f", "-", "capitalize", "capitalize", "upper"),
+            ["Foo", "Http"],
+            frozenset(["HTTP"]),
+            "Foo-HTTP",
+        ),
+        (
+            Style("g", "", "lower", "keep", "lower"),
+            ["Http", "Foo"],
+            frozenset(["HTTP"]),
+            "httpFoo",
+        ),
+    ),
+)
+def test_compile_formatter(style, words, acronyms, expected):
+    assert compile_formatter(style)(words, acronyms) == expected
+
+
+def test_compile_formatter_binary():
+    formatter = compile_formatter(Style("x", "-", "lower", "lower"), binary=True)
+    assert formatter([b"Foo", b"Bar"]) == b"foo-bar"
+
+
+def test_compile_formatter_rejects_unknown_rule():
+    with pytest.raises(ValueError):
+        compile_formatter(Style("x", first_word="shout"))
+
+
+def test_register_style(unregister):
+    style = Style("test_train", "-", "capitalize", "capitalize", "upper")
+    train = register_style(style)
+    assert train("fooHttpBar", ["HTTP"]) == "Foo-HTTP-Bar"
+    assert train("foo_bar") == "Foo-Bar"
+    assert convert("foo_bar", "test_train") == "Foo-Bar"
+    assert case_conversion.convert_bytes(b"foo_bar", train) == b"Foo-Bar"
+
+
+def test_register_style_preserve(unregister):
+    keep = register_style(Style("test_preserve", ".", "preserve", "preserve"))
+    assert keep("fooBarBaz") == "foo.Bar.Baz"
+
+
+def test_register_style_rejects_duplicates():
+    with pytest.raises(ValueError):
+        register_style(Style("snake", "_", "lower", "lower"))
+
+
+def test_unknown_style():
+    with pytest.raises(ValueError):
+        convert("foo", "no_such_style")
+    with pytest.raises(ValueError):
+        get_style("no_such_style")
+
+
+def test_register_style_rejects_unknown_rule(unregister):
+    with pytest.raises(ValueError):
+        register_style(Style("test_unknown_rule", other_words="shout"))
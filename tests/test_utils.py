@@ -94,3 +94,28 @@ def test_normalize_words(words, acronyms, expected):
 )
 def test_determine_case(was_upper, words, string, expected):
     assert utils.determine_case(was_upper, words, string) == expected
+
+
+@pytest.mark.parametrize(
+    "string,form,expected",
+    (
+        ("foo_bar", "NFC", "foo_bar"),
+        ("fo\u0301o_bar", "NFC", "fóo_bar"),
+        ("fóo_bar", "NFC", "fóo_bar"),
+        ("\ufb01le_name", "NFC", "\ufb01le_name"),
+        ("\ufb01le_name", "NFKC", "file_name"),
+    ),
+)
+def test_normalize_unicode(string, form, expected):
+    assert utils.normalize_unicode(string, form) == expected
+
+
+def test_normalize_unicode_returns_normalized_input_unchanged():
+    string = "fóo_bar"
+    assert utils.normalize_unicode(string, "NFC") is string
+
+
+@pytest.mark.parametrize("form", ("NFD", "nfc", ""))
+def test_normalize_unicode_rejects_unsupported_forms(form):
+    with pytest.raises(ValueError):
+        utils.normalize_unicode("foo", form)
@@ -0,0 +1,103 @@
+import pytest
+
+from case_conversion import StyleView, camel, convert_keys, snake
+from case_conversion.views import _SequenceView
+
+PAYLOAD = {
+    "user_id": 1,
+    "user_name": "a",
+    "order_items": [{"item_name": "b"}, ({"unit_price": 2},)],
+    3: "three",
+}
+
+
+class Counting:
+    def __init__(self, converter):
+        self.converter = converter
+        self.calls = 0
+
+    def __call__(self, text, acronyms=None):
+        self.calls += 1
+        return self.converter(text, acronyms)
+
+
+def _materialize(value):
+    if isinstance(value, StyleView):
+        return {k: _materialize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, _SequenceView)):
+        return [_materialize(v) for v in value]
+    return value
+
+
+def test_view_presents_converted_keys():
+    view = StyleView(PAYLOAD, camel)
+    assert list(view) == ["userId", "userName", "orderItems", 3]
+    assert len(view) == 4
+    assert view[3] == "three"
+    assert view["orderItems"][0]["itemName"] == "b"
+    assert view["orderItems"][-1][0]["unitPrice"] == 2
+    assert view["orderItems"][:1][0]["itemName"] == "b"
+
+
+def test_view_matches_convert_keys():
+    expected = convert_keys(PAYLOAD, camel)
+    expected["orderItems"] = [expected["orderItems"][0], [expected["orderItems"][1][0]]]
+    assert _materialize(StyleView(PAYLOAD, camel)) == expected
+
+
+def test_lookup_with_source_converts_one_key():
+    converter = Counting(camel)
+    view = StyleView(PAYLOAD, converter, source=snake)
+    assert view["userName"] == "a"
+    assert converter.calls == 1
+    assert view["userName"] == "a"
+    assert converter.calls == 1
+
+
+def test_lookup_without_source_stops_at_match():
+    converter = Counting(camel)
+    view = StyleView(PAYLOAD, converter)
+    assert view["userName"] == "a"
+    assert converter.calls == 2
+
+
+def test_missing_keys_scan_once():
+    converter = Counting(camel)
+    view = StyleView(PAYLOAD, converter)
+    assert "user_id" not in view
+    calls = converter.calls
+    with pytest.raises(KeyError):
+        view["missing"]
+    assert "userId" in view
+    assert converter.calls == calls
+
+
+def test_sequence_view_index_out_of_range():
+    items = StyleView(PAYLOAD, camel)["orderItems"]
+    assert items[-2]["itemName"] == "b"
+    for index in (-3, 2):
+        with pytest.raises(IndexError):
+            items[index]
+
+
+def test_views_equal_the_converted_payload():
+    view = StyleView(PAYLOAD, camel)
+    assert view == convert_keys(PAYLOAD, camel)
+    assert view["orderItems"] == [{"itemName": "b"}, ({"unitPrice": 2},)]
+    assert view["orderItems"][1] == ({"unitPrice": 2},)
+    assert view["orderItems"][1] != [{"unitPrice": 2}]
+    assert view["orderItems"] == StyleView(PAYLOAD, camel)["orderItems"]
+    assert StyleView({"a_b": [1]}, camel) == {"aB": [1]}
+    assert StyleView({"a_b": [1]}, camel) != {"aB": [2]}
+
+
+def test_nested_views_are_memoized():
+    view = StyleView(PAYLOAD, camel)
+    assert view["orderItems"] is view["orderItems"]
+    assert view["orderItems"][0] is view["orderItems"][0]
+
+
+def test_colliding_keys():
+    view = StyleView({"user_id": 1, "userId": 2}, camel)
+    with pytest.raises(ValueError):
+        list(view)